@@ -0,0 +1,46 @@
+"""Add answer key and question outcomes
+
+Revision ID: 3f8b5d2e7a61
+Revises: e4a1c7f3b952
+Create Date: 2026-10-17 14:05:27.391846
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8b5d2e7a61'
+down_revision: Union[str, Sequence[str], None] = 'e4a1c7f3b952'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tests', sa.Column('answer_key', sa.JSON(), nullable=True))
+    op.create_table('question_outcomes',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('test_result_id', sa.Integer(), nullable=False),
+    sa.Column('question_id', sa.Integer(), nullable=False),
+    sa.Column('word_id', sa.Integer(), nullable=True),
+    sa.Column('is_correct', sa.Boolean(), nullable=False),
+    sa.Column('given_answer', sa.String(), nullable=True),
+    sa.ForeignKeyConstraint(['test_result_id'], ['test_results.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['word_id'], ['words.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_question_outcomes_id'), 'question_outcomes', ['id'], unique=False)
+    op.create_index(op.f('ix_question_outcomes_test_result_id'), 'question_outcomes', ['test_result_id'], unique=False)
+    op.create_index(op.f('ix_question_outcomes_word_id'), 'question_outcomes', ['word_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_question_outcomes_word_id'), table_name='question_outcomes')
+    op.drop_index(op.f('ix_question_outcomes_test_result_id'), table_name='question_outcomes')
+    op.drop_index(op.f('ix_question_outcomes_id'), table_name='question_outcomes')
+    op.drop_table('question_outcomes')
+    op.drop_column('tests', 'answer_key')
@@ -0,0 +1,47 @@
+"""Add indexes for foreign key hot paths
+
+Revision ID: 5c1e7a9b2d40
+Revises: 01acf6cfb091
+Create Date: 2026-10-17 10:12:41.503117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e7a9b2d40'
+down_revision: Union[str, Sequence[str], None] = '01acf6cfb091'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (인덱스 이름, 테이블, 컬럼)
+# test_results.student_id / test_id 단독 조회는 복합 인덱스의 앞 컬럼으로 처리됩니다.
+INDEXES = [
+    ('ix_words_wordbook_id', 'words', ['wordbook_id']),
+    ('ix_tests_wordbook_id', 'tests', ['wordbook_id']),
+    ('ix_student_wordbook_association_wordbook_id', 'student_wordbook_association', ['wordbook_id']),
+    ('ix_test_results_student_id_submitted_at', 'test_results', ['student_id', 'submitted_at']),
+    ('ix_test_results_test_id_student_id', 'test_results', ['test_id', 'student_id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY는 트랜잭션 안에서 실행할 수 없으므로 autocommit 블록에서 만듭니다.
+    # 운영 중에도 테이블 쓰기를 막지 않습니다.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns, unique=False,
+                postgresql_concurrently=True, if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _columns in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
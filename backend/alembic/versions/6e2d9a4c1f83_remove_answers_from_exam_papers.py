@@ -0,0 +1,53 @@
+"""Remove answers from stored exam papers
+
+Revision ID: 6e2d9a4c1f83
+Revises: f2b7c9e4d158
+Create Date: 2026-10-17 21:05:37.418226
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6e2d9a4c1f83'
+down_revision: Union[str, Sequence[str], None] = 'f2b7c9e4d158'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 시험지는 학생에게 그대로 전달되므로 정답을 지웁니다. 채점은 tests.answer_key로 합니다.
+    op.execute(
+        """
+        UPDATE exam_sessions
+        SET paper = (
+            SELECT coalesce(json_agg((question::jsonb - 'answer')::json ORDER BY position), '[]'::json)
+            FROM json_array_elements(paper) WITH ORDINALITY AS q(question, position)
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 문제 ID가 정답표의 위치이므로 tests.answer_key에서 정답을 되살립니다.
+    op.execute(
+        """
+        UPDATE exam_sessions
+        SET paper = (
+            SELECT coalesce(json_agg(
+                (question::jsonb || jsonb_build_object(
+                    'answer', tests.answer_key -> ((question ->> 'id')::int) ->> 'answer'
+                ))::json
+                ORDER BY position
+            ), '[]'::json)
+            FROM json_array_elements(paper) WITH ORDINALITY AS q(question, position)
+        )
+        FROM tests
+        WHERE tests.id = exam_sessions.test_id
+        """
+    )
@@ -0,0 +1,28 @@
+"""Add user token version
+
+Revision ID: 9c3e5b7a2d41
+Revises: 6e2d9a4c1f83
+Create Date: 2026-10-17 22:14:09.531870
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c3e5b7a2d41'
+down_revision: Union[str, Sequence[str], None] = '6e2d9a4c1f83'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('token_version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'token_version')
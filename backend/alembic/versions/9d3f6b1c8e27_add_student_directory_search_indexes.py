@@ -0,0 +1,45 @@
+"""Add student directory search indexes
+
+Revision ID: 9d3f6b1c8e27
+Revises: 5c1e7a9b2d40
+Create Date: 2026-10-17 11:03:18.227540
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d3f6b1c8e27'
+down_revision: Union[str, Sequence[str], None] = '5c1e7a9b2d40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_role_name_id', 'users', ['role', 'name', 'id'], unique=False,
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            'ix_users_name_trgm', 'users', ['name'], unique=False,
+            postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'},
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            'ix_users_username_trgm', 'users', ['username'], unique=False,
+            postgresql_using='gin', postgresql_ops={'username': 'gin_trgm_ops'},
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name in ('ix_users_username_trgm', 'ix_users_name_trgm', 'ix_users_role_name_id'):
+            op.drop_index(name, table_name='users', postgresql_concurrently=True, if_exists=True)
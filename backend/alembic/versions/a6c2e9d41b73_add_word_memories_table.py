@@ -0,0 +1,42 @@
+"""Add word memories table
+
+Revision ID: a6c2e9d41b73
+Revises: 3f8b5d2e7a61
+Create Date: 2026-10-17 15:21:09.604712
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6c2e9d41b73'
+down_revision: Union[str, Sequence[str], None] = '3f8b5d2e7a61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('word_memories',
+    sa.Column('student_id', sa.Integer(), nullable=False),
+    sa.Column('word_id', sa.Integer(), nullable=False),
+    sa.Column('ease', sa.Float(), nullable=False),
+    sa.Column('interval_days', sa.Float(), nullable=False),
+    sa.Column('repetitions', sa.SmallInteger(), nullable=False),
+    sa.Column('lapses', sa.SmallInteger(), nullable=False),
+    sa.Column('last_reviewed_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('due_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['student_id'], ['users.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['word_id'], ['words.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('student_id', 'word_id')
+    )
+    op.create_index('ix_word_memories_student_id_due_at', 'word_memories', ['student_id', 'due_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_word_memories_student_id_due_at', table_name='word_memories')
+    op.drop_table('word_memories')
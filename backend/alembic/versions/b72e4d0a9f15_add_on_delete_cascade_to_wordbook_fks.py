@@ -0,0 +1,52 @@
+"""Add ON DELETE CASCADE to wordbook foreign keys
+
+Revision ID: b72e4d0a9f15
+Revises: 9d3f6b1c8e27
+Create Date: 2026-10-17 11:48:52.904361
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b72e4d0a9f15'
+down_revision: Union[str, Sequence[str], None] = '9d3f6b1c8e27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (제약 조건 이름, 테이블, 컬럼, 참조 테이블)
+FOREIGN_KEYS = [
+    ('words_wordbook_id_fkey', 'words', 'wordbook_id', 'wordbooks'),
+    ('tests_wordbook_id_fkey', 'tests', 'wordbook_id', 'wordbooks'),
+    ('test_results_test_id_fkey', 'test_results', 'test_id', 'tests'),
+    ('student_wordbook_association_wordbook_id_fkey', 'student_wordbook_association', 'wordbook_id', 'wordbooks'),
+]
+
+
+def _replace_foreign_keys(on_delete: str) -> None:
+    # NOT VALID로 먼저 추가하면 기존 행 검사 없이 짧은 잠금만 잡습니다.
+    for name, table, column, referred in FOREIGN_KEYS:
+        op.execute(f'ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {name}')
+        op.execute(
+            f'ALTER TABLE {table} ADD CONSTRAINT {name} FOREIGN KEY ({column}) '
+            f'REFERENCES {referred} (id){on_delete} NOT VALID'
+        )
+    # 기존 행 검증은 쓰기를 막지 않는 잠금(SHARE UPDATE EXCLUSIVE)으로 따로 수행합니다.
+    # autocommit 블록에 들어가면서 DROP/ADD 트랜잭션이 먼저 커밋되어 ACCESS EXCLUSIVE 잠금이 풀리고,
+    # 검증은 제약 조건마다 별도 트랜잭션으로 실행됩니다.
+    with op.get_context().autocommit_block():
+        for name, table, _column, _referred in FOREIGN_KEYS:
+            op.execute(f'ALTER TABLE {table} VALIDATE CONSTRAINT {name}')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _replace_foreign_keys(' ON DELETE CASCADE')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _replace_foreign_keys('')
@@ -0,0 +1,95 @@
+"""Add score rollup tables
+
+기존 시험 결과는 업그레이드할 때 함께 집계해 채웁니다 (crud._score_rollup_source와 같은 집계).
+나중에 누계를 다시 맞춰야 하면 `python -m app.cli rebuild-score-rollups`를 사용합니다.
+
+Revision ID: c8d1f4a7e392
+Revises: a6c2e9d41b73
+Create Date: 2026-10-17 16:02:44.318520
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8d1f4a7e392'
+down_revision: Union[str, Sequence[str], None] = 'a6c2e9d41b73'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('student_wordbook_scores',
+    sa.Column('student_id', sa.Integer(), nullable=False),
+    sa.Column('wordbook_id', sa.Integer(), nullable=False),
+    sa.Column('result_count', sa.Integer(), nullable=False),
+    sa.Column('score_sum', sa.Float(), nullable=False),
+    sa.Column('score_min', sa.Float(), nullable=False),
+    sa.Column('score_max', sa.Float(), nullable=False),
+    sa.Column('last_score', sa.Float(), nullable=False),
+    sa.Column('last_submitted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['student_id'], ['users.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['wordbook_id'], ['wordbooks.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('student_id', 'wordbook_id')
+    )
+    op.create_index('ix_student_wordbook_scores_wordbook_id', 'student_wordbook_scores', ['wordbook_id'], unique=False)
+    op.create_table('student_daily_scores',
+    sa.Column('student_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('wordbook_id', sa.Integer(), nullable=False),
+    sa.Column('result_count', sa.Integer(), nullable=False),
+    sa.Column('score_sum', sa.Float(), nullable=False),
+    sa.Column('score_min', sa.Float(), nullable=False),
+    sa.Column('score_max', sa.Float(), nullable=False),
+    sa.Column('last_score', sa.Float(), nullable=False),
+    sa.Column('last_submitted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['student_id'], ['users.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['wordbook_id'], ['wordbooks.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('student_id', 'day', 'wordbook_id')
+    )
+    op.create_index('ix_student_daily_scores_wordbook_id', 'student_daily_scores', ['wordbook_id'], unique=False)
+
+    # 기존 시험 결과로 누계를 채웁니다. 마지막 점수는 가장 늦게 제출한(같으면 ID가 큰) 결과의 점수입니다.
+    # 이 리비전에는 users.data_version이 아직 없으므로 (f2b7c9e4d158에서 추가) 버전은 올리지 않습니다.
+    op.execute(
+        """
+        INSERT INTO student_wordbook_scores (
+            student_id, wordbook_id, result_count, score_sum, score_min, score_max, last_score, last_submitted_at
+        )
+        SELECT test_results.student_id, tests.wordbook_id,
+               count(*), sum(test_results.score), min(test_results.score), max(test_results.score),
+               (array_agg(test_results.score ORDER BY test_results.submitted_at DESC NULLS LAST, test_results.id DESC))[1],
+               max(test_results.submitted_at)
+        FROM test_results
+        JOIN tests ON tests.id = test_results.test_id
+        GROUP BY test_results.student_id, tests.wordbook_id
+        """
+    )
+    # 날짜는 DB 세션 시간대 기준으로 나눕니다 (crud._add_score_rollups와 같은 기준).
+    op.execute(
+        """
+        INSERT INTO student_daily_scores (
+            student_id, day, wordbook_id, result_count, score_sum, score_min, score_max, last_score, last_submitted_at
+        )
+        SELECT test_results.student_id, CAST(test_results.submitted_at AS DATE), tests.wordbook_id,
+               count(*), sum(test_results.score), min(test_results.score), max(test_results.score),
+               (array_agg(test_results.score ORDER BY test_results.submitted_at DESC NULLS LAST, test_results.id DESC))[1],
+               max(test_results.submitted_at)
+        FROM test_results
+        JOIN tests ON tests.id = test_results.test_id
+        WHERE test_results.submitted_at IS NOT NULL
+        GROUP BY test_results.student_id, CAST(test_results.submitted_at AS DATE), tests.wordbook_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_student_daily_scores_wordbook_id', table_name='student_daily_scores')
+    op.drop_table('student_daily_scores')
+    op.drop_index('ix_student_wordbook_scores_wordbook_id', table_name='student_wordbook_scores')
+    op.drop_table('student_wordbook_scores')
@@ -0,0 +1,46 @@
+"""Add exam sessions table
+
+Revision ID: e4a1c7f3b952
+Revises: b72e4d0a9f15
+Create Date: 2026-10-17 13:12:40.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a1c7f3b952'
+down_revision: Union[str, Sequence[str], None] = 'b72e4d0a9f15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('exam_sessions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(), nullable=False),
+    sa.Column('wordbook_id', sa.Integer(), nullable=False),
+    sa.Column('test_id', sa.Integer(), nullable=False),
+    sa.Column('owner_id', sa.Integer(), nullable=False),
+    sa.Column('paper', sa.JSON(), nullable=False),
+    sa.Column('shuffle_questions', sa.Boolean(), nullable=False),
+    sa.Column('seed', sa.BigInteger(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['test_id'], ['tests.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['wordbook_id'], ['wordbooks.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_exam_sessions_id'), 'exam_sessions', ['id'], unique=False)
+    op.create_index(op.f('ix_exam_sessions_wordbook_id'), 'exam_sessions', ['wordbook_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_exam_sessions_wordbook_id'), table_name='exam_sessions')
+    op.drop_index(op.f('ix_exam_sessions_id'), table_name='exam_sessions')
+    op.drop_table('exam_sessions')
@@ -0,0 +1,30 @@
+"""Add data version counters
+
+Revision ID: f2b7c9e4d158
+Revises: c8d1f4a7e392
+Create Date: 2026-10-17 16:48:12.905133
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b7c9e4d158'
+down_revision: Union[str, Sequence[str], None] = 'c8d1f4a7e392'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('data_version', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('wordbooks', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('wordbooks', 'version')
+    op.drop_column('users', 'data_version')
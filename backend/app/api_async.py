@@ -0,0 +1,154 @@
+# backend/app/api_async.py
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date
+from typing import List, Literal, Optional
+
+from . import crud_async, http_cache, models, pagination, schemas, security
+from .database import get_async_db
+from .limits import (
+    CLASS_REPORT_PAGE_SIZE,
+    CLASS_REPORT_PAGE_SIZE_MAX,
+    REPORT_RESULTS_MAX,
+    STATS_MAX_POINTS,
+    STATS_MAX_POINTS_MAX,
+    WORDBOOK_PAGE_SIZE,
+    WORDBOOK_PAGE_SIZE_MAX,
+)
+
+# ===================================================================
+# 비동기 모드(DB_ASYNC_MODE) 전용 엔드포인트
+# -------------------------------------------------------------------
+# main.py의 같은 경로 엔드포인트와 동작은 같고, AsyncSession(asyncpg)을 사용합니다.
+# 스레드풀 크기에 묶이지 않도록 조회가 많은 API만 async로 제공합니다.
+# ===================================================================
+router = APIRouter()
+
+STUDENT_LIST_ADAPTER = TypeAdapter(List[schemas.Student])
+
+@router.get("/api/teacher/students/", response_model=List[schemas.Student])
+async def read_all_students(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: schemas.User = Depends(security.get_current_teacher_async)
+):
+    students = await crud_async.get_all_students(db)
+    body = STUDENT_LIST_ADAPTER.dump_json([schemas.Student.model_validate(s) for s in students])
+    return http_cache.json_response_with_etag(request, body)
+
+@router.get("/api/wordbooks/", response_model=List[schemas.WordbookSummary])
+async def read_my_wordbooks(
+    request: Request,
+    response: Response,
+    after: Optional[int] = None,
+    limit: int = Query(WORDBOOK_PAGE_SIZE, ge=1, le=WORDBOOK_PAGE_SIZE_MAX),
+    db: AsyncSession = Depends(security.get_user_async_read_db),
+    current_user: schemas.User = Depends(security.get_current_user_async)
+):
+    if current_user.role != models.UserRole.student:
+        return []
+    version = await crud_async.get_user_data_version(db, current_user.id)
+    etag = http_cache.etag_for_version("wordbooks", current_user.id, version, after, limit)
+    not_modified = http_cache.check_not_modified(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+    wordbooks = await crud_async.get_wordbook_summaries_for_student(
+        db, student_id=current_user.id, after_id=after, limit=limit
+    )
+    if len(wordbooks) == limit:
+        response.headers["X-Next-Cursor"] = str(wordbooks[-1].id)
+    return wordbooks
+
+@router.get("/api/wordbooks/{wordbook_id}", response_model=schemas.Wordbook)
+async def read_wordbook_details(
+    wordbook_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: schemas.User = Depends(security.get_current_user_async)
+):
+    meta = await crud_async.get_wordbook_version_meta(db, wordbook_id=wordbook_id, user_id=current_user.id)
+    security.ensure_wordbook_meta_access(meta, current_user)
+    etag = http_cache.etag_for_version("wordbook", wordbook_id, meta.version)
+    not_modified = http_cache.check_not_modified(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+    db_wordbook = await crud_async.get_wordbook(db, wordbook_id=wordbook_id)
+    return security.ensure_wordbook_access(db_wordbook, current_user)
+
+@router.get("/api/wordbooks/{wordbook_id}/quiz", response_model=List[schemas.PracticeQuestion])
+async def get_quiz_words(
+    wordbook_id: int,
+    db: AsyncSession = Depends(security.get_user_async_read_db),
+    current_user: schemas.User = Depends(security.get_current_user_async)
+):
+    meta = await crud_async.get_wordbook_quiz_meta(db, wordbook_id=wordbook_id, user_id=current_user.id)
+    security.ensure_wordbook_meta_access(meta, current_user, detail="Not enough permissions for this wordbook")
+    if not meta.word_count:
+        return []
+    bank = await crud_async.get_quiz_bank(db, wordbook_id=wordbook_id, version=(meta.word_count, meta.max_word_id))
+    return bank.generate_quiz()
+
+@router.get("/api/students/{student_id}/report", response_model=schemas.StudentReport)
+async def get_student_report_endpoint(
+    student_id: int,
+    request: Request,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=REPORT_RESULTS_MAX),
+    db: AsyncSession = Depends(security.get_user_async_read_db),
+    current_user: schemas.User = Depends(security.get_current_teacher_async)
+):
+    version = await crud_async.get_user_data_version(db, student_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Student not found or no report available.")
+    etag = http_cache.etag_for_version("report", student_id, version, limit)
+    not_modified = http_cache.check_not_modified(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+    report = await crud_async.get_student_report(db, student_id=student_id, limit=limit)
+    if not report:
+        raise HTTPException(status_code=404, detail="Student not found or no report available.")
+    return report
+
+@router.get("/api/teacher/reports", response_model=schemas.ClassReport)
+async def get_class_report_endpoint(
+    request: Request,
+    after: Optional[str] = None,
+    limit: int = Query(CLASS_REPORT_PAGE_SIZE, ge=1, le=CLASS_REPORT_PAGE_SIZE_MAX),
+    db: AsyncSession = Depends(security.get_user_async_read_db),
+    current_user: schemas.User = Depends(security.get_current_teacher_async)
+):
+    cursor = pagination.decode_cursor(after, size=2)
+    report = await crud_async.get_class_report(
+        db, teacher_id=current_user.id, after=tuple(cursor) if cursor else None, limit=limit
+    )
+    headers = {}
+    if len(report.students.id) == limit:
+        headers["X-Next-Cursor"] = pagination.encode_cursor(report.students.name[-1], report.students.id[-1])
+    return http_cache.json_response_with_etag(request, report.model_dump_json().encode(), headers=headers)
+
+@router.get("/api/students/me/stats", response_model=schemas.StudentStats)
+async def get_my_stats(
+    request: Request,
+    response: Response,
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to"),
+    bucket: Literal["day", "week", "month"] = "day",
+    max_points: int = Query(STATS_MAX_POINTS, ge=2, le=STATS_MAX_POINTS_MAX),
+    db: AsyncSession = Depends(security.get_user_async_read_db),
+    current_user: schemas.User = Depends(security.get_current_user_async)
+):
+    if current_user.role != models.UserRole.student:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only students can access their stats.")
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="'from' must not be after 'to'.")
+    version = await crud_async.get_user_data_version(db, current_user.id)
+    etag = http_cache.etag_for_version("stats", current_user.id, version, date_from, date_to, bucket, max_points)
+    not_modified = http_cache.check_not_modified(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+    return await crud_async.get_student_stats(
+        db, student_id=current_user.id, date_from=date_from, date_to=date_to, bucket=bucket, max_points=max_points
+    )
@@ -0,0 +1,329 @@
+# backend/app/cache.py
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, List, Optional, Tuple
+
+from .config import settings
+from . import schemas
+from .leaderboard import LeaderboardEntry, TopK
+from .quiz import ExamPaper, QuizBank
+
+
+def token_digest(token: str) -> str:
+    """토큰 원문 대신 캐시 키로 사용할 SHA-256 다이제스트를 계산합니다."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class PrincipalCache:
+    """
+    토큰 다이제스트를 키로, 디코딩된 클레임과 가벼운 사용자 스냅샷(schemas.User)을
+    보관하는 TTL + LRU 캐시입니다.
+
+    캐시는 워커 프로세스마다 독립적으로 존재합니다. 사용자 삭제/비밀번호 변경 시
+    invalidate_user()로 해당 사용자의 항목을 지우고, 그 이전에 발급된 토큰은
+    만료될 때까지 거부되도록 폐기 시각을 기록합니다.
+
+    다른 워커에는 이 기록이 전달되지 않으므로, 캐시에 없는 토큰은 security.get_current_user가
+    users.token_version을 조회해 토큰의 tv 클레임과 비교합니다. 캐시 적중은 DB를 보지 않으므로
+    다른 워커에서 폐기된 토큰이 최대 ttl_seconds 동안 통과할 수 있으며, 이것이 요청마다
+    DB를 조회하지 않는 대가입니다 (PRINCIPAL_CACHE_TTL_SECONDS로 조정).
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, revocation_ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.revocation_ttl_seconds = revocation_ttl_seconds
+        # digest -> (만료 시각, 클레임, 사용자 스냅샷)
+        self._entries: "OrderedDict[str, tuple[float, dict, schemas.User]]" = OrderedDict()
+        # user_id -> 해당 사용자의 digest 집합 (명시적 무효화용)
+        self._digests_by_user: dict[int, set[str]] = {}
+        # user_id -> 폐기 시각 (이 시각 이전에 발급된 토큰은 거부)
+        self._revoked_before: dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def get(self, digest: str) -> Optional[schemas.User]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                return None
+            expires_at, _claims, user = entry
+            if expires_at <= now:
+                self._remove(digest)
+                return None
+            self._entries.move_to_end(digest)
+            return user
+
+    def put(self, digest: str, claims: dict, user: schemas.User) -> None:
+        now = time.time()
+        expires_at = now + self.ttl_seconds
+        token_exp = claims.get("exp")
+        if token_exp is not None:
+            expires_at = min(expires_at, float(token_exp))
+        with self._lock:
+            # 디코딩하는 동안 무효화된 사용자라면 캐시에 넣지 않습니다.
+            if self._is_revoked_locked(user.id, claims.get("iat"), now):
+                return
+            if digest in self._entries:
+                self._remove(digest)
+            self._entries[digest] = (expires_at, claims, user)
+            self._digests_by_user.setdefault(user.id, set()).add(digest)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+
+    def is_revoked(self, user_id: Optional[int], issued_at: Optional[float]) -> bool:
+        if user_id is None:
+            return False
+        with self._lock:
+            return self._is_revoked_locked(user_id, issued_at, time.time())
+
+    def invalidate_user(self, user_id: int) -> None:
+        """사용자의 캐시 항목을 모두 지우고, 기존에 발급된 토큰을 폐기합니다."""
+        now = time.time()
+        with self._lock:
+            for digest in list(self._digests_by_user.get(user_id, ())):
+                self._remove(digest)
+            self._revoked_before[user_id] = now
+            # 토큰 수명이 지난 폐기 기록은 더 이상 필요 없으므로 정리합니다.
+            cutoff = now - self.revocation_ttl_seconds
+            for uid in [uid for uid, ts in self._revoked_before.items() if ts < cutoff]:
+                del self._revoked_before[uid]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._digests_by_user.clear()
+            self._revoked_before.clear()
+
+    def _is_revoked_locked(self, user_id: int, issued_at: Optional[float], now: float) -> bool:
+        revoked_at = self._revoked_before.get(user_id)
+        if revoked_at is None:
+            return False
+        if revoked_at < now - self.revocation_ttl_seconds:
+            return False
+        # iat가 없는 (이전 형식의) 토큰은 폐기 기록이 있으면 거부합니다.
+        return issued_at is None or float(issued_at) < revoked_at
+
+    def _remove(self, digest: str) -> None:
+        entry = self._entries.pop(digest, None)
+        if entry is None:
+            return
+        user_id = entry[2].id
+        digests = self._digests_by_user.get(user_id)
+        if digests is not None:
+            digests.discard(digest)
+            if not digests:
+                del self._digests_by_user[user_id]
+
+
+principal_cache = PrincipalCache(
+    max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    revocation_ttl_seconds=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+
+
+class QuizBankCache:
+    """
+    단어장 ID를 키로 QuizBank 스냅샷을 보관하는 LRU 캐시입니다.
+
+    항목 수가 아니라 스냅샷의 대략적인 메모리 크기(nbytes) 합이 max_bytes를 넘지 않도록
+    오래 쓰이지 않은 단어장부터 제거합니다. 조회할 때 DB에서 읽은 version과 다르면
+    (다른 워커 프로세스에서 단어장이 바뀐 경우 등) 캐시 항목을 쓰지 않습니다.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[int, QuizBank]" = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, wordbook_id: int, version) -> Optional[QuizBank]:
+        with self._lock:
+            bank = self._entries.get(wordbook_id)
+            if bank is None or bank.version != version:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(wordbook_id)
+            self._hits += 1
+            return bank
+
+    def put(self, bank: QuizBank) -> None:
+        # 캐시 전체보다 큰 스냅샷은 보관하지 않습니다.
+        if bank.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            self._remove(bank.wordbook_id)
+            self._entries[bank.wordbook_id] = bank
+            self._bytes += bank.nbytes
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+
+    def invalidate(self, wordbook_id: int) -> None:
+        with self._lock:
+            self._remove(wordbook_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+    def _remove(self, wordbook_id: int) -> None:
+        bank = self._entries.pop(wordbook_id, None)
+        if bank is not None:
+            self._bytes -= bank.nbytes
+
+
+class ExamPaperCache:
+    """
+    시험 세션 ID를 키로 미리 직렬화된 ExamPaper를 보관하는 LRU 캐시입니다.
+    시험지는 생성 후 바뀌지 않으므로 버전 확인 없이 세션 ID만으로 찾습니다.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, ExamPaper]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id: int) -> Optional[ExamPaper]:
+        with self._lock:
+            paper = self._entries.get(session_id)
+            if paper is not None:
+                self._entries.move_to_end(session_id)
+            return paper
+
+    def put(self, paper: ExamPaper) -> None:
+        with self._lock:
+            self._entries[paper.session_id] = paper
+            self._entries.move_to_end(paper.session_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, session_id: int) -> None:
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+quiz_bank_cache = QuizBankCache(max_bytes=settings.QUIZ_BANK_CACHE_MAX_BYTES)
+exam_paper_cache = ExamPaperCache(max_entries=settings.EXAM_PAPER_CACHE_MAX_ENTRIES)
+
+
+class LeaderboardCache:
+    """
+    (범위, 범위 ID, 지표)를 키로 리더보드 상위 K명(TopK)을 보관하는 TTL + LRU 캐시입니다.
+
+    시험 결과가 저장되면 update()로 해당 학생의 점수만 반영하므로, 자주 조회되는 리더보드는
+    결과 테이블 전체를 다시 순위 매기지 않고 응답할 수 있습니다. 다른 워커 프로세스에서 저장된
+    결과는 TTL이 지나 다시 만들 때 반영됩니다.
+
+    DB에서 리더보드를 만드는 동안 다른 요청이 결과를 저장하면 읽어 온 순위가 이미 낡았을 수
+    있으므로, 조회를 시작할 때 generation()을 받아 두고 그 사이 변경이 있었다면 put()이
+    스냅샷을 버립니다.
+    """
+
+    def __init__(self, k: int, max_entries: int, ttl_seconds: float):
+        self.k = k
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # key -> (만료 시각, 상위 K명)
+        self._entries: "OrderedDict[Hashable, tuple[float, TopK]]" = OrderedDict()
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def get(self, key: Hashable, limit: int) -> Optional[List[Tuple[int, LeaderboardEntry]]]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1].ranked(limit)
+
+    def put(self, key: Hashable, top: TopK, generation: int) -> None:
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (time.time() + self.ttl_seconds, top)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def note_write(self) -> bool:
+        """
+        점수가 바뀌었음을 기록하고, 반영할 캐시 항목이 하나라도 있는지 반환합니다.
+        False이면 호출한 쪽은 update()에 필요한 값을 DB에서 읽지 않아도 됩니다.
+        """
+        with self._lock:
+            self._generation += 1
+            return bool(self._entries)
+
+    def contains(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def update(self, key: Hashable, entry: LeaderboardEntry) -> None:
+        """캐시된 리더보드에 학생 한 명의 새 점수를 반영하고, 정확히 유지할 수 없으면 항목을 버립니다."""
+        with self._lock:
+            self._generation += 1
+            cached = self._entries.get(key)
+            if cached is not None and not cached[1].update(entry):
+                del self._entries[key]
+
+    def invalidate(self, keys) -> None:
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "top_k": self.k,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+
+leaderboard_cache = LeaderboardCache(
+    k=settings.LEADERBOARD_TOP_K,
+    max_entries=settings.LEADERBOARD_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.LEADERBOARD_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,55 @@
+# backend/app/cli.py
+"""
+운영용 명령어 모음입니다. backend 폴더에서 실행합니다.
+
+    python -m app.cli recompute-srs [--batch-size 10000]
+    python -m app.cli rebuild-score-rollups [--batch-size 500]
+"""
+import argparse
+
+from . import crud
+from .database import SessionLocal
+
+
+def recompute_srs(args) -> None:
+    """SRS 설정(SRS_INTERVAL_MODIFIER 등)을 바꾼 뒤, 모든 학생의 복습 일정을 다시 계산합니다."""
+    db = SessionLocal()
+    try:
+        total = crud.recompute_word_memory_schedules(
+            db, batch_size=args.batch_size, progress=lambda n: print(f"  {n} rows updated", flush=True)
+        )
+    finally:
+        db.close()
+    print(f"Recomputed {total} review schedules.")
+
+
+def rebuild_score_rollups(args) -> None:
+    """시험 결과 기록 전체로 점수 누계 테이블을 다시 만듭니다. 누계 테이블을 추가한 마이그레이션 뒤에 한 번 실행합니다."""
+    db = SessionLocal()
+    try:
+        total = crud.rebuild_score_rollups(
+            db, batch_size=args.batch_size, progress=lambda n: print(f"  {n} users processed", flush=True)
+        )
+    finally:
+        db.close()
+    print(f"Rebuilt score rollups for {total} users.")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    recompute = commands.add_parser("recompute-srs", help="Recompute every student's review due dates")
+    recompute.add_argument("--batch-size", type=int, default=crud.WORD_MEMORY_RECOMPUTE_BATCH_SIZE)
+    recompute.set_defaults(func=recompute_srs)
+
+    rollups = commands.add_parser("rebuild-score-rollups", help="Rebuild score rollup tables from test result history")
+    rollups.add_argument("--batch-size", type=int, default=crud.SCORE_ROLLUP_REBUILD_BATCH_SIZE)
+    rollups.set_defaults(func=rebuild_score_rollups)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
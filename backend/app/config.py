@@ -1,14 +1,52 @@
 # app/config.py
 import os
+from typing import Optional
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     # 코드에서 사용할 환경 변수를 정의합니다.
     DATABASE_URL: str
+    # 읽기 전용 복제본 URL (없으면 읽기 요청도 기본 DB를 사용합니다). DB_ASYNC_MODE의 async 엔드포인트에도 적용됩니다.
+    DATABASE_REPLICA_URL: Optional[str] = None
+    # 쓰기 요청 이후 이 시간(초) 동안은 같은 사용자의 읽기를 기본 DB로 보냅니다.
+    READ_YOUR_WRITES_SECONDS: float = 5
     SECRET_KEY: str  # 추가
     ALGORITHM: str   # 추가
     ACCESS_TOKEN_EXPIRE_MINUTES: int # 추가
 
+    # 커넥션 풀 설정 (DB_POOL_RECYCLE이 -1이면 재활용하지 않습니다)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+
+    # True이면 주요 조회 API를 AsyncSession(asyncpg) 기반 async 엔드포인트로 제공합니다.
+    DB_ASYNC_MODE: bool = False
+
+    # 인증 주체(principal) 캐시 설정
+    # 캐시 적중 시에는 DB를 보지 않으므로, 다른 워커에서 폐기된 토큰은 최대 TTL초 동안 이 워커에서 통과할 수 있습니다.
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+
+    # 단어장별 퀴즈 스냅샷 캐시의 최대 메모리 (바이트)
+    QUIZ_BANK_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    # 미리 직렬화해 둘 시험 세션 시험지 수
+    EXAM_PAPER_CACHE_MAX_ENTRIES: int = 256
+    # 리더보드 캐시: 보관할 상위 학생 수(K), 리더보드 수, 다른 워커의 변경이 반영되기까지의 최대 시간(초)
+    LEADERBOARD_TOP_K: int = 50
+    LEADERBOARD_CACHE_MAX_ENTRIES: int = 1024
+    LEADERBOARD_CACHE_TTL_SECONDS: int = 60
+
+    # 간격 반복(SRS) 설정. 값을 바꾼 뒤에는 `python -m app.cli recompute-srs`로 복습 일정을 다시 계산합니다.
+    SRS_INTERVAL_MODIFIER: float = 1.0
+    SRS_MAX_INTERVAL_DAYS: float = 365.0
+
+    # 비밀번호 해싱 설정 (HASH_POOL_WORKERS가 없으면 CPU 코어 수, 0이면 풀 없이 실행)
+    BCRYPT_ROUNDS: int = 12
+    HASH_POOL_WORKERS: Optional[int] = None
+    HASH_QUEUE_LIMIT: int = 32
+    HASH_RETRY_AFTER_SECONDS: int = 1
 
     class Config:
         # .env 파일을 읽어오도록 설정합니다.
@@ -1,36 +1,109 @@
 # backend/app/crud.py
 
-from sqlalchemy.orm import Session, selectinload, subqueryload
-from sqlalchemy import select
-from typing import List
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import Date, case, cast, delete, insert, or_, select, true, tuple_, union, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by, array_agg, insert as pg_insert
+from typing import Callable, Iterable, List, Optional, Tuple
+from datetime import date, datetime, time, timedelta, timezone
 from sqlalchemy import func
-import random
-from . import models, schemas
+import secrets
+from . import grading, models, schemas, srs
+from .cache import exam_paper_cache, leaderboard_cache, principal_cache, quiz_bank_cache
+from .leaderboard import METRICS, LeaderboardEntry, TopK
+from .quiz import ExamPaper, QuizBank
 
 # =================================================================
 # 단어장 관련 CRUD
 # =================================================================
 
-def create_wordbook_for_students(db: Session, wordbook_data: schemas.WordbookUpload, teacher_id: int):
-    db_wordbook = models.Wordbook(
-        title=wordbook_data.title,
-        description=wordbook_data.description,
-        owner_id=teacher_id
-    )
-    db_words = [models.Word(**word.model_dump()) for word in wordbook_data.words]
-    db_wordbook.words = db_words
-    
+WORD_INSERT_CHUNK_SIZE = 1000
+
+def _create_wordbook_row(db: Session, title: str, description: Optional[str], teacher_id: int, student_ids: List[int]):
+    """단어 없이 단어장을 만들고 학생을 할당합니다 (커밋하지 않음)."""
+    db_wordbook = models.Wordbook(title=title, description=description, owner_id=teacher_id)
     students_to_assign = db.query(models.User).filter(
-        models.User.id.in_(wordbook_data.student_ids),
+        models.User.id.in_(student_ids),
         models.User.role == models.UserRole.student
     ).all()
-
     db_wordbook.students.extend(students_to_assign)
     db.add(db_wordbook)
+    db.flush()
+    bump_wordbook_versions(db, db_wordbook.id)
+    return db_wordbook
+
+def _insert_words(db: Session, wordbook_id: int, words: List[dict]):
+    """
+    ORM 객체를 만들지 않고 Core insert()의 executemany로 단어를 저장합니다.
+    SQLAlchemy가 다중 행 INSERT로 묶어서 전송합니다.
+    """
+    if words:
+        db.execute(insert(models.Word), [{**word, "wordbook_id": wordbook_id} for word in words])
+
+def create_wordbook_for_students(db: Session, wordbook_data: schemas.WordbookUpload, teacher_id: int):
+    db_wordbook = _create_wordbook_row(
+        db, wordbook_data.title, wordbook_data.description, teacher_id, wordbook_data.student_ids
+    )
+    words = [word.model_dump() for word in wordbook_data.words]
+    for i in range(0, len(words), WORD_INSERT_CHUNK_SIZE):
+        _insert_words(db, db_wordbook.id, words[i:i + WORD_INSERT_CHUNK_SIZE])
     db.commit()
+    quiz_bank_cache.invalidate(db_wordbook.id)
     db.refresh(db_wordbook)
     return db_wordbook
 
+def create_wordbook_from_rows(
+    db: Session,
+    title: str,
+    description: Optional[str],
+    teacher_id: int,
+    student_ids: List[int],
+    rows: Iterable[Tuple[int, Optional[dict], Optional[str]]],
+    max_reported_errors: int = 100,
+) -> Optional[schemas.WordbookUploadResult]:
+    """
+    파서가 한 행씩 넘겨주는 단어를 청크 단위로 저장합니다.
+    파일 전체를 메모리에 올리지 않으며, 오류 행은 건너뛰고 앞쪽 일부만 보고합니다.
+    저장할 단어가 하나도 없으면 롤백하고 None을 반환합니다.
+    """
+    db_wordbook = _create_wordbook_row(db, title, description, teacher_id, student_ids)
+    chunk: List[dict] = []
+    inserted = 0
+    error_count = 0
+    errors: List[schemas.UploadRowError] = []
+
+    for row_number, word, error in rows:
+        if error is not None:
+            error_count += 1
+            if len(errors) < max_reported_errors:
+                errors.append(schemas.UploadRowError(row=row_number, detail=error))
+            continue
+        chunk.append(word)
+        if len(chunk) >= WORD_INSERT_CHUNK_SIZE:
+            _insert_words(db, db_wordbook.id, chunk)
+            inserted += len(chunk)
+            chunk = []
+    _insert_words(db, db_wordbook.id, chunk)
+    inserted += len(chunk)
+
+    if inserted == 0:
+        db.rollback()
+        return None
+    db.commit()
+    quiz_bank_cache.invalidate(db_wordbook.id)
+
+    return schemas.WordbookUploadResult(
+        wordbook=schemas.WordbookSummary(
+            id=db_wordbook.id,
+            title=title,
+            description=description,
+            owner_id=teacher_id,
+            word_count=inserted,
+        ),
+        inserted=inserted,
+        error_count=error_count,
+        errors=errors,
+    )
+
 def get_wordbook(db: Session, wordbook_id: int):
     # 단어장, 단어, 할당된 학생 정보를 한 번에 로드하도록 수정 (성능 개선)
     return db.query(models.Wordbook).options(
@@ -41,35 +114,153 @@ def get_wordbook(db: Session, wordbook_id: int):
 def get_wordbooks(db: Session, skip: int = 0, limit: int = 100):
     return db.query(models.Wordbook).offset(skip).limit(limit).all()
 
-def get_wordbooks_for_student(db: Session, student_id: int):
+def get_wordbook_summaries_for_student(
+    db: Session, student_id: int, after_id: Optional[int] = None, limit: int = 50
+) -> List[schemas.WordbookSummary]:
     """
-    특정 학생 ID로 해당 학생에게 할당된 모든 단어장을 조회합니다.
+    학생에게 할당된 단어장을 단어 없이 요약 정보로 조회합니다.
+    단어 수는 SQL에서 계산하고 마지막 퀴즈 결과는 점수 누계에서 읽으며, 단어장 ID 기준 키셋 페이지네이션을 사용합니다.
     """
-    student = db.query(models.User).options(
-        selectinload(models.User.assigned_wordbooks)
-        .selectinload(models.Wordbook.words)
-    ).filter(models.User.id == student_id).first()
-    
-    if not student:
-        return []
-    
-    return student.assigned_wordbooks
+    assoc = models.student_wordbook_association
+    word_count = (
+        select(func.count(models.Word.id))
+        .where(models.Word.wordbook_id == models.Wordbook.id)
+        .correlate(models.Wordbook)
+        .scalar_subquery()
+    )
+    # 마지막 퀴즈 결과는 점수 누계(student_wordbook_scores)에서 읽습니다.
+    scores = models.StudentWordbookScore
+    stmt = (
+        select(
+            models.Wordbook.id,
+            models.Wordbook.title,
+            models.Wordbook.description,
+            models.Wordbook.owner_id,
+            word_count.label("word_count"),
+            scores.last_score.label("last_quiz_score"),
+            scores.last_submitted_at.label("last_quiz_at"),
+        )
+        .join(assoc, assoc.c.wordbook_id == models.Wordbook.id)
+        .outerjoin(
+            scores,
+            (scores.student_id == assoc.c.student_id) & (scores.wordbook_id == models.Wordbook.id),
+        )
+        .where(assoc.c.student_id == student_id)
+        .order_by(assoc.c.wordbook_id)
+        .limit(limit)
+    )
+    if after_id is not None:
+        stmt = stmt.where(assoc.c.wordbook_id > after_id)
+    return [schemas.WordbookSummary.model_validate(row) for row in db.execute(stmt)]
+
+def get_wordbook_owner_id(db: Session, wordbook_id: int) -> Optional[int]:
+    """단어나 학생을 로드하지 않고 단어장 소유자 ID만 조회합니다."""
+    return db.scalar(select(models.Wordbook.owner_id).where(models.Wordbook.id == wordbook_id))
 
-def delete_wordbook(db: Session, wordbook_id: int):
+def delete_wordbook(db: Session, wordbook_id: int) -> bool:
     """
     ID를 기준으로 단어장을 삭제합니다.
+    단어, 할당, 시험과 시험 결과는 DB의 ON DELETE CASCADE로 함께 지워지므로
+    DELETE 문 하나로 끝납니다.
     """
-    # 삭제할 단어장 객체를 가져옵니다.
-    db_wordbook = get_wordbook(db, wordbook_id=wordbook_id)
-    
-    if db_wordbook:
-        # 데이터베이스에서 객체를 삭제합니다.
-        db.delete(db_wordbook)
-        # 변경 사항을 커밋합니다.
-        db.commit()
-    
-    # 삭제된 객체 정보를 반환합니다 (필요시 사용).
-    return db_wordbook
+    owner_id = get_wordbook_owner_id(db, wordbook_id)
+    bump_wordbook_versions(db, wordbook_id)
+    result = db.execute(delete(models.Wordbook).where(models.Wordbook.id == wordbook_id))
+    db.commit()
+    quiz_bank_cache.invalidate(wordbook_id)
+    invalidate_leaderboards(wordbook_id, owner_id)
+    return result.rowcount > 0
+
+WORDBOOK_PURGE_BATCH_SIZE = 5000
+
+def detach_wordbook(db: Session, wordbook_id: int):
+    """비동기 삭제 전에 학생 할당을 먼저 끊어, 삭제가 끝나기 전에도 목록에서 보이지 않게 합니다."""
+    assoc = models.student_wordbook_association
+    owner_id = get_wordbook_owner_id(db, wordbook_id)
+    bump_wordbook_versions(db, wordbook_id)
+    db.execute(delete(assoc).where(assoc.c.wordbook_id == wordbook_id))
+    db.commit()
+    quiz_bank_cache.invalidate(wordbook_id)
+    invalidate_leaderboards(wordbook_id, owner_id)
+
+def purge_wordbook(db: Session, wordbook_id: int, batch_size: int = WORDBOOK_PURGE_BATCH_SIZE):
+    """
+    큰 단어장을 여러 개의 짧은 트랜잭션으로 나누어 삭제합니다.
+    시험 결과와 단어를 batch_size씩 지운 뒤, 마지막에 단어장 행을 삭제합니다.
+    """
+    batches = [
+        (models.TestResult, select(models.TestResult.id)
+            .join(models.Test, models.Test.id == models.TestResult.test_id)
+            .where(models.Test.wordbook_id == wordbook_id)),
+        (models.Word, select(models.Word.id).where(models.Word.wordbook_id == wordbook_id)),
+    ]
+    for model, ids in batches:
+        while True:
+            result = db.execute(
+                delete(model).where(model.id.in_(ids.limit(batch_size).scalar_subquery()))
+            )
+            db.commit()
+            if result.rowcount < batch_size:
+                break
+    delete_wordbook(db, wordbook_id)
+
+# =================================================================
+# 데이터 버전(ETag) 관련 CRUD
+# -----------------------------------------------------------------
+# users.data_version과 wordbooks.version은 해당 데이터를 바꾸는 트랜잭션 안에서 1씩 올립니다.
+# 조회 API는 본문을 만들기 전에 버전만 읽어 ETag를 계산하고, 바뀌지 않았으면 304로 응답합니다.
+# =================================================================
+
+def bump_user_versions(db: Session, user_ids) -> None:
+    """user_ids(ID 목록 또는 ID를 고르는 SELECT)의 data_version을 올립니다 (커밋하지 않음)."""
+    db.execute(
+        update(models.User)
+        .where(models.User.id.in_(user_ids))
+        .values(data_version=models.User.data_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+def bump_wordbook_versions(db: Session, wordbook_id: int) -> None:
+    """
+    단어장 버전과 그 단어장이 보이는 사용자(소유자, 할당된 학생, 점수 누계가 있는 학생)의 버전을 올립니다.
+    할당과 점수 누계가 CASCADE로 지워지기 전에 호출해야 합니다 (커밋하지 않음).
+    """
+    assoc = models.student_wordbook_association
+    db.execute(
+        update(models.Wordbook)
+        .where(models.Wordbook.id == wordbook_id)
+        .values(version=models.Wordbook.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    audience = union(
+        select(models.Wordbook.owner_id).where(models.Wordbook.id == wordbook_id),
+        select(assoc.c.student_id).where(assoc.c.wordbook_id == wordbook_id),
+        select(models.StudentWordbookScore.student_id).where(models.StudentWordbookScore.wordbook_id == wordbook_id),
+    )
+    bump_user_versions(db, audience)
+
+def get_user_data_version(db: Session, user_id: int) -> Optional[int]:
+    return db.scalar(select(models.User.data_version).where(models.User.id == user_id))
+
+def get_user_token_version(db: Session, user_id: int) -> Optional[int]:
+    """토큰 검증용으로 token_version만 조회합니다. 사용자가 없으면 None을 반환합니다."""
+    return db.scalar(select(models.User.token_version).where(models.User.id == user_id))
+
+def get_wordbook_version_meta(db: Session, wordbook_id: int, user_id: int):
+    """
+    단어장 상세 조회의 권한 확인과 ETag 계산에 필요한 값만 조회합니다.
+    (owner_id, is_assigned, version) 행 또는 None을 반환합니다.
+    """
+    assoc = models.student_wordbook_association
+    is_assigned = (
+        select(assoc.c.student_id)
+        .where(assoc.c.wordbook_id == models.Wordbook.id, assoc.c.student_id == user_id)
+        .exists()
+    )
+    return db.execute(
+        select(models.Wordbook.owner_id, is_assigned.label("is_assigned"), models.Wordbook.version)
+        .where(models.Wordbook.id == wordbook_id)
+    ).first()
 
 # =================================================================
 # 사용자 관련 CRUD
@@ -86,6 +277,35 @@ def get_users(db: Session, skip: int = 0, limit: int = 100):
 def get_all_students(db: Session):
     return db.query(models.User).filter(models.User.role == models.UserRole.student).all()
 
+def search_students(
+    db: Session,
+    query: Optional[str] = None,
+    prefix_only: bool = False,
+    after: Optional[Tuple[str, int]] = None,
+    limit: int = 50,
+):
+    """
+    학생 디렉터리를 (name, id) 순서의 키셋 페이지네이션으로 조회합니다.
+    query가 있으면 이름/아이디에 대해 부분 일치(또는 접두사 일치) 검색을 합니다 (pg_trgm 인덱스 사용).
+    """
+    stmt = (
+        select(models.User.id, models.User.username, models.User.name)
+        .where(models.User.role == models.UserRole.student)
+        .order_by(models.User.name, models.User.id)
+        .limit(limit)
+    )
+    if query:
+        # LIKE 와일드카드 문자는 그대로 검색되도록 이스케이프합니다.
+        escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        pattern = f"{escaped}%" if prefix_only else f"%{escaped}%"
+        stmt = stmt.where(or_(
+            models.User.name.ilike(pattern, escape="\\"),
+            models.User.username.ilike(pattern, escape="\\"),
+        ))
+    if after is not None:
+        stmt = stmt.where(tuple_(models.User.name, models.User.id) > tuple_(*after))
+    return db.execute(stmt).all()
+
 def create_user(db: Session, user: schemas.UserCreate, hashed_password: str):
     db_user = models.User(
         username=user.username,
@@ -98,20 +318,106 @@ def create_user(db: Session, user: schemas.UserCreate, hashed_password: str):
     db.refresh(db_user)
     return db_user
 
+def create_students_bulk(
+    db: Session,
+    students: List[Tuple[int, schemas.BulkStudentCreate]],
+    default_password: str,
+    hash_passwords: Callable[[List[str]], List[str]],
+) -> List[schemas.BulkUserResult]:
+    """
+    (행 번호, 학생) 목록을 한 번에 등록하고 행별 결과를 반환합니다.
+    중복 확인은 IN 쿼리 한 번, 등록은 다중 행 INSERT ... RETURNING 한 번으로 처리합니다.
+    """
+    results: List[schemas.BulkUserResult] = []
+
+    # 1. 업로드 안에서 중복된 아이디는 첫 행만 등록합니다.
+    first_rows = {}
+    for row, student in students:
+        if student.username in first_rows:
+            results.append(schemas.BulkUserResult(
+                row=row, username=student.username, status="conflict",
+                detail=f"Duplicate of row {first_rows[student.username]}"
+            ))
+        else:
+            first_rows[student.username] = row
+
+    # 2. 이미 등록된 아이디를 한 번의 IN 쿼리로 확인합니다.
+    existing = set(db.scalars(
+        select(models.User.username).where(models.User.username.in_(list(first_rows)))
+    ))
+    to_create = []
+    for row, student in students:
+        if first_rows.get(student.username) != row:
+            continue
+        if student.username in existing:
+            results.append(schemas.BulkUserResult(
+                row=row, username=student.username, status="conflict",
+                detail="Username already registered"
+            ))
+        else:
+            to_create.append((row, student))
+
+    # 3. 비밀번호를 병렬로 해싱한 뒤 한 번의 INSERT로 등록합니다.
+    if to_create:
+        hashed_passwords = hash_passwords([s.password or default_password for _, s in to_create])
+        stmt = pg_insert(models.User).values([
+            {
+                "username": student.username,
+                "name": student.name,
+                "hashed_password": hashed,
+                "role": models.UserRole.student,
+            }
+            for (_, student), hashed in zip(to_create, hashed_passwords)
+        ])
+        # 확인 이후 다른 요청이 같은 아이디를 먼저 등록했다면 건너뛰고 conflict로 보고합니다.
+        stmt = stmt.on_conflict_do_nothing(index_elements=[models.User.username])
+        stmt = stmt.returning(models.User.id, models.User.username)
+        created_ids = {username: user_id for user_id, username in db.execute(stmt)}
+        db.commit()
+
+        for row, student in to_create:
+            user_id = created_ids.get(student.username)
+            if user_id is None:
+                results.append(schemas.BulkUserResult(
+                    row=row, username=student.username, status="conflict",
+                    detail="Username already registered"
+                ))
+            else:
+                results.append(schemas.BulkUserResult(
+                    row=row, username=student.username, status="created", id=user_id
+                ))
+
+    return results
+
 def update_user_password(db: Session, user_id: int, new_hashed_password: str):
     db_user = get_user(db, user_id=user_id)
     if db_user:
         db_user.hashed_password = new_hashed_password
+        # 비밀번호가 바뀌었으므로 기존 토큰을 폐기합니다. token_version은 모든 워커가 DB에서 확인하고,
+        # 이 워커의 캐시는 바로 비웁니다.
+        db_user.token_version = models.User.token_version + 1
         db.commit()
         db.refresh(db_user)
+        principal_cache.invalidate_user(user_id)
         return db_user
     return None
 
+def rehash_user_password(db: Session, db_user: models.User, new_hashed_password: str):
+    """
+    같은 비밀번호를 새 bcrypt 비용으로 다시 해싱한 결과를 저장합니다.
+    비밀번호 자체는 그대로이므로 기존 토큰은 무효화하지 않습니다.
+    """
+    db_user.hashed_password = new_hashed_password
+    db.commit()
+    return db_user
+
 def delete_user(db: Session, user_id: int):
     db_user = get_user(db, user_id=user_id)
     if db_user:
         db.delete(db_user)
         db.commit()
+        principal_cache.invalidate_user(user_id)
+        leaderboard_cache.clear()
         return db_user
     return None
 
@@ -129,156 +435,855 @@ def get_words_for_quiz(db: Session, wordbook_id: int) -> List[models.Word]:
         return []
     return wordbook.words
 
-# ✨ 퀴즈 질문을 생성하는 로직 함수 (새로 추가)
-def generate_quiz(words: List[models.Word]) -> List[schemas.QuizQuestion]:
+def get_wordbook_quiz_meta(db: Session, wordbook_id: int, user_id: int):
     """
-    단어 목록을 받아 객관식/주관식 퀴즈 질문 목록을 생성합니다.
+    퀴즈 요청에 필요한 권한 정보와 단어장 내용 버전을 한 번의 쿼리로 조회합니다.
+    단어와 학생 목록은 로드하지 않으며, 단어장이 없으면 None을 반환합니다.
+    (owner_id, title, is_assigned, word_count, max_word_id) 행을 반환합니다.
     """
-    if not words:
-        return []
+    assoc = models.student_wordbook_association
+    is_assigned = (
+        select(assoc.c.student_id)
+        .where(assoc.c.wordbook_id == models.Wordbook.id, assoc.c.student_id == user_id)
+        .correlate(models.Wordbook)
+        .exists()
+    )
+    word_stats = (
+        select(func.count(models.Word.id).label("word_count"), func.max(models.Word.id).label("max_word_id"))
+        .where(models.Word.wordbook_id == models.Wordbook.id)
+        .lateral("word_stats")
+    )
+    stmt = (
+        select(
+            models.Wordbook.owner_id,
+            models.Wordbook.title,
+            is_assigned.label("is_assigned"),
+            word_stats.c.word_count,
+            word_stats.c.max_word_id,
+        )
+        .join(word_stats, true())
+        .where(models.Wordbook.id == wordbook_id)
+    )
+    return db.execute(stmt).first()
 
-    num_questions = max(1, len(words) // 2)
-    selected_words = random.sample(words, num_questions)
-
-    questions: List[schemas.QuizQuestion] = []
-    all_meanings = [w.meaning for w in words]
-
-    for word in selected_words:
-        # 단어가 4개 미만이면 주관식만, 그 이상이면 50% 확률로 문제 유형 결정
-        question_type = 'written'
-        if len(words) >= 4 and random.random() > 0.5:
-            question_type = 'multiple_choice'
-
-        if question_type == 'multiple_choice':
-            correct_answer = word.meaning
-            # 정답을 제외한 나머지 뜻 중에서 3개의 오답 선택
-            wrong_choices_pool = [m for m in all_meanings if m != correct_answer]
-            wrong_choices = random.sample(wrong_choices_pool, min(3, len(wrong_choices_pool)))
-            
-            choices = wrong_choices + [correct_answer]
-            random.shuffle(choices)
-
-            questions.append(schemas.MultipleChoiceQuestion(
-                question=f"다음 영단어의 뜻은? '{word.text}'",
-                answer=correct_answer,
-                choices=choices
-            ))
-        else: # 'written'
-            questions.append(schemas.WrittenQuestion(
-                question=f"다음 뜻을 가진 영단어는? '{word.meaning}'",
-                answer=word.text
-            ))
-    
-    random.shuffle(questions) # 최종 문제 순서 섞기
-    return questions
+def get_quiz_bank(db: Session, wordbook_id: int, version) -> QuizBank:
+    """
+    캐시에 같은 버전의 퀴즈 스냅샷이 있으면 그대로 사용하고,
+    없으면 단어의 id/text/meaning/품사 열만 읽어 스냅샷을 만든 뒤 캐시에 저장합니다.
+    """
+    bank = quiz_bank_cache.get(wordbook_id, version)
+    if bank is not None:
+        return bank
+    rows = db.execute(
+        select(models.Word.id, models.Word.text, models.Word.meaning, models.Word.part_of_speech)
+        .where(models.Word.wordbook_id == wordbook_id)
+        .order_by(models.Word.id)
+    ).all()
+    bank = QuizBank.from_words(rows, wordbook_id=wordbook_id, version=version)
+    quiz_bank_cache.put(bank)
+    return bank
 
 
-def create_test(db: Session, test: schemas.TestCreate, creator_id: int):
-    db_test = models.Test(
-        title=test.title,
-        wordbook_id=test.wordbook_id,
-        creator_id=creator_id
-    )
+def create_quiz_session(
+    db: Session, wordbook_id: int, title: str, creator_id: int, version, prefer_word_ids: Optional[List[int]] = None
+) -> schemas.QuizSession:
+    """
+    시험 기록 생성과 문제 출제를 한 트랜잭션에서 처리합니다.
+    문제는 get_quiz_bank의 캐시된 스냅샷에서 뽑으므로 단어장을 다시 읽지 않습니다.
+    """
+    bank = get_quiz_bank(db, wordbook_id=wordbook_id, version=version)
+    questions, answer_key = bank.generate_paper(prefer_word_ids=prefer_word_ids or ())
+    db_test = models.Test(title=title, wordbook_id=wordbook_id, creator_id=creator_id, answer_key=answer_key)
     db.add(db_test)
+    # 커밋 후에는 객체가 만료되어 다시 조회하게 되므로, ID를 받은 뒤 미리 스냅샷을 만듭니다.
+    db.flush()
+    test = schemas.Test.model_validate(db_test)
     db.commit()
-    db.refresh(db_test)
-    return db_test
+    return schemas.QuizSession(test=test, questions=questions)
+
+def get_test_for_submission(db: Session, test_id: int, user_id: int):
+    """
+    답안 제출에 필요한 시험 정보와 권한 정보를 한 번의 쿼리로 조회합니다.
+    (id, creator_id, is_assigned, answer_key) 행 또는 None을 반환합니다.
+    """
+    assoc = models.student_wordbook_association
+    is_assigned = (
+        select(assoc.c.student_id)
+        .where(assoc.c.wordbook_id == models.Test.wordbook_id, assoc.c.student_id == user_id)
+        .correlate(models.Test)
+        .exists()
+    )
+    stmt = (
+        select(models.Test.id, models.Test.creator_id, is_assigned.label("is_assigned"), models.Test.answer_key)
+        .where(models.Test.id == test_id)
+    )
+    return db.execute(stmt).first()
 
-def create_test_result(db: Session, result: schemas.TestResultCreate, student_id: int):
+def create_graded_test_result(
+    db: Session, test_id: int, student_id: int, outcomes: List[grading.Outcome]
+) -> schemas.GradedTestResult:
     """
-    학생의 시험 결과를 데이터베이스에 저장합니다.
+    서버에서 채점한 결과를 저장합니다. 점수 행과 문제별 결과를 한 트랜잭션에서 기록하며,
+    문제별 결과는 여러 행을 한 번에 넣는 INSERT 문 하나로 저장합니다.
     """
-    # SQLAlchemy 모델 객체를 생성합니다.
     db_result = models.TestResult(
-        score=result.score,
-        test_id=result.test_id,
+        score=grading.score(outcomes),
+        test_id=test_id,
         student_id=student_id,
-        submitted_at=func.now() # 현재 시간을 제출 시간으로 기록
+        submitted_at=func.now()
     )
     db.add(db_result)
+    db.flush()
+    if outcomes:
+        db.execute(insert(models.QuestionOutcome).values([
+            {
+                "test_result_id": db_result.id,
+                "question_id": outcome.question_id,
+                "word_id": outcome.word_id,
+                "is_correct": outcome.is_correct,
+                "given_answer": outcome.given_answer,
+            }
+            for outcome in outcomes
+        ]))
+        update_word_memories(db, student_id=student_id, outcomes=outcomes)
+    update_score_rollups(db, result_id=db_result.id)
+    bump_user_versions(db, [student_id])
     db.commit()
+    update_cached_leaderboards(db, student_id=student_id, test_id=db_result.test_id)
     db.refresh(db_result)
-    return db_result
+    return schemas.GradedTestResult(
+        id=db_result.id,
+        test_id=test_id,
+        score=db_result.score,
+        submitted_at=db_result.submitted_at,
+        correct_count=sum(outcome.is_correct for outcome in outcomes),
+        question_count=len(outcomes),
+        outcomes=[
+            schemas.QuestionOutcome(
+                question_id=outcome.question_id,
+                is_correct=outcome.is_correct,
+                given_answer=outcome.given_answer,
+                correct_answer=outcome.correct_answer,
+            )
+            for outcome in outcomes
+        ],
+    )
+
+# =================================================================
+# 점수 누계(rollup) 관련 CRUD
+# -----------------------------------------------------------------
+# student_wordbook_scores / student_daily_scores는 test_results의 개수·합계·최소·최대·마지막 점수를
+# 미리 합산해 둔 테이블입니다. 결과를 저장할 때 upsert로 더하고, 리포트/통계는 이 행만 읽습니다.
+# =================================================================
+
+SCORE_ROLLUP_REBUILD_BATCH_SIZE = 500
+SCORE_ROLLUP_COLUMNS = ("result_count", "score_sum", "score_min", "score_max", "last_score", "last_submitted_at")
+
+
+def _score_rollup_source(keys, conditions):
+    """test_results를 keys별로 집계해 SCORE_ROLLUP_COLUMNS 순서로 돌려주는 SELECT를 만듭니다."""
+    result = models.TestResult
+    last_score = array_agg(
+        aggregate_order_by(result.score, result.submitted_at.desc().nullslast(), result.id.desc())
+    )[1]
+    return (
+        select(
+            *keys,
+            func.count(),
+            func.sum(result.score),
+            func.min(result.score),
+            func.max(result.score),
+            last_score,
+            func.max(result.submitted_at),
+        )
+        .join(models.Test, models.Test.id == result.test_id)
+        .where(*conditions)
+        .group_by(*keys)
+    )
+
+
+def _upsert_score_rollup(db: Session, model, key_names: Tuple[str, ...], source) -> None:
+    stmt = pg_insert(model).from_select([*key_names, *SCORE_ROLLUP_COLUMNS], source)
+    current, new = model.__table__.c, stmt.excluded
+    newer = or_(current.last_submitted_at.is_(None), new.last_submitted_at >= current.last_submitted_at)
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=list(key_names),
+        set_={
+            "result_count": current.result_count + new.result_count,
+            "score_sum": current.score_sum + new.score_sum,
+            "score_min": func.least(current.score_min, new.score_min),
+            "score_max": func.greatest(current.score_max, new.score_max),
+            "last_score": case((newer, new.last_score), else_=current.last_score),
+            "last_submitted_at": func.greatest(current.last_submitted_at, new.last_submitted_at),
+        },
+    ))
+
+
+def _add_score_rollups(db: Session, conditions) -> None:
+    result = models.TestResult
+    _upsert_score_rollup(
+        db,
+        models.StudentWordbookScore,
+        ("student_id", "wordbook_id"),
+        _score_rollup_source((result.student_id, models.Test.wordbook_id), conditions),
+    )
+    # 날짜는 DB 세션 시간대 기준이며, get_student_stats의 기간 집계도 같은 기준을 씁니다.
+    day = cast(result.submitted_at, Date)
+    _upsert_score_rollup(
+        db,
+        models.StudentDailyScore,
+        ("student_id", "day", "wordbook_id"),
+        _score_rollup_source((result.student_id, day, models.Test.wordbook_id), [*conditions, result.submitted_at.isnot(None)]),
+    )
+
+
+def update_score_rollups(db: Session, result_id: int) -> None:
+    """새로 저장한(flush된) 시험 결과 하나를 점수 누계에 더합니다. 커밋은 호출한 쪽에서 합니다."""
+    _add_score_rollups(db, [models.TestResult.id == result_id])
+
+
+def rebuild_score_rollups(
+    db: Session, batch_size: int = SCORE_ROLLUP_REBUILD_BATCH_SIZE, progress: Optional[Callable[[int], None]] = None
+) -> int:
+    """
+    test_results 전체 기록으로 점수 누계를 다시 만듭니다 (마이그레이션 후 초기화/복구용).
+    사용자 ID 순서로 batch_size명씩 기존 누계를 지우고 다시 집계하며, 배치마다 커밋합니다.
+    """
+    processed = 0
+    after = 0
+    while True:
+        student_ids = db.scalars(
+            select(models.User.id).where(models.User.id > after).order_by(models.User.id).limit(batch_size)
+        ).all()
+        if not student_ids:
+            break
+        for model in (models.StudentWordbookScore, models.StudentDailyScore):
+            db.execute(delete(model).where(model.student_id.in_(student_ids)))
+        _add_score_rollups(db, [models.TestResult.student_id.in_(student_ids)])
+        bump_user_versions(db, student_ids)
+        db.commit()
+        processed += len(student_ids)
+        if progress is not None:
+            progress(processed)
+        after = student_ids[-1]
+    leaderboard_cache.clear()
+    return processed
+
+# =================================================================
+# 리더보드 관련 CRUD
+# -----------------------------------------------------------------
+# 순위는 점수 누계(student_wordbook_scores)에서 RANK() OVER로 계산합니다.
+# 상위 LEADERBOARD_TOP_K명은 leaderboard_cache에 보관하고, 결과를 저장할 때마다 해당 학생의 점수만
+# 반영하므로 자주 조회되는 리더보드는 다시 순위를 매기지 않습니다.
+# =================================================================
+
+LEADERBOARD_SCOPES = ("wordbook", "class")
+
+
+def _leaderboard_scores(scope: str, scope_id: int, metric: str):
+    """
+    범위 안 학생별 (student_id, score, attempts) SELECT를 만듭니다.
+    wordbook은 해당 단어장에, class는 선생님(scope_id)의 단어장에 현재 할당된 학생의 누계만 집계합니다.
+    """
+    assoc = models.student_wordbook_association
+    scores = models.StudentWordbookScore
+    assigned = (assoc.c.student_id == scores.student_id) & (assoc.c.wordbook_id == scores.wordbook_id)
+    if scope == "wordbook":
+        score = scores.score_max if metric == "best" else scores.score_sum / scores.result_count
+        return (
+            select(scores.student_id, score.label("score"), scores.result_count.label("attempts"))
+            .join(assoc, assigned)
+            .where(scores.wordbook_id == scope_id)
+        )
+    if metric == "best":
+        score = func.max(scores.score_max)
+    else:
+        score = func.sum(scores.score_sum) / func.sum(scores.result_count)
+    return (
+        select(scores.student_id, score.label("score"), func.sum(scores.result_count).label("attempts"))
+        .join(assoc, assigned)
+        .join(models.Wordbook, (models.Wordbook.id == scores.wordbook_id) & (models.Wordbook.owner_id == scope_id))
+        .group_by(scores.student_id)
+    )
+
+
+def get_leaderboard(db: Session, scope: str, scope_id: int, metric: str, limit: int) -> List[Tuple[int, LeaderboardEntry]]:
+    """RANK() OVER로 순위를 매겨 상위 limit명의 (순위, 항목)을 반환합니다. 동점이면 이름, ID 순입니다."""
+    per_student = _leaderboard_scores(scope, scope_id, metric).subquery()
+    rank = func.rank().over(order_by=per_student.c.score.desc()).label("rank")
+    stmt = (
+        select(rank, per_student.c.student_id, models.User.name, per_student.c.score, per_student.c.attempts)
+        .join(models.User, models.User.id == per_student.c.student_id)
+        .order_by(rank, models.User.name, per_student.c.student_id)
+        .limit(limit)
+    )
+    return [
+        (row.rank, LeaderboardEntry(row.student_id, row.name, row.score, row.attempts))
+        for row in db.execute(stmt)
+    ]
+
+
+def get_cached_leaderboard(db: Session, scope: str, scope_id: int, metric: str, limit: int) -> List[Tuple[int, LeaderboardEntry]]:
+    """limit이 K 이하이면 캐시된 상위 K명에서 응답하고, 없으면 SQL로 만들어 캐시에 넣습니다."""
+    k = leaderboard_cache.k
+    if limit > k:
+        return get_leaderboard(db, scope, scope_id, metric, limit)
+    key = (scope, scope_id, metric)
+    ranked = leaderboard_cache.get(key, limit)
+    if ranked is not None:
+        return ranked
+    generation = leaderboard_cache.generation()
+    entries = [entry for _rank, entry in get_leaderboard(db, scope, scope_id, metric, k)]
+    top = TopK(k, entries, complete=len(entries) < k)
+    leaderboard_cache.put(key, top, generation)
+    return top.ranked(limit)
+
+
+def is_in_teacher_class(db: Session, teacher_id: int, student_id: int) -> bool:
+    """학생이 선생님의 단어장 중 하나 이상에 할당되어 있는지 확인합니다."""
+    assoc = models.student_wordbook_association
+    return bool(db.scalar(
+        select(
+            select(assoc.c.student_id)
+            .join(models.Wordbook, models.Wordbook.id == assoc.c.wordbook_id)
+            .where(assoc.c.student_id == student_id, models.Wordbook.owner_id == teacher_id)
+            .exists()
+        )
+    ))
+
+
+def update_cached_leaderboards(db: Session, student_id: int, test_id: int) -> None:
+    """
+    커밋된 시험 결과를 캐시된 리더보드(단어장, 단어장 소유자의 반)에 반영합니다.
+    이 워커에 캐시된 리더보드가 하나도 없으면 DB를 읽지 않습니다.
+    """
+    if not leaderboard_cache.note_write():
+        return
+    wordbook = db.execute(
+        select(models.Wordbook.id, models.Wordbook.owner_id)
+        .join(models.Test, models.Test.wordbook_id == models.Wordbook.id)
+        .where(models.Test.id == test_id)
+    ).first()
+    if wordbook is None:
+        return
+    for scope, scope_id in (("wordbook", wordbook.id), ("class", wordbook.owner_id)):
+        for metric in METRICS:
+            key = (scope, scope_id, metric)
+            if not leaderboard_cache.contains(key):
+                continue
+            per_student = _leaderboard_scores(scope, scope_id, metric).subquery()
+            row = db.execute(
+                select(per_student.c.score, per_student.c.attempts, models.User.name)
+                .join(models.User, models.User.id == per_student.c.student_id)
+                .where(per_student.c.student_id == student_id)
+            ).first()
+            if row is not None:
+                leaderboard_cache.update(key, LeaderboardEntry(student_id, row.name, row.score, row.attempts))
+
+
+def invalidate_leaderboards(wordbook_id: int, owner_id: Optional[int]) -> None:
+    """할당이 바뀌거나 단어장이 지워지면 해당 단어장과 소유자 반의 리더보드를 버립니다."""
+    keys = [("wordbook", wordbook_id, metric) for metric in METRICS]
+    if owner_id is not None:
+        keys += [("class", owner_id, metric) for metric in METRICS]
+    leaderboard_cache.invalidate(keys)
+
+
+# =================================================================
+# 간격 반복(SRS) 관련 CRUD
+# =================================================================
+
+WORD_MEMORY_RECOMPUTE_BATCH_SIZE = 10000
+
+def update_word_memories(
+    db: Session, student_id: int, outcomes: Iterable[grading.Outcome], reviewed_at: Optional[datetime] = None
+):
+    """
+    채점 결과로 학생의 단어별 기억 상태를 한꺼번에 갱신합니다 (커밋하지 않음).
+    기존 상태를 한 번에 읽고, 새 상태는 INSERT ... ON CONFLICT DO UPDATE 한 문장으로 저장합니다.
+    """
+    reviewed_at = reviewed_at or datetime.now(timezone.utc)
+    # 같은 단어가 여러 번 나오면 마지막 결과만 반영합니다.
+    results = {outcome.word_id: outcome.is_correct for outcome in outcomes if outcome.word_id is not None}
+    if not results:
+        return
+
+    existing = {
+        row.word_id: srs.MemoryState(row.ease, row.interval_days, row.repetitions, row.lapses)
+        for row in db.execute(
+            select(
+                models.WordMemory.word_id,
+                models.WordMemory.ease,
+                models.WordMemory.interval_days,
+                models.WordMemory.repetitions,
+                models.WordMemory.lapses,
+            ).where(
+                models.WordMemory.student_id == student_id,
+                models.WordMemory.word_id.in_(list(results)),
+            )
+        )
+    }
+    rows = []
+    for word_id, is_correct in results.items():
+        state = srs.review(existing.get(word_id), is_correct)
+        rows.append({
+            "student_id": student_id,
+            "word_id": word_id,
+            **state._asdict(),
+            "last_reviewed_at": reviewed_at,
+            "due_at": srs.due_at(reviewed_at, state.interval_days),
+        })
+
+    stmt = pg_insert(models.WordMemory).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[models.WordMemory.student_id, models.WordMemory.word_id],
+        set_={
+            column: stmt.excluded[column]
+            for column in ("ease", "interval_days", "repetitions", "lapses", "last_reviewed_at", "due_at")
+        },
+    )
+    db.execute(stmt)
+
+def get_due_words(
+    db: Session, student_id: int, wordbook_id: Optional[int] = None, limit: int = 50, now: Optional[datetime] = None
+) -> List[schemas.DueWord]:
+    """
+    복습 시각이 지난 단어를 오래 기다린 순서로 조회합니다.
+    (student_id, due_at) 인덱스의 범위 검색으로 처리되며, 지금도 할당된 단어장의 단어만 반환합니다.
+    """
+    assoc = models.student_wordbook_association
+    stmt = (
+        select(
+            models.Word.id.label("word_id"),
+            models.Word.wordbook_id,
+            models.Word.text,
+            models.Word.meaning,
+            models.Word.part_of_speech,
+            models.Word.example_sentence,
+            models.WordMemory.due_at,
+            models.WordMemory.repetitions,
+            models.WordMemory.lapses,
+        )
+        .join(models.Word, models.Word.id == models.WordMemory.word_id)
+        .join(assoc, (assoc.c.wordbook_id == models.Word.wordbook_id) & (assoc.c.student_id == student_id))
+        .where(
+            models.WordMemory.student_id == student_id,
+            models.WordMemory.due_at <= (now or func.now()),
+        )
+        .order_by(models.WordMemory.due_at)
+        .limit(limit)
+    )
+    if wordbook_id is not None:
+        stmt = stmt.where(models.Word.wordbook_id == wordbook_id)
+    return [schemas.DueWord.model_validate(row) for row in db.execute(stmt)]
+
+def recompute_word_memory_schedules(
+    db: Session, batch_size: int = WORD_MEMORY_RECOMPUTE_BATCH_SIZE, progress: Optional[Callable[[int], None]] = None
+) -> int:
+    """
+    모든 학생의 due_at을 현재 SRS 설정으로 다시 계산합니다 (야간 작업용).
+    기본 키 순서로 batch_size씩 읽어 numpy로 한 번에 계산하고, 배치마다 커밋합니다.
+    """
+    updated = 0
+    after: Optional[Tuple[int, int]] = None
+    while True:
+        stmt = (
+            select(
+                models.WordMemory.student_id,
+                models.WordMemory.word_id,
+                func.extract("epoch", models.WordMemory.last_reviewed_at).label("reviewed_at"),
+                models.WordMemory.interval_days,
+            )
+            .order_by(models.WordMemory.student_id, models.WordMemory.word_id)
+            .limit(batch_size)
+        )
+        if after is not None:
+            stmt = stmt.where(tuple_(models.WordMemory.student_id, models.WordMemory.word_id) > after)
+        rows = db.execute(stmt).all()
+        if not rows:
+            break
+
+        due_epochs = srs.recompute_due_at(
+            [float(row.reviewed_at) for row in rows], [row.interval_days for row in rows]
+        )
+        db.execute(
+            update(models.WordMemory),
+            [
+                {
+                    "student_id": row.student_id,
+                    "word_id": row.word_id,
+                    "due_at": datetime.fromtimestamp(float(epoch), tz=timezone.utc),
+                }
+                for row, epoch in zip(rows, due_epochs)
+            ],
+        )
+        db.commit()
+        updated += len(rows)
+        if progress is not None:
+            progress(updated)
+        after = (rows[-1].student_id, rows[-1].word_id)
+    return updated
+
+# =================================================================
+# 시험 세션 관련 CRUD
+# =================================================================
+
+def create_exam_session(
+    db: Session, wordbook_id: int, title: str, owner_id: int, shuffle_questions: bool, version
+) -> models.ExamSession:
+    """
+    시험지를 한 번 출제해 저장하고, 학생들이 결과를 제출할 공용 Test 기록을 함께 만듭니다.
+    """
+    bank = get_quiz_bank(db, wordbook_id=wordbook_id, version=version)
+    questions, answer_key = bank.generate_paper()
+    db_test = models.Test(title=title, wordbook_id=wordbook_id, creator_id=owner_id, answer_key=answer_key)
+    db.add(db_test)
+    db.flush()
+    db_session = models.ExamSession(
+        title=title,
+        wordbook_id=wordbook_id,
+        test_id=db_test.id,
+        owner_id=owner_id,
+        paper=[question.model_dump() for question in questions],
+        shuffle_questions=shuffle_questions,
+        seed=secrets.randbits(63),
+    )
+    db.add(db_session)
+    db.commit()
+    db.refresh(db_session)
+    exam_paper_cache.put(_exam_paper_from_row(db_session))
+    return db_session
+
+def get_exam_session_access(db: Session, session_id: int, user_id: int):
+    """
+    시험지 요청에 필요한 권한 정보만 한 번의 쿼리로 조회합니다. 시험지 본문은 읽지 않습니다.
+    (id, owner_id, is_assigned) 행 또는 None을 반환합니다.
+    """
+    assoc = models.student_wordbook_association
+    is_assigned = (
+        select(assoc.c.student_id)
+        .where(assoc.c.wordbook_id == models.ExamSession.wordbook_id, assoc.c.student_id == user_id)
+        .correlate(models.ExamSession)
+        .exists()
+    )
+    stmt = (
+        select(models.ExamSession.id, models.ExamSession.owner_id, is_assigned.label("is_assigned"))
+        .where(models.ExamSession.id == session_id)
+    )
+    return db.execute(stmt).first()
+
+def _exam_paper_from_row(db_session) -> ExamPaper:
+    return ExamPaper(
+        session_id=db_session.id,
+        test_id=db_session.test_id,
+        title=db_session.title,
+        questions=db_session.paper,
+        shuffle_questions=db_session.shuffle_questions,
+        seed=db_session.seed,
+    )
+
+def get_exam_paper(db: Session, session_id: int) -> Optional[ExamPaper]:
+    """캐시된 시험지를 반환하고, 없으면 저장된 시험지를 한 번 읽어 직렬화해 둡니다."""
+    paper = exam_paper_cache.get(session_id)
+    if paper is not None:
+        return paper
+    row = db.execute(
+        select(
+            models.ExamSession.id,
+            models.ExamSession.test_id,
+            models.ExamSession.title,
+            models.ExamSession.paper,
+            models.ExamSession.shuffle_questions,
+            models.ExamSession.seed,
+        ).where(models.ExamSession.id == session_id)
+    ).first()
+    if row is None:
+        return None
+    paper = _exam_paper_from_row(row)
+    exam_paper_cache.put(paper)
+    return paper
 
 # =================================================================
 # 학생 리포트 관련 CRUD
 # =================================================================
-def get_student_report(db: Session, student_id: int):
-    student = db.query(models.User).options(
-        subqueryload(models.User.assigned_wordbooks)
-        .subqueryload(models.Wordbook.tests)
-        .subqueryload(models.Test.results)
-    ).filter(models.User.id == student_id).first()
-
-    if not student:
+def get_student_report(db: Session, student_id: int, limit: Optional[int] = None):
+    """
+    학생에게 할당된 단어장별 평균 점수와 최근 시험 결과를 한 번의 쿼리로 조회합니다.
+    평균·개수는 점수 누계(student_wordbook_scores)에서 읽고, limit이 있으면 단어장마다 최근 limit개의 결과만 가져옵니다.
+    """
+    assoc = models.student_wordbook_association
+    scores = models.StudentWordbookScore
+    partition = models.Test.wordbook_id
+    ranked = (
+        select(
+            models.Test.wordbook_id,
+            models.TestResult.score,
+            models.TestResult.submitted_at,
+            func.row_number().over(
+                partition_by=partition,
+                order_by=(models.TestResult.submitted_at.desc(), models.TestResult.id.desc()),
+            ).label("position"),
+        )
+        .join(models.Test, models.Test.id == models.TestResult.test_id)
+        .where(models.TestResult.student_id == student_id)
+        .subquery("ranked")
+    )
+    ranked_on = ranked.c.wordbook_id == models.Wordbook.id
+    if limit is not None:
+        ranked_on &= ranked.c.position <= limit
+    stmt = (
+        select(
+            models.User.id.label("student_id"),
+            models.User.name.label("student_name"),
+            models.Wordbook.id.label("wordbook_id"),
+            models.Wordbook.title,
+            (scores.score_sum / scores.result_count).label("average_score"),
+            scores.result_count,
+            ranked.c.score,
+            ranked.c.submitted_at,
+        )
+        .outerjoin(assoc, assoc.c.student_id == models.User.id)
+        .outerjoin(models.Wordbook, models.Wordbook.id == assoc.c.wordbook_id)
+        .outerjoin(scores, (scores.student_id == models.User.id) & (scores.wordbook_id == models.Wordbook.id))
+        .outerjoin(ranked, ranked_on)
+        .where(models.User.id == student_id)
+        .order_by(models.Wordbook.id, ranked.c.position)
+    )
+    rows = db.execute(stmt).all()
+    if not rows:
         return None
 
     report = schemas.StudentReport(
-        student_id=student.id,
-        student_name=student.name,
+        student_id=rows[0].student_id,
+        student_name=rows[0].student_name,
         assigned_wordbooks_report=[]
     )
+    # 행은 단어장 ID, 최신순으로 정렬되어 있어 순서대로 묶기만 하면 됩니다.
+    wb_report = None
+    for row in rows:
+        if row.wordbook_id is None:
+            continue
+        if wb_report is None or wb_report.id != row.wordbook_id:
+            wb_report = schemas.WordbookReport(
+                id=row.wordbook_id,
+                title=row.title,
+                average_score=row.average_score,
+                result_count=row.result_count or 0,
+                test_results=[]
+            )
+            report.assigned_wordbooks_report.append(wb_report)
+        if row.score is not None:
+            wb_report.test_results.append(
+                schemas.TestResultForReport(score=row.score, submitted_at=row.submitted_at)
+            )
 
-    for wb in student.assigned_wordbooks:
-        all_results_for_wb = []
-        for test in wb.tests:
-            all_results_for_wb.extend(test.results)
-
-        student_results = [res for res in all_results_for_wb if res.student_id == student_id]
-        
-        avg_score = None
-        if student_results:
-            total_score = sum(res.score for res in student_results)
-            avg_score = total_score / len(student_results)
+    return report
 
-        sorted_results = sorted(student_results, key=lambda r: r.submitted_at, reverse=True)
+def get_class_report(
+    db: Session, teacher_id: int, after: Optional[Tuple[str, int]] = None, limit: int = 50
+) -> schemas.ClassReport:
+    """
+    선생님의 단어장에 할당된 학생 × 단어장 성적표를 점수 누계(student_wordbook_scores)에서 한 번의 쿼리로 만듭니다.
+    학생은 (name, id) 키셋 페이지네이션으로 limit명씩 가져오고, 결과는 열 단위(columnar)로 묶어 반환합니다.
+    """
+    assoc = models.student_wordbook_association
+    teacher_wordbooks = select(models.Wordbook.id).where(models.Wordbook.owner_id == teacher_id)
+    page_stmt = (
+        select(models.User.id, models.User.name, models.User.username)
+        .where(
+            models.User.role == models.UserRole.student,
+            select(assoc.c.student_id)
+            .where(assoc.c.student_id == models.User.id, assoc.c.wordbook_id.in_(teacher_wordbooks))
+            .exists(),
+        )
+        .order_by(models.User.name, models.User.id)
+        .limit(limit)
+    )
+    if after is not None:
+        page_stmt = page_stmt.where(tuple_(models.User.name, models.User.id) > tuple_(*after))
+    page = page_stmt.cte("page")
 
-        wb_report = schemas.WordbookReport(
-            id=wb.id,
-            title=wb.title,
-            average_score=avg_score,
-            test_results=[schemas.TestResultForReport.from_orm(res) for res in sorted_results]
+    # 칸마다 점수 누계 한 행만 읽으므로 결과 수와 무관하게 (학생, 단어장) 쌍 수에 비례합니다.
+    scores = models.StudentWordbookScore
+    stmt = (
+        select(
+            page.c.id.label("student_id"),
+            page.c.name,
+            page.c.username,
+            models.Wordbook.id.label("wordbook_id"),
+            models.Wordbook.title,
+            (scores.score_sum / scores.result_count).label("average_score"),
+            func.coalesce(scores.result_count, 0).label("attempts"),
+            scores.last_score,
+            scores.last_submitted_at.label("last_attempt_at"),
+        )
+        .join(assoc, assoc.c.student_id == page.c.id)
+        .join(
+            models.Wordbook,
+            (models.Wordbook.id == assoc.c.wordbook_id) & (models.Wordbook.owner_id == teacher_id),
+        )
+        .outerjoin(
+            scores,
+            (scores.student_id == page.c.id) & (scores.wordbook_id == models.Wordbook.id),
         )
-        report.assigned_wordbooks_report.append(wb_report)
+        .order_by(page.c.name, page.c.id, models.Wordbook.id)
+    )
 
+    report = schemas.ClassReport()
+    student_index, wordbook_index = {}, {}
+    for row in db.execute(stmt):
+        if row.student_id not in student_index:
+            student_index[row.student_id] = len(student_index)
+            report.students.id.append(row.student_id)
+            report.students.name.append(row.name)
+            report.students.username.append(row.username)
+        if row.wordbook_id not in wordbook_index:
+            wordbook_index[row.wordbook_id] = len(wordbook_index)
+            report.wordbooks.id.append(row.wordbook_id)
+            report.wordbooks.title.append(row.title)
+        cells = report.cells
+        cells.student_index.append(student_index[row.student_id])
+        cells.wordbook_index.append(wordbook_index[row.wordbook_id])
+        cells.average_score.append(row.average_score)
+        cells.attempts.append(row.attempts)
+        cells.last_score.append(row.last_score)
+        cells.last_attempt_at.append(row.last_attempt_at)
     return report
 
+EXPORT_BATCH_SIZE = 5000
+
+def iter_test_result_exports(
+    db: Session,
+    teacher_id: int,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    wordbook_id: Optional[int] = None,
+    batch_size: int = EXPORT_BATCH_SIZE,
+):
+    """
+    선생님 단어장의 시험 결과를 학생/단어장/시험 이름과 함께 batch_size행씩 묶어 돌려줍니다.
+    yield_per로 서버 측 커서에서 나누어 읽으므로 기록 전체를 메모리에 올리지 않습니다.
+    열 순서는 export.EXPORT_COLUMNS와 같고, date_from~date_to(포함)는 DB 세션 시간대 기준입니다.
+    """
+    stmt = (
+        select(
+            models.TestResult.id,
+            models.TestResult.submitted_at,
+            models.TestResult.score,
+            models.User.id,
+            models.User.username,
+            models.User.name,
+            models.Wordbook.id,
+            models.Wordbook.title,
+            models.Test.id,
+            models.Test.title,
+        )
+        .join(models.Test, models.Test.id == models.TestResult.test_id)
+        .join(models.Wordbook, models.Wordbook.id == models.Test.wordbook_id)
+        .join(models.User, models.User.id == models.TestResult.student_id)
+        .where(models.Wordbook.owner_id == teacher_id)
+        .order_by(models.TestResult.id)
+    )
+    if wordbook_id is not None:
+        stmt = stmt.where(models.Test.wordbook_id == wordbook_id)
+    if date_from is not None:
+        stmt = stmt.where(models.TestResult.submitted_at >= datetime.combine(date_from, time.min))
+    if date_to is not None:
+        stmt = stmt.where(models.TestResult.submitted_at < datetime.combine(date_to + timedelta(days=1), time.min))
+
+    result = db.execute(stmt.execution_options(yield_per=batch_size))
+    for rows in result.partitions():
+        yield rows
+
 # ✨ [신규] 학생 학습 통계 계산 함수
-def get_student_stats(db: Session, student_id: int) -> schemas.StudentStats:
+STATS_BUCKETS = ("day", "week", "month")
+
+
+def get_student_stats(
+    db: Session,
+    student_id: int,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    bucket: str = "day",
+    max_points: Optional[int] = None,
+) -> schemas.StudentStats:
     """
     특정 학생의 학습 통계 데이터를 계산합니다.
+    단어장별 평균과 기간(bucket)별 평균은 점수 누계 테이블에서 합산하며, date_from~date_to(포함) 범위의 결과만 봅니다.
+    기간별 점수가 max_points개보다 많으면 인접한 구간을 합쳐 줄입니다.
     """
-    # 학생의 모든 시험 결과를 날짜순으로 가져옵니다.
-    # Test, Wordbook 테이블과 JOIN하여 단어장 제목도 함께 가져옵니다.
-    results = db.query(models.TestResult).join(models.Test).join(models.Wordbook)\
-        .filter(models.TestResult.student_id == student_id)\
-        .order_by(models.TestResult.submitted_at)\
-        .options(selectinload(models.TestResult.test).selectinload(models.Test.wordbook))\
-        .all()
+    if bucket not in STATS_BUCKETS:
+        raise ValueError(f"bucket must be one of {STATS_BUCKETS}")
 
-    if not results:
-        return schemas.StudentStats(wordbook_stats=[], daily_scores=[])
-
-    # 1. 단어장별 평균 점수 계산
-    wordbook_scores = {}
-    for result in results:
-        title = result.test.wordbook.title
-        if title not in wordbook_scores:
-            wordbook_scores[title] = []
-        wordbook_scores[title].append(result.score)
-    
-    wordbook_stats = []
-    for title, scores in wordbook_scores.items():
-        avg = sum(scores) / len(scores)
-        wordbook_stats.append(schemas.WordbookStat(wordbook_title=title, average_score=avg))
-
-    # 2. 날짜별 점수 기록 생성
+    daily = models.StudentDailyScore
+    conditions = [daily.student_id == student_id]
+    if date_from is not None:
+        conditions.append(daily.day >= date_from)
+    if date_to is not None:
+        conditions.append(daily.day <= date_to)
+
+    # 1. 단어장별 평균 점수 계산 (기간 제한이 없으면 단어장별 누계를 그대로 씁니다)
+    if date_from is None and date_to is None:
+        scores = models.StudentWordbookScore
+        wordbook_stmt = (
+            select(models.Wordbook.title, (scores.score_sum / scores.result_count).label("average_score"))
+            .join(models.Wordbook, models.Wordbook.id == scores.wordbook_id)
+            .where(scores.student_id == student_id)
+            .order_by(scores.wordbook_id)
+        )
+    else:
+        wordbook_stmt = (
+            select(models.Wordbook.title, (func.sum(daily.score_sum) / func.sum(daily.result_count)).label("average_score"))
+            .join(models.Wordbook, models.Wordbook.id == daily.wordbook_id)
+            .where(*conditions)
+            .group_by(models.Wordbook.id, models.Wordbook.title)
+            .order_by(func.min(daily.day), models.Wordbook.id)
+        )
+    wordbook_stats = [
+        schemas.WordbookStat(wordbook_title=row.title, average_score=row.average_score)
+        for row in db.execute(wordbook_stmt)
+    ]
+
+    # 2. 기간별 평균 점수 (day는 DB 세션 시간대 기준 날짜입니다)
+    period = cast(func.date_trunc(bucket, daily.day), Date).label("period")
+    result_count = func.sum(daily.result_count)
+    period_rows = db.execute(
+        select(
+            period,
+            (func.sum(daily.score_sum) / result_count).label("score"),
+            result_count.label("result_count"),
+        )
+        .where(*conditions)
+        .group_by(period)
+        .order_by(period)
+    ).all()
     daily_scores = [
-        schemas.DailyScore(date=result.submitted_at.date(), score=result.score)
-        for result in results
+        schemas.DailyScore(date=row.period, score=row.score, result_count=row.result_count) for row in period_rows
     ]
+    if max_points is not None:
+        daily_scores = downsample_scores(daily_scores, max_points)
 
     return schemas.StudentStats(
         wordbook_stats=wordbook_stats,
         daily_scores=daily_scores
-    )
\ No newline at end of file
+    )
+
+
+def downsample_scores(scores: List[schemas.DailyScore], max_points: int) -> List[schemas.DailyScore]:
+    """
+    인접한 구간을 같은 개수씩 묶어 max_points개 이하로 줄입니다.
+    묶은 점은 첫 구간의 날짜를 쓰고, 점수는 결과 수로 가중 평균해 전체 평균이 바뀌지 않게 합니다.
+    """
+    if max_points < 1 or len(scores) <= max_points:
+        return scores
+    group_size = -(-len(scores) // max_points)
+    downsampled = []
+    for start in range(0, len(scores), group_size):
+        group = scores[start:start + group_size]
+        count = sum(point.result_count for point in group)
+        downsampled.append(schemas.DailyScore(
+            date=group[0].date,
+            score=sum(point.score * point.result_count for point in group) / count,
+            result_count=count,
+        ))
+    return downsampled
\ No newline at end of file
@@ -0,0 +1,44 @@
+# backend/app/crud_async.py
+
+import functools
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from . import crud
+
+# =================================================================
+# crud.py 함수의 비동기 버전
+# -----------------------------------------------------------------
+# 동기 crud 함수를 AsyncSession.run_sync()로 실행합니다. 쿼리는 asyncpg 연결에서
+# greenlet을 통해 비동기로 수행되므로, 쿼리 로직을 두 벌로 관리할 필요가 없습니다.
+# =================================================================
+
+def _run_sync(fn):
+    @functools.wraps(fn)
+    async def wrapper(db: AsyncSession, *args, **kwargs):
+        return await db.run_sync(fn, *args, **kwargs)
+    return wrapper
+
+# api_async.py와 security.py에서 쓰는 함수만 감쌉니다. async 엔드포인트를 추가할 때 필요한 함수를 여기에 더합니다.
+
+# 단어장
+get_wordbook = _run_sync(crud.get_wordbook)
+get_wordbook_summaries_for_student = _run_sync(crud.get_wordbook_summaries_for_student)
+
+# 데이터 버전(ETag)
+get_user_data_version = _run_sync(crud.get_user_data_version)
+get_wordbook_version_meta = _run_sync(crud.get_wordbook_version_meta)
+
+# 사용자
+get_user_by_username = _run_sync(crud.get_user_by_username)
+get_user_token_version = _run_sync(crud.get_user_token_version)
+get_all_students = _run_sync(crud.get_all_students)
+
+# 시험
+get_wordbook_quiz_meta = _run_sync(crud.get_wordbook_quiz_meta)
+get_quiz_bank = _run_sync(crud.get_quiz_bank)
+
+# 리포트/통계
+get_student_report = _run_sync(crud.get_student_report)
+get_class_report = _run_sync(crud.get_class_report)
+get_student_stats = _run_sync(crud.get_student_stats)
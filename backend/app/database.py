@@ -1,15 +1,119 @@
 # backend/app/database.py
 
-from sqlalchemy import create_engine
+import threading
+import time
+from collections import deque
+
+from sqlalchemy import create_engine, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 # ✨ config.py에서 DATABASE_URL을 가져옵니다.
 from .config import settings
 
+# ===================================================================
+# 커넥션 풀 계측
+# ===================================================================
+class PoolMetrics:
+    """커넥션 체크아웃 대기 시간, 사용 중 연결 수, overflow 발생 횟수를 기록합니다."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.pool = None
+        self._lock = threading.Lock()
+        self._waits: deque = deque(maxlen=2048)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.overflow_connections = 0
+        self.max_wait = 0.0
+        self.peak_checked_out = 0
+
+    def record_checkout(self, pool, wait: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self._waits.append(wait)
+            self.max_wait = max(self.max_wait, wait)
+            self.peak_checked_out = max(self.peak_checked_out, pool.checkedout())
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def record_overflow(self) -> None:
+        with self._lock:
+            self.overflow_connections += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            waits = sorted(self._waits)
+            stats = {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "overflow_connections": self.overflow_connections,
+                "peak_checked_out": self.peak_checked_out,
+                "checkout_wait_ms_max": round(self.max_wait * 1000, 2),
+            }
+        if waits:
+            stats["checkout_wait_ms_avg"] = round(sum(waits) / len(waits) * 1000, 2)
+            p99 = waits[min(len(waits) - 1, int(len(waits) * 0.99))]
+            stats["checkout_wait_ms_p99"] = round(p99 * 1000, 2)
+        if self.pool is not None:
+            stats.update({
+                "pool_size": self.pool.size(),
+                "checked_out": self.pool.checkedout(),
+                "checked_in": self.pool.checkedin(),
+                "overflow": self.pool.overflow(),
+            })
+        return stats
+
+
+def _instrumented_pool_class(base, metrics: PoolMetrics):
+    """
+    체크아웃 시간을 재는 풀 클래스를 만듭니다.
+    engine.dispose() 시 pool.recreate()가 같은 클래스를 다시 만들므로 계측이 유지됩니다.
+    """
+    class InstrumentedPool(base):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            metrics.pool = self
+
+        def connect(self):
+            started = time.perf_counter()
+            try:
+                connection = super().connect()
+            except exc.TimeoutError:
+                metrics.record_timeout()
+                raise
+            metrics.record_checkout(self, time.perf_counter() - started)
+            return connection
+
+        def _create_connection(self):
+            record = super()._create_connection()
+            # pool_size를 넘어 새로 만든 연결이면 overflow로 기록합니다.
+            if self.overflow() > 0:
+                metrics.record_overflow()
+            return record
+
+    return InstrumentedPool
+
+
+def _pool_options(base, metrics: PoolMetrics) -> dict:
+    return {
+        "poolclass": _instrumented_pool_class(base, metrics),
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+pool_metrics = {"primary": PoolMetrics("primary")}
+
 # ✨ 비동기(asyncio)가 아닌, 일반 동기 엔진을 생성합니다.
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+engine = create_engine(SQLALCHEMY_DATABASE_URL, **_pool_options(QueuePool, pool_metrics["primary"]))
 
 # ✨ 동기 세션을 위한 SessionLocal을 생성합니다.
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -23,3 +127,111 @@ def get_db():
         yield db
     finally:
         db.close()
+
+# ===================================================================
+# 읽기 전용 복제본 - DATABASE_REPLICA_URL이 없으면 기본 엔진을 그대로 사용합니다.
+# ===================================================================
+if settings.DATABASE_REPLICA_URL:
+    pool_metrics["replica"] = PoolMetrics("replica")
+    read_engine = create_engine(settings.DATABASE_REPLICA_URL, **_pool_options(QueuePool, pool_metrics["replica"]))
+else:
+    read_engine = engine
+
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+
+class RecentWriters:
+    """
+    최근에 쓰기 요청을 보낸 사용자를 기억합니다 (read-your-writes).
+    기록된 사용자의 읽기는 복제 지연이 지나갈 때까지 기본 DB로 보냅니다.
+    """
+
+    def __init__(self, window_seconds: float, max_entries: int = 100000):
+        self.window_seconds = window_seconds
+        self.max_entries = max_entries
+        self._until: dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def mark(self, user_id: int) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if len(self._until) >= self.max_entries:
+                for uid in [uid for uid, until in self._until.items() if until <= now]:
+                    del self._until[uid]
+            self._until[user_id] = now + self.window_seconds
+
+    def wrote_recently(self, user_id: int) -> bool:
+        with self._lock:
+            until = self._until.get(user_id)
+        return until is not None and until > time.monotonic()
+
+
+recent_writers = RecentWriters(settings.READ_YOUR_WRITES_SECONDS)
+
+def read_session(user_id: int | None = None):
+    """복제본 세션을 제공합니다. 방금 쓰기를 한 사용자라면 기본 DB 세션을 제공합니다."""
+    use_primary = read_engine is engine or (user_id is not None and recent_writers.wrote_recently(user_id))
+    db = SessionLocal() if use_primary else ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+# ✨ 복제본 세션을 제공하는 get_read_db 의존성 함수
+def get_read_db():
+    yield from read_session()
+
+# ===================================================================
+# 비동기(asyncpg) 엔진 - settings.DB_ASYNC_MODE가 켜져 있을 때만 생성합니다.
+# ===================================================================
+def to_async_database_url(url: str) -> str:
+    """seed.py/alembic과 같은 방식으로 URL의 드라이버를 asyncpg로 바꿉니다."""
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return url.replace(prefix, "postgresql+asyncpg://", 1)
+    return url
+
+async_engine = None
+AsyncSessionLocal = None
+async_read_engine = None
+AsyncReadSessionLocal = None
+if settings.DB_ASYNC_MODE:
+    pool_metrics["async"] = PoolMetrics("async")
+    async_engine = create_async_engine(
+        to_async_database_url(SQLALCHEMY_DATABASE_URL),
+        **_pool_options(AsyncAdaptedQueuePool, pool_metrics["async"]),
+    )
+    # 응답 직렬화 시 추가 지연 로딩이 일어나지 않도록 커밋 후에도 속성을 유지합니다.
+    AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+    # 동기 엔진과 마찬가지로 복제본이 설정되어 있으면 async 읽기도 복제본으로 보냅니다.
+    if settings.DATABASE_REPLICA_URL:
+        pool_metrics["async_replica"] = PoolMetrics("async_replica")
+        async_read_engine = create_async_engine(
+            to_async_database_url(settings.DATABASE_REPLICA_URL),
+            **_pool_options(AsyncAdaptedQueuePool, pool_metrics["async_replica"]),
+        )
+    else:
+        async_read_engine = async_engine
+    AsyncReadSessionLocal = async_sessionmaker(
+        async_read_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+    )
+
+# ✨ 비동기 세션을 제공하는 get_async_db 의존성 함수
+async def get_async_db():
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async database mode is disabled (set DB_ASYNC_MODE=true)")
+    async with AsyncSessionLocal() as db:
+        yield db
+
+async def async_read_session(user_id: int | None = None):
+    """read_session의 async 버전입니다. 방금 쓰기를 한 사용자라면 기본 DB 세션을 제공합니다."""
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async database mode is disabled (set DB_ASYNC_MODE=true)")
+    use_primary = async_read_engine is async_engine or (user_id is not None and recent_writers.wrote_recently(user_id))
+    session_factory = AsyncSessionLocal if use_primary else AsyncReadSessionLocal
+    async with session_factory() as db:
+        yield db
+
+def get_pool_stats() -> dict:
+    """엔진별 커넥션 풀 지표를 반환합니다."""
+    return {name: metrics.snapshot() for name, metrics in pool_metrics.items()}
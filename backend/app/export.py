@@ -0,0 +1,152 @@
+# backend/app/export.py
+
+import csv
+import io
+from typing import Iterable, Iterator, Sequence
+
+# =================================================================
+# 시험 결과 내보내기 (CSV / Arrow / Parquet 스트리밍)
+# -----------------------------------------------------------------
+# crud.iter_test_result_exports가 넘겨주는 행 묶음(partition)을 받은 즉시 바이트로 바꿔 내보냅니다.
+# 전체 기록을 메모리에 모으지 않으므로 기록이 많아도 메모리 사용량이 일정합니다.
+# =================================================================
+
+EXPORT_COLUMNS = (
+    "result_id",
+    "submitted_at",
+    "score",
+    "student_id",
+    "username",
+    "student_name",
+    "wordbook_id",
+    "wordbook_title",
+    "test_id",
+    "test_title",
+)
+
+EXPORT_FORMATS = {
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "arrow": ("application/vnd.apache.arrow.stream", "arrows"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+
+class UnsupportedExport(Exception):
+    """요청한 형식으로 내보낼 수 없을 때 (필요한 패키지가 없는 경우 등) 발생합니다."""
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise UnsupportedExport("Arrow and Parquet exports require the pyarrow package")
+    return pyarrow
+
+
+def check_format(export_format: str) -> None:
+    """스트리밍을 시작하기 전에 형식을 처리할 수 있는지 확인합니다."""
+    if export_format not in EXPORT_FORMATS:
+        raise UnsupportedExport(f"Unknown export format: {export_format}")
+    if export_format != "csv":
+        _require_pyarrow()
+
+
+def iter_csv_chunks(partitions: Iterable[Sequence]) -> Iterator[bytes]:
+    """
+    행 묶음마다 CSV 조각 하나를 만듭니다.
+    엑셀에서 한글이 깨지지 않도록 UTF-8 BOM과 헤더를 첫 조각에 넣습니다.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write("\ufeff")
+    writer.writerow(EXPORT_COLUMNS)
+    yield buffer.getvalue().encode("utf-8")
+    for rows in partitions:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(rows)
+        yield buffer.getvalue().encode("utf-8")
+
+
+class _ChunkSink:
+    """pyarrow 기록기가 쓴 바이트를 모아 두었다가 꺼내 가는 쓰기 전용 파일 객체입니다."""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _arrow_schema(pa):
+    return pa.schema([
+        ("result_id", pa.int64()),
+        ("submitted_at", pa.timestamp("us", tz="UTC")),
+        ("score", pa.float64()),
+        ("student_id", pa.int64()),
+        ("username", pa.string()),
+        ("student_name", pa.string()),
+        ("wordbook_id", pa.int64()),
+        ("wordbook_title", pa.string()),
+        ("test_id", pa.int64()),
+        ("test_title", pa.string()),
+    ])
+
+
+def iter_arrow_chunks(partitions: Iterable[Sequence], export_format: str) -> Iterator[bytes]:
+    """
+    행 묶음마다 Arrow 레코드 배치 하나(Parquet이면 row group 하나)를 써서 내보냅니다.
+    Arrow는 IPC 스트림 형식이라 받는 쪽도 배치 단위로 읽을 수 있습니다.
+    """
+    pa = _require_pyarrow()
+    schema = _arrow_schema(pa)
+    sink = _ChunkSink()
+    output = pa.PythonFile(sink, mode="w")
+    if export_format == "parquet":
+        import pyarrow.parquet as pq
+        writer = pq.ParquetWriter(output, schema)
+    else:
+        writer = pa.ipc.new_stream(output, schema)
+    try:
+        for rows in partitions:
+            columns = list(zip(*rows)) if rows else [[] for _ in EXPORT_COLUMNS]
+            writer.write_batch(pa.RecordBatch.from_arrays(
+                [pa.array(values, type=field.type) for values, field in zip(columns, schema)], schema=schema
+            ))
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def iter_export_chunks(partitions: Iterable[Sequence], export_format: str) -> Iterator[bytes]:
+    if export_format == "csv":
+        return iter_csv_chunks(partitions)
+    return iter_arrow_chunks(partitions, export_format)
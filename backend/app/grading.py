@@ -0,0 +1,190 @@
+# backend/app/grading.py
+
+import re
+import unicodedata
+from typing import FrozenSet, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+# =================================================================
+# 서버 채점
+# =================================================================
+
+# 정규화에 쓰는 정규식은 모듈을 불러올 때 한 번만 컴파일합니다.
+_WHITESPACE = re.compile(r"\s+")
+# 괄호 안의 보충 설명 (예: "사과 (과일)")
+_PARENTHETICAL = re.compile(r"\([^)]*\)|\[[^\]]*\]")
+# 앞뒤의 문장 부호와 따옴표
+_EDGE_PUNCTUATION = re.compile(r"^[\s\"'‘’“”.,!?~·…-]+|[\s\"'‘’“”.,!?~·…-]+$")
+# 한 칸에 여러 정답을 적은 경우의 구분자 (예: "사과, 사과나무")
+_ALTERNATIVE_SEPARATORS = re.compile(r"\s*[,;/]\s*")
+# 답안의 어절 끝에 붙여도 정답으로 인정하는 한국어 조사
+_KOREAN_PARTICLES = frozenset(
+    ["은", "는", "이", "가", "을", "를", "의", "에", "에서", "에게", "으로", "로", "와", "과", "도", "만", "이다", "다"]
+)
+
+
+def normalize(text: Optional[str]) -> str:
+    """대소문자, 공백, 유니코드 조합형 차이, 괄호 설명, 앞뒤 문장 부호를 무시하도록 정규화합니다."""
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFC", text).casefold()
+    text = _PARENTHETICAL.sub(" ", text)
+    text = _EDGE_PUNCTUATION.sub("", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def _is_word_with_particle(given: str, accepted: str) -> bool:
+    # 정답 어절이 두 글자 이상인 한글 단어일 때만 조사를 인정해 "나" → "나이" 같은 다른 단어를 막습니다.
+    return (
+        len(accepted) >= 2
+        and "가" <= accepted[-1] <= "힣"
+        and given.startswith(accepted)
+        and given[len(accepted):] in _KOREAN_PARTICLES
+    )
+
+
+def matches_with_particles(given: str, accepted: str) -> bool:
+    """
+    정규화된 답안이 정규화된 정답의 어절마다 조사만 덧붙인 표기인지 확인합니다 (예: "사과를 먹다" → "사과 먹다").
+    조사를 뗀 나머지가 정답 어절과 정확히 같아야 하므로, 정답에서 글자를 뺀 "고양"은 "고양이"로 인정하지 않습니다.
+    """
+    given_words, accepted_words = given.split(" "), accepted.split(" ")
+    if len(given_words) != len(accepted_words):
+        return False
+    return all(
+        g == a or _is_word_with_particle(g, a)
+        for g, a in zip(given_words, accepted_words)
+    )
+
+
+def variants(answer: str) -> FrozenSet[str]:
+    """정답 하나에서 허용할 정규화된 표기들을 만듭니다. 조사는 정답이 아니라 답안 쪽에서만 처리합니다."""
+    normalized = normalize(answer)
+    alternatives = {normalized}
+    alternatives.update(part for part in _ALTERNATIVE_SEPARATORS.split(normalized) if part)
+    return frozenset(alt for alt in alternatives if alt)
+
+
+def allowed_distance(answer: str) -> int:
+    """정답 길이에 따라 허용할 오타 수 (짧은 단어는 오타를 허용하지 않습니다)."""
+    if len(answer) <= 3:
+        return 0
+    if len(answer) <= 7:
+        return 1
+    return 2
+
+
+def within_distance(a: str, b: str, max_distance: int) -> bool:
+    """
+    두 문자열의 편집 거리(Levenshtein)가 max_distance 이하인지 확인합니다.
+    대각선 주변 폭 max_distance의 띠만 계산하고, 한 행의 최솟값이 한도를 넘으면 바로 중단합니다.
+    """
+    if a == b:
+        return True
+    if abs(len(a) - len(b)) > max_distance:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+    too_far = max_distance + 1
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        lo = max(1, i - max_distance)
+        hi = min(len(b), i + max_distance)
+        current = [too_far] * (len(b) + 1)
+        current[0] = i if i <= max_distance else too_far
+        row_min = current[0]
+        for j in range(lo, hi + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return False
+        previous = current
+    return previous[len(b)] <= max_distance
+
+
+class _CompiledQuestion(NamedTuple):
+    type: str
+    answer: str
+    word_id: Optional[int]
+    accepted: FrozenSet[str]
+    # 오타를 허용할 (정규화된 표기, 허용 오타 수) 목록. 정답마다 길이에 따라 한도가 다릅니다.
+    fuzzy: Tuple[Tuple[str, int], ...]
+
+
+class Outcome(NamedTuple):
+    question_id: int
+    word_id: Optional[int]
+    is_correct: bool
+    given_answer: Optional[str]
+    correct_answer: str
+
+
+class AnswerKey:
+    """
+    Test.answer_key(quiz.QuizBank.generate_paper가 만든 정답표)를 채점용으로 미리 정규화해 둔 것입니다.
+    항목의 answers(동의어 등 인정하는 정답 전체)가 있으면 그중 하나와 맞으면 정답이고,
+    없으면(이전 정답표) answer 하나만 비교합니다.
+    객관식은 보기 문자열과 정확히 일치해야 하고, 주관식은 정규화된 표기 또는 허용 오타 이내면 정답입니다.
+    """
+
+    def __init__(self, answer_key: Sequence[Mapping]):
+        self._questions: List[_CompiledQuestion] = []
+        for entry in answer_key:
+            answer = entry["answer"]
+            answers = entry.get("answers") or [answer]
+            if entry["type"] == "multiple_choice":
+                accepted, fuzzy = frozenset(answers), ()
+            else:
+                accepted, fuzzy = set(), {}
+                for text in answers:
+                    text_variants = variants(text)
+                    accepted |= text_variants
+                    max_distance = allowed_distance(normalize(text))
+                    if max_distance:
+                        for variant in text_variants:
+                            fuzzy[variant] = max(fuzzy.get(variant, 0), max_distance)
+                accepted, fuzzy = frozenset(accepted), tuple(fuzzy.items())
+            self._questions.append(
+                _CompiledQuestion(entry["type"], answer, entry.get("word_id"), accepted, fuzzy)
+            )
+
+    def __len__(self) -> int:
+        return len(self._questions)
+
+    def grade(self, answers: Mapping[int, Optional[str]]) -> List[Outcome]:
+        """문제 ID → 답안 매핑을 한 번에 채점합니다. 답하지 않은 문제는 오답입니다."""
+        outcomes = []
+        for question_id, question in enumerate(self._questions):
+            given = answers.get(question_id)
+            outcomes.append(Outcome(
+                question_id=question_id,
+                word_id=question.word_id,
+                is_correct=given is not None and self._is_correct(question, given),
+                given_answer=given,
+                correct_answer=question.answer,
+            ))
+        return outcomes
+
+    @staticmethod
+    def _is_correct(question: _CompiledQuestion, given: str) -> bool:
+        if question.type == "multiple_choice":
+            return given in question.accepted
+        normalized = normalize(given)
+        if normalized in question.accepted:
+            return True
+        if any(matches_with_particles(normalized, accepted) for accepted in question.accepted):
+            return True
+        # 오타는 조사를 붙이지 않은 답안에만 허용해, 조사와 오타가 겹쳐 다른 단어가 정답이 되지 않게 합니다.
+        return any(
+            within_distance(normalized, accepted, max_distance)
+            for accepted, max_distance in question.fuzzy
+        )
+
+
+def score(outcomes: Sequence[Outcome]) -> float:
+    """정답 비율을 0~100 점수로 환산합니다."""
+    if not outcomes:
+        return 0.0
+    return sum(outcome.is_correct for outcome in outcomes) / len(outcomes) * 100
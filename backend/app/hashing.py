@@ -0,0 +1,171 @@
+# backend/app/hashing.py
+
+import multiprocessing
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Optional
+
+from passlib.context import CryptContext
+
+# 이 모듈은 spawn된 작업 프로세스에서도 import 되므로
+# config/database 같은 무거운 모듈을 import 하지 않습니다.
+
+
+class HashingOverloaded(Exception):
+    """해싱 대기열이 가득 차서 요청을 받을 수 없을 때 발생합니다."""
+
+    def __init__(self, retry_after: int):
+        super().__init__("Password hashing queue is full")
+        self.retry_after = retry_after
+
+
+@lru_cache(maxsize=None)
+def _context(rounds: int) -> CryptContext:
+    # min/max rounds를 설정값과 같게 두어, 비용이 바뀌면 needs_update가 True가 되도록 합니다.
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
+
+
+def _hash(password: str, rounds: int) -> str:
+    return _context(rounds).hash(password)
+
+
+def _verify_and_update(password: str, hashed_password: str, rounds: int) -> tuple[bool, Optional[str]]:
+    return _context(rounds).verify_and_update(password, hashed_password)
+
+
+class HashingPool:
+    """
+    bcrypt 해싱/검증 전용 프로세스 풀입니다.
+
+    동시에 처리(실행 + 대기)할 수 있는 작업 수를 workers + queue_limit으로 제한하고,
+    이를 넘는 요청은 기다리지 않고 HashingOverloaded를 발생시킵니다.
+    workers가 0이면 풀 없이 호출한 스레드에서 바로 실행합니다.
+    """
+
+    def __init__(self, workers: int, queue_limit: int, rounds: int, retry_after: int = 1):
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.rounds = rounds
+        self.retry_after = retry_after
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots = threading.BoundedSemaphore(max(1, workers + queue_limit))
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._latencies: deque = deque(maxlen=1024)
+
+    def hash(self, password: str) -> str:
+        return self._run(_hash, password, self.rounds)
+
+    def hash_many(self, passwords: list[str]) -> list[str]:
+        """
+        여러 비밀번호를 작업 프로세스들에 나누어 병렬로 해싱합니다.
+        시작할 때 한 번에 실행할 작업 수(작업 프로세스 수, 비밀번호가 더 적으면 그 수)만큼 자리를 잡아 끝까지 유지합니다.
+        자리가 모자라면 해싱을 시작하기 전에 HashingOverloaded가 발생하므로, 도중에 실패해 끝낸 작업을 버리지 않습니다.
+        """
+        if not passwords:
+            return []
+        slots = min(len(passwords), max(1, self.workers))
+        self._admit(slots)
+        hashed = []
+        try:
+            # 잡은 자리 수만큼씩 나누어 제출해, 로그인 같은 단건 요청이 뒤로 밀리지 않도록 합니다.
+            for i in range(0, len(passwords), slots):
+                chunk = passwords[i:i + slots]
+                started = time.perf_counter()
+                if self.workers <= 0:
+                    hashed.extend(_hash(password, self.rounds) for password in chunk)
+                else:
+                    executor = self._get_executor()
+                    futures = [executor.submit(_hash, password, self.rounds) for password in chunk]
+                    hashed.extend(future.result() for future in futures)
+                self._record_completed(started, len(chunk))
+        finally:
+            self._release_slots(slots)
+        return hashed
+
+    def verify_and_update(self, password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+        """검증 결과와, 현재 설정으로 다시 해싱해야 하면 새 해시를 함께 반환합니다."""
+        return self._run(_verify_and_update, password, hashed_password, self.rounds)
+
+    def stats(self) -> dict:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            in_flight = self._in_flight
+            stats = {
+                "workers": self.workers,
+                "queue_limit": self.queue_limit,
+                "bcrypt_rounds": self.rounds,
+                "in_flight": in_flight,
+                "queue_depth": max(0, in_flight - self.workers),
+                "completed": self._completed,
+                "rejected": self._rejected,
+            }
+        if latencies:
+            stats["latency_ms_avg"] = round(sum(latencies) / len(latencies) * 1000, 2)
+            p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+            stats["latency_ms_p95"] = round(p95 * 1000, 2)
+        return stats
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # uvicorn 스레드가 있는 프로세스에서 fork 하지 않도록 spawn을 사용합니다.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _admit(self, count: int = 1) -> None:
+        """작업 count개의 자리를 한꺼번에 잡습니다. 모두 잡을 수 없으면 잡은 자리를 돌려주고 거부합니다."""
+        acquired = 0
+        while acquired < count and self._slots.acquire(blocking=False):
+            acquired += 1
+        if acquired < count:
+            for _ in range(acquired):
+                self._slots.release()
+            with self._lock:
+                self._rejected += 1
+            raise HashingOverloaded(retry_after=self.retry_after)
+        with self._lock:
+            self._in_flight += count
+
+    def _record_completed(self, started: float, count: int = 1) -> None:
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._completed += count
+            self._latencies.extend([elapsed] * count)
+
+    def _release_slots(self, count: int = 1) -> None:
+        with self._lock:
+            self._in_flight -= count
+        for _ in range(count):
+            self._slots.release()
+
+    def _run(self, fn, *args):
+        self._admit()
+        started = time.perf_counter()
+        try:
+            if self.workers <= 0:
+                return fn(*args)
+            return self._get_executor().submit(fn, *args).result()
+        finally:
+            self._record_completed(started)
+            self._release_slots()
@@ -0,0 +1,77 @@
+# backend/app/http_cache.py
+
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response, status
+
+# =================================================================
+# ETag / 조건부 GET 유틸리티
+# =================================================================
+
+# 브라우저가 항상 재검증(If-None-Match)하도록 하되, 공유 캐시에는 저장하지 않습니다.
+CACHE_CONTROL = "private, no-cache"
+
+
+def etag_for_bytes(body: bytes) -> str:
+    """응답 본문 내용으로 강한(strong) ETag를 만듭니다."""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+# 버전 기반 ETag에 섞는 값입니다. 응답 형식을 바꾸면 올려서 이전 ETag가 304로 응답되지 않게 합니다.
+VERSION_ETAG_REVISION = "1"
+
+
+def etag_for_version(*parts) -> str:
+    """
+    엔터티 버전 카운터와 요청 파라미터로 강한 ETag를 만듭니다.
+    본문을 만들기 전에 계산할 수 있으므로, 변경이 없으면 무거운 조회 없이 304로 응답할 수 있습니다.
+    """
+    raw = "|".join(str(part) for part in (VERSION_ETAG_REVISION, *parts))
+    return '"' + hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더에 주어진 ETag가 포함되어 있는지 확인합니다."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = [value.strip() for value in header.split(",")]
+    # 약한 비교: W/ 접두사는 무시합니다.
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def not_modified(etag: str, headers: Optional[dict] = None) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL, **(headers or {})},
+    )
+
+
+def json_response_with_etag(request: Request, body: bytes, headers: Optional[dict] = None) -> Response:
+    """
+    직렬화된 JSON 본문에 ETag를 붙여 반환합니다.
+    클라이언트가 같은 ETag를 보냈다면 본문 없이 304를 반환합니다.
+    """
+    etag = etag_for_bytes(body)
+    if etag_matches(request, etag):
+        return not_modified(etag, headers)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL, **(headers or {})},
+    )
+
+
+def check_not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """
+    If-None-Match가 etag와 같으면 304 응답을 돌려줍니다.
+    아니면 None을 돌려주고, 이어서 만들 응답(response)에 ETag 헤더를 붙여 둡니다.
+    """
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return None
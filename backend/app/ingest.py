@@ -0,0 +1,149 @@
+# backend/app/ingest.py
+
+import codecs
+import csv
+import io
+import zipfile
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+# =================================================================
+# 업로드 파일 파싱 유틸리티
+# =================================================================
+
+STUDENT_CSV_COLUMNS = ["username", "name", "password"]
+
+
+class StudentCsvReader:
+    """
+    학생 일괄 등록용 CSV를 받는 대로 feed()하면 완성된 행(dict)부터 돌려줍니다.
+    본문 전체를 모으지 않고도 행 수를 셀 수 있도록, 따옴표가 닫히지 않은 줄만 다음 줄과 이어 읽습니다.
+    첫 행에 username 헤더가 있으면 헤더 기준으로, 없으면 username,name,password 순서로 읽습니다.
+    """
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        # 줄바꿈이 아직 오지 않은 마지막 줄
+        self._partial_line = ""
+        # 따옴표 안에서 줄이 바뀌어 아직 끝나지 않은 행
+        self._record = ""
+        self._columns: Optional[List[str]] = None
+
+    def feed(self, data: bytes, final: bool = False) -> List[Dict[str, str]]:
+        """data를 이어 읽고 새로 완성된 행을 돌려줍니다. final=True이면 남은 내용을 모두 행으로 만듭니다."""
+        text = self._partial_line + self._decoder.decode(data, final)
+        lines = io.StringIO(text, newline="").readlines()
+        self._partial_line = ""
+        if lines and not final and not lines[-1].endswith(("\n", "\r")):
+            self._partial_line = lines.pop()
+
+        students = []
+        for line in lines:
+            self._record += line
+            # 따옴표 개수가 홀수이면 따옴표 안의 줄바꿈이므로 다음 줄까지 이어 읽습니다 ("" 이스케이프는 짝수).
+            if self._record.count('"') % 2:
+                continue
+            students.extend(self._parse_record())
+        if final and self._record:
+            students.extend(self._parse_record())
+        return students
+
+    def _parse_record(self) -> List[Dict[str, str]]:
+        row = next(csv.reader(io.StringIO(self._record, newline="")), [])
+        self._record = ""
+        if not any(cell.strip() for cell in row):
+            return []
+        if self._columns is None:
+            header = [cell.strip().lower() for cell in row]
+            if "username" in header:
+                self._columns = header
+                return []
+            self._columns = STUDENT_CSV_COLUMNS
+        student = {}
+        for column, cell in zip(self._columns, row):
+            if column in STUDENT_CSV_COLUMNS and cell.strip():
+                student[column] = cell.strip()
+        return [student]
+
+
+# =================================================================
+# 단어장 파일(CSV/TSV/XLSX) 스트리밍 파싱
+# =================================================================
+
+# 프론트엔드 CSV 형식과 같은 열 순서: 단어, 뜻, 품사, 예문
+WORD_COLUMNS = ("text", "meaning", "part_of_speech", "example_sentence")
+WORD_HEADER_NAMES = {"text", "word", "단어"}
+
+
+class UnsupportedUpload(Exception):
+    """처리할 수 없는 파일 형식일 때 발생합니다."""
+
+
+class InvalidUpload(Exception):
+    """파일 내용을 읽을 수 없을 때 (인코딩 오류, 손상된 파일 등) 발생합니다."""
+
+
+def _detect_format(filename: str, content_type: Optional[str]) -> str:
+    name = (filename or "").lower()
+    if name.endswith(".xlsx") or content_type == "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet":
+        return "xlsx"
+    if name.endswith(".tsv") or content_type == "text/tab-separated-values":
+        return "tsv"
+    if name.endswith(".xls"):
+        raise UnsupportedUpload("Legacy .xls files are not supported; save the sheet as .xlsx or .csv")
+    return "csv"
+
+
+def _iter_delimited_rows(file: BinaryIO, delimiter: str) -> Iterator[List[str]]:
+    # 파일을 한 번에 읽지 않고 줄 단위로 디코딩합니다.
+    text_stream = codecs.getreader("utf-8-sig")(file)
+    yield from csv.reader(text_stream, delimiter=delimiter)
+
+
+def _iter_xlsx_rows(file: BinaryIO) -> Iterator[List[str]]:
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise UnsupportedUpload("XLSX uploads require the openpyxl package")
+    # read_only 모드는 시트 전체를 메모리에 올리지 않고 행을 순서대로 읽습니다.
+    try:
+        workbook = load_workbook(file, read_only=True, data_only=True)
+    except (zipfile.BadZipFile, KeyError, ValueError) as e:
+        raise InvalidUpload(f"Could not open the XLSX file: {e}")
+    try:
+        for values in workbook.active.iter_rows(values_only=True):
+            yield ["" if value is None else str(value) for value in values]
+    finally:
+        workbook.close()
+
+
+def iter_word_rows(
+    file: BinaryIO, filename: str, content_type: Optional[str] = None
+) -> Iterator[Tuple[int, Optional[Dict[str, Optional[str]]], Optional[str]]]:
+    """
+    업로드된 단어 파일을 한 행씩 읽어 (행 번호, 단어 dict 또는 None, 오류 메시지 또는 None)을 돌려줍니다.
+    빈 행은 건너뛰고, 첫 행이 헤더(text/word/단어)이면 무시합니다.
+    """
+    file_format = _detect_format(filename, content_type)
+    if file_format == "xlsx":
+        rows = _iter_xlsx_rows(file)
+    else:
+        rows = _iter_delimited_rows(file, "\t" if file_format == "tsv" else ",")
+
+    try:
+        yield from _validate_word_rows(rows)
+    except (UnicodeDecodeError, csv.Error) as e:
+        raise InvalidUpload(f"Could not read the uploaded file: {e}")
+
+
+def _validate_word_rows(rows: Iterator[List[str]]):
+    for row_number, row in enumerate(rows, start=1):
+        cells = [cell.strip() for cell in row]
+        if not any(cells):
+            continue
+        if row_number == 1 and cells[0].lower() in WORD_HEADER_NAMES:
+            continue
+        word = {column: (cells[i] if i < len(cells) and cells[i] else None) for i, column in enumerate(WORD_COLUMNS)}
+        if not word["text"] or not word["meaning"]:
+            yield row_number, None, "Both word and meaning are required"
+            continue
+        yield row_number, word, None
@@ -0,0 +1,65 @@
+# backend/app/leaderboard.py
+
+from typing import Iterable, List, NamedTuple, Tuple
+
+# =================================================================
+# 리더보드 상위 K명 스냅샷
+# -----------------------------------------------------------------
+# SQL의 RANK() OVER로 만든 상위 K명을 보관하고, 시험 결과가 저장될 때마다
+# 해당 학생의 점수만 반영해 다시 정렬합니다. 바깥에 있는 학생의 점수를 모르므로
+# 정확히 유지할 수 없는 변경(상위 K명 안의 학생 점수가 하한 아래로 내려간 경우)이면
+# update()가 False를 돌려주고, 호출한 쪽은 스냅샷을 버린 뒤 다음 조회에서 다시 만듭니다.
+# =================================================================
+
+METRICS = ("best", "average")
+
+
+class LeaderboardEntry(NamedTuple):
+    student_id: int
+    student_name: str
+    score: float
+    attempts: int
+
+
+def _sort_key(entry: LeaderboardEntry):
+    return (-entry.score, entry.student_name, entry.student_id)
+
+
+class TopK:
+    """
+    점수 내림차순 상위 k명입니다. complete가 True이면 순위에 오를 수 있는 학생이 모두 들어 있고,
+    False이면 목록 밖 학생의 점수는 마지막 항목의 점수 이하라는 것만 알 수 있습니다.
+    """
+
+    __slots__ = ("k", "entries", "complete")
+
+    def __init__(self, k: int, entries: Iterable[LeaderboardEntry], complete: bool):
+        self.k = k
+        self.entries: List[LeaderboardEntry] = sorted(entries, key=_sort_key)[:k]
+        self.complete = complete
+
+    def update(self, entry: LeaderboardEntry) -> bool:
+        """학생 한 명의 새 점수를 반영합니다. 정확히 유지할 수 없으면 False를 반환합니다."""
+        in_list = any(e.student_id == entry.student_id for e in self.entries)
+        if not self.complete and self.entries and entry.score < self.entries[-1].score:
+            # 하한보다 낮은 점수: 밖에 있던 학생이면 변화가 없고, 안에 있던 학생이면 빈자리를 채울 수 없습니다.
+            return not in_list
+        entries = [e for e in self.entries if e.student_id != entry.student_id]
+        entries.append(entry)
+        entries.sort(key=_sort_key)
+        if len(entries) > self.k:
+            entries = entries[:self.k]
+            self.complete = False
+        self.entries = entries
+        return True
+
+    def ranked(self, limit: int) -> List[Tuple[int, LeaderboardEntry]]:
+        """RANK()와 같은 규칙(동점은 같은 순위, 다음 순위는 건너뜀)으로 상위 limit명을 반환합니다."""
+        ranked = []
+        for position, entry in enumerate(self.entries[:limit]):
+            if position and entry.score == self.entries[position - 1].score:
+                rank = ranked[-1][0]
+            else:
+                rank = position + 1
+            ranked.append((rank, entry))
+        return ranked
@@ -0,0 +1,28 @@
+# backend/app/limits.py
+
+# =================================================================
+# 조회 API의 페이지 크기와 상한
+# -----------------------------------------------------------------
+# main.py의 동기 엔드포인트와 api_async.py의 async 엔드포인트가 같은 값을 쓰도록 여기서만 정의합니다.
+# =================================================================
+
+# 단어장 목록 페이지 크기
+WORDBOOK_PAGE_SIZE = 50
+WORDBOOK_PAGE_SIZE_MAX = 200
+# 학생 디렉터리 페이지 크기
+STUDENT_PAGE_SIZE = 50
+STUDENT_PAGE_SIZE_MAX = 500
+# 학생 리포트에서 단어장별로 돌려줄 수 있는 최근 결과 수의 상한
+REPORT_RESULTS_MAX = 500
+# 학습 통계 그래프의 최대 점 개수 (이보다 많으면 서버에서 구간을 합칩니다)
+STATS_MAX_POINTS = 120
+STATS_MAX_POINTS_MAX = 1000
+# 반 전체 성적표의 학생 페이지 크기
+CLASS_REPORT_PAGE_SIZE = 50
+CLASS_REPORT_PAGE_SIZE_MAX = 200
+# 복습할 단어 목록 크기
+DUE_WORDS_PAGE_SIZE = 50
+DUE_WORDS_PAGE_SIZE_MAX = 200
+# 리더보드 순위 수
+LEADERBOARD_SIZE = 10
+LEADERBOARD_SIZE_MAX = 200
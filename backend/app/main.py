@@ -1,18 +1,66 @@
 # backend/app/main.py
 
-from fastapi import FastAPI, Depends, HTTPException, status, Response
+from fastapi import FastAPI, BackgroundTasks, Depends, File, Form, HTTPException, Query, status, Response, Request, UploadFile
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Literal, Optional
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import OAuth2PasswordRequestForm
+from pydantic import TypeAdapter, ValidationError
+from starlette.formparsers import MultiPartException, MultiPartParser
+import csv
+import json
 import os
-from datetime import datetime
+from datetime import date, datetime
 
-from . import crud, models, schemas, security
-from .database import get_db
+from . import api_async, crud, export, grading, http_cache, ingest, models, pagination, schemas, security
+from .cache import leaderboard_cache, quiz_bank_cache
+from .config import settings
+from .database import ReadSessionLocal, SessionLocal, get_db, get_pool_stats
+from .hashing import HashingOverloaded
+from .limits import (
+    CLASS_REPORT_PAGE_SIZE,
+    CLASS_REPORT_PAGE_SIZE_MAX,
+    DUE_WORDS_PAGE_SIZE,
+    DUE_WORDS_PAGE_SIZE_MAX,
+    LEADERBOARD_SIZE,
+    LEADERBOARD_SIZE_MAX,
+    REPORT_RESULTS_MAX,
+    STATS_MAX_POINTS,
+    STATS_MAX_POINTS_MAX,
+    STUDENT_PAGE_SIZE,
+    STUDENT_PAGE_SIZE_MAX,
+    WORDBOOK_PAGE_SIZE,
+    WORDBOOK_PAGE_SIZE_MAX,
+)
 
 app = FastAPI()
 
+# 선생님이 등록/초기화하는 학생 계정의 기본 비밀번호
+DEFAULT_STUDENT_PASSWORD = "1234"
+# 학생 일괄 등록 한 번에 받을 수 있는 최대 행 수와 요청 본문 크기 (바이트)
+BULK_USER_MAX_ROWS = 2000
+BULK_USER_MAX_BYTES = 1024 * 1024
+
+STUDENT_LIST_ADAPTER = TypeAdapter(List[schemas.Student])
+
+# ✨ 비동기 모드에서는 async 엔드포인트를 먼저 등록하여 같은 경로의 동기 엔드포인트보다 우선하게 합니다.
+if settings.DB_ASYNC_MODE:
+    app.include_router(api_async.router)
+
+@app.exception_handler(HashingOverloaded)
+def hashing_overloaded_handler(request: Request, exc: HashingOverloaded):
+    # 해싱 대기열이 가득 찼을 때는 잠시 후 다시 시도하도록 503을 반환합니다.
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Server is busy. Please try again shortly."},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+@app.on_event("shutdown")
+def shutdown_hashing_pool():
+    security.hashing_pool.shutdown()
+
 # ===================================================================
 # CORS 설정
 # ===================================================================
@@ -32,6 +80,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # 페이지네이션 커서와 ETag를 브라우저에서 읽을 수 있도록 노출합니다.
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
 # ===================================================================
@@ -45,6 +95,18 @@ def read_root():
 def health_check():
     return {"status": "healthy"}
 
+# ===================================================================
+# 내부 운영 지표 API
+# ===================================================================
+@app.get("/api/internal/stats")
+def read_internal_stats(current_user: schemas.User = Depends(security.get_current_teacher)):
+    return {
+        "hashing": security.hashing_pool.stats(),
+        "db_pool": get_pool_stats(),
+        "quiz_bank": quiz_bank_cache.stats(),
+        "leaderboard": leaderboard_cache.stats(),
+    }
+
 # ===================================================================
 # 인증 및 사용자 관련 API
 # ===================================================================
@@ -60,7 +122,7 @@ def login_for_access_token(
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    access_token = security.create_access_token(data={"sub": user.username})
+    access_token = security.create_access_token_for_user(user)
     return {
         "access_token": access_token,
         "token_type": "bearer",
@@ -73,28 +135,64 @@ def login_for_access_token(
     }
 
 @app.get("/api/users/me/", response_model=schemas.User)
-def read_users_me(current_user: models.User = Depends(security.get_current_user)):
+def read_users_me(current_user: schemas.User = Depends(security.get_current_user)):
     return current_user
 
 @app.get("/api/teacher/students/", response_model=List[schemas.Student])
 def read_all_students(
+    request: Request,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(security.get_current_teacher)
+    current_user: schemas.User = Depends(security.get_current_teacher)
 ):
     students = crud.get_all_students(db)
-    return students
+    # 대시보드가 여러 번 호출하므로 ETag를 붙여 변경이 없으면 304로 응답합니다.
+    body = STUDENT_LIST_ADAPTER.dump_json([schemas.Student.model_validate(s) for s in students])
+    return http_cache.json_response_with_etag(request, body)
+
+@app.get("/api/teacher/students/directory", response_model=List[schemas.Student])
+def read_student_directory(
+    request: Request,
+    q: Optional[str] = Query(None, max_length=100),
+    match: Literal["substring", "prefix"] = "substring",
+    after: Optional[str] = None,
+    limit: int = Query(STUDENT_PAGE_SIZE, ge=1, le=STUDENT_PAGE_SIZE_MAX),
+    db: Session = Depends(get_db),
+    current_user: schemas.User = Depends(security.get_current_teacher)
+):
+    """
+    학생 디렉터리를 이름순으로 페이지 단위 조회합니다.
+    q로 이름/아이디를 검색하고, 다음 페이지 커서는 X-Next-Cursor 헤더로 전달합니다.
+    """
+    cursor = pagination.decode_cursor(after, size=2)
+    rows = crud.search_students(
+        db,
+        query=q.strip() if q else None,
+        prefix_only=match == "prefix",
+        after=tuple(cursor) if cursor else None,
+        limit=limit,
+    )
+    headers = {}
+    if len(rows) == limit:
+        headers["X-Next-Cursor"] = pagination.encode_cursor(rows[-1].name, rows[-1].id)
+    body = STUDENT_LIST_ADAPTER.dump_json([schemas.Student.model_validate(row) for row in rows])
+    return http_cache.json_response_with_etag(request, body, headers=headers)
 
-@app.get("/api/teacher/students/{student_id}/wordbooks", response_model=List[schemas.Wordbook])
+@app.get("/api/teacher/students/{student_id}/wordbooks", response_model=List[schemas.WordbookSummary])
 def get_student_wordbooks(
     student_id: int,
+    response: Response,
+    after: Optional[int] = None,
+    limit: int = Query(WORDBOOK_PAGE_SIZE, ge=1, le=WORDBOOK_PAGE_SIZE_MAX),
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(security.get_current_teacher) # 선생님만 접근 가능
+    current_user: schemas.User = Depends(security.get_current_teacher) # 선생님만 접근 가능
 ):
     """
-    선생님이 특정 학생에게 할당된 단어장 목록을 조회합니다.
+    선생님이 특정 학생에게 할당된 단어장 목록을 요약 정보로 조회합니다.
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 마지막 단어장 ID를 알려줍니다.
     """
-    # 기존 crud 함수를 재사용하여 효율적으로 구현합니다.
-    wordbooks = crud.get_wordbooks_for_student(db=db, student_id=student_id)
+    wordbooks = crud.get_wordbook_summaries_for_student(db=db, student_id=student_id, after_id=after, limit=limit)
+    if len(wordbooks) == limit:
+        response.headers["X-Next-Cursor"] = str(wordbooks[-1].id)
     return wordbooks
 
 @app.post("/api/users/", response_model=schemas.User, status_code=status.HTTP_201_CREATED)
@@ -105,11 +203,127 @@ def create_new_user(user_data: schemas.UserCreate, db: Session = Depends(get_db)
     hashed_password = security.get_password_hash(user_data.password)
     return crud.create_user(db=db, user=user_data, hashed_password=hashed_password)
 
+def bulk_request_too_large(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=detail)
+
+async def iter_bulk_body(request: Request):
+    """요청 본문을 받는 대로 넘기고, BULK_USER_MAX_BYTES를 넘는 순간 더 읽지 않고 413을 반환합니다."""
+    too_large = bulk_request_too_large(f"Request body must be at most {BULK_USER_MAX_BYTES} bytes")
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > BULK_USER_MAX_BYTES:
+        raise too_large
+    received = 0
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > BULK_USER_MAX_BYTES:
+            raise too_large
+        yield chunk
+
+def check_bulk_row_count(count: int) -> None:
+    if count > BULK_USER_MAX_ROWS:
+        raise bulk_request_too_large(f"At most {BULK_USER_MAX_ROWS} students can be registered at once")
+
+async def read_bulk_student_csv(chunks) -> List[dict]:
+    """CSV 조각을 받는 대로 행으로 읽고, BULK_USER_MAX_ROWS를 넘으면 나머지를 읽지 않고 413을 반환합니다."""
+    reader = ingest.StudentCsvReader()
+    rows: List[dict] = []
+    async for chunk in chunks:
+        rows.extend(reader.feed(chunk))
+        check_bulk_row_count(len(rows))
+    rows.extend(reader.feed(b"", final=True))
+    check_bulk_row_count(len(rows))
+    return rows
+
+async def iter_upload_chunks(upload: UploadFile, chunk_size: int = 64 * 1024):
+    while True:
+        chunk = await upload.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+async def read_bulk_student_rows(
+    request: Request, current_user: schemas.User = Depends(security.get_current_teacher)
+) -> List[dict]:
+    """
+    학생 일괄 등록 요청 본문을 행 목록으로 변환합니다.
+    JSON(목록 또는 {"students": [...]}), text/csv 본문, multipart의 CSV 파일(file)을 받습니다.
+    선생님 인증을 먼저 확인한 뒤, 본문은 받는 동안 크기(BULK_USER_MAX_BYTES)와 CSV 행 수(BULK_USER_MAX_ROWS)를 제한합니다.
+    """
+    content_type = request.headers.get("content-type", "")
+    try:
+        if content_type.startswith("multipart/form-data"):
+            try:
+                form = await MultiPartParser(request.headers, iter_bulk_body(request)).parse()
+            except MultiPartException as e:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+            try:
+                upload = form.get("file")
+                if upload is None or isinstance(upload, str):
+                    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="CSV file is required")
+                return await read_bulk_student_csv(iter_upload_chunks(upload))
+            finally:
+                await form.close()
+        if content_type.startswith("text/csv"):
+            return await read_bulk_student_csv(iter_bulk_body(request))
+        body = b"".join([chunk async for chunk in iter_bulk_body(request)])
+        payload = json.loads(body)
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="CSV file must be UTF-8 encoded")
+    except csv.Error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid CSV file")
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid JSON body")
+
+    if isinstance(payload, dict):
+        payload = payload.get("students")
+    if not isinstance(payload, list):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="A list of students is required")
+    check_bulk_row_count(len(payload))
+    return payload
+
+@app.post("/api/users/bulk", response_model=schemas.BulkUserCreateResult)
+def create_students_in_bulk(
+    current_user: schemas.User = Depends(security.get_current_teacher),
+    rows: List[dict] = Depends(read_bulk_student_rows),
+    db: Session = Depends(get_db),
+):
+    """
+    선생님이 학생 계정을 한 번에 등록합니다. 행별로 created/conflict/invalid 결과를 반환합니다.
+    """
+    invalid_results: List[schemas.BulkUserResult] = []
+    students = []
+    for row_number, row in enumerate(rows, start=1):
+        try:
+            students.append((row_number, schemas.BulkStudentCreate.model_validate(row)))
+        except ValidationError as e:
+            username = row.get("username") if isinstance(row, dict) else None
+            invalid_results.append(schemas.BulkUserResult(
+                row=row_number,
+                username=username if isinstance(username, str) else None,
+                status="invalid",
+                detail="; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors()),
+            ))
+
+    results = crud.create_students_bulk(
+        db=db,
+        students=students,
+        default_password=DEFAULT_STUDENT_PASSWORD,
+        hash_passwords=security.hashing_pool.hash_many,
+    ) + invalid_results
+    results.sort(key=lambda r: r.row)
+
+    return schemas.BulkUserCreateResult(
+        created=sum(1 for r in results if r.status == "created"),
+        conflicts=sum(1 for r in results if r.status == "conflict"),
+        invalid=len(invalid_results),
+        results=results,
+    )
+
 @app.delete("/api/users/{user_id}", response_model=schemas.User)
 def delete_user_endpoint(
     user_id: int, 
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(security.get_current_teacher)
+    current_user: schemas.User = Depends(security.get_current_teacher)
 ):
     if user_id == current_user.id:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot delete your own account.")
@@ -122,11 +336,11 @@ def delete_user_endpoint(
 def reset_user_password(
     user_id: int,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(security.get_current_teacher)
+    current_user: schemas.User = Depends(security.get_current_teacher)
 ):
     if user_id == current_user.id:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot reset your own password here.")
-    new_temporary_password = "1234"
+    new_temporary_password = DEFAULT_STUDENT_PASSWORD
     hashed_password = security.get_password_hash(new_temporary_password)
     updated_user = crud.update_user_password(
         db=db, user_id=user_id, new_hashed_password=hashed_password
@@ -139,61 +353,131 @@ def reset_user_password(
 # 단어장 관련 API
 # ===================================================================
 
-@app.get("/api/wordbooks/", response_model=List[schemas.Wordbook])
+@app.get("/api/wordbooks/", response_model=List[schemas.WordbookSummary])
 def read_my_wordbooks(
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(security.get_current_user)
+    request: Request,
+    response: Response,
+    after: Optional[int] = None,
+    limit: int = Query(WORDBOOK_PAGE_SIZE, ge=1, le=WORDBOOK_PAGE_SIZE_MAX),
+    db: Session = Depends(security.get_user_read_db),
+    current_user: schemas.User = Depends(security.get_current_user)
 ):
+    """
+    로그인한 학생의 단어장 목록을 요약 정보(단어 수, 마지막 퀴즈 결과)로 반환합니다.
+    단어 목록은 상세 조회(/api/wordbooks/{id})에서만 내려줍니다.
+    """
     if current_user.role != models.UserRole.student:
         return []
-    
-    wordbooks = crud.get_wordbooks_for_student(db=db, student_id=current_user.id)
+
+    # 목록이 바뀌지 않았으면 요약을 조회하지 않고 304로 응답합니다.
+    version = crud.get_user_data_version(db, current_user.id)
+    etag = http_cache.etag_for_version("wordbooks", current_user.id, version, after, limit)
+    not_modified = http_cache.check_not_modified(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+
+    wordbooks = crud.get_wordbook_summaries_for_student(db=db, student_id=current_user.id, after_id=after, limit=limit)
+    if len(wordbooks) == limit:
+        response.headers["X-Next-Cursor"] = str(wordbooks[-1].id)
     return wordbooks
 
 @app.post("/api/wordbooks/upload/", response_model=schemas.Wordbook, status_code=status.HTTP_201_CREATED)
 def create_wordbook_by_upload(
     wordbook_data: schemas.WordbookUpload,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(security.get_current_teacher)
+    current_user: schemas.User = Depends(security.get_current_teacher)
 ):
     return crud.create_wordbook_for_students(
         db=db, wordbook_data=wordbook_data, teacher_id=current_user.id
     )
 
+@app.post("/api/wordbooks/upload/file", response_model=schemas.WordbookUploadResult, status_code=status.HTTP_201_CREATED)
+def create_wordbook_by_file_upload(
+    file: UploadFile = File(...),
+    title: str = Form(..., min_length=1),
+    description: Optional[str] = Form(None),
+    student_ids: List[int] = Form(...),
+    db: Session = Depends(get_db),
+    current_user: schemas.User = Depends(security.get_current_teacher)
+):
+    """
+    CSV/TSV/XLSX 파일을 서버에서 한 행씩 읽어 단어장을 만듭니다.
+    열 순서는 단어, 뜻, 품사, 예문이며, 잘못된 행은 건너뛰고 행 번호와 함께 보고합니다.
+    """
+    try:
+        rows = ingest.iter_word_rows(file.file, file.filename or "", file.content_type)
+        result = crud.create_wordbook_from_rows(
+            db=db,
+            title=title,
+            description=description,
+            teacher_id=current_user.id,
+            student_ids=student_ids,
+            rows=rows,
+        )
+    except ingest.UnsupportedUpload as e:
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=str(e))
+    except ingest.InvalidUpload as e:
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if result is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="The file contains no valid words")
+    return result
+
 @app.get("/api/wordbooks/{wordbook_id}", response_model=schemas.Wordbook)
 def read_wordbook_details(
     wordbook_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(security.get_current_user)
+    current_user: schemas.User = Depends(security.get_current_user)
 ):
+    # 권한과 버전만 먼저 확인해, 바뀌지 않았으면 단어를 로드하지 않고 304로 응답합니다.
+    meta = crud.get_wordbook_version_meta(db, wordbook_id=wordbook_id, user_id=current_user.id)
+    security.ensure_wordbook_meta_access(meta, current_user)
+    etag = http_cache.etag_for_version("wordbook", wordbook_id, meta.version)
+    not_modified = http_cache.check_not_modified(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+
     db_wordbook = crud.get_wordbook(db, wordbook_id=wordbook_id)
-    if db_wordbook is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Wordbook not found")
-    is_owner = db_wordbook.owner_id == current_user.id
-    is_assigned_student = current_user in db_wordbook.students
-    if not (is_owner or is_assigned_student):
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions")
-    return db_wordbook
+    return security.ensure_wordbook_access(db_wordbook, current_user)
+
+def purge_wordbook_in_background(wordbook_id: int):
+    # 요청 세션은 응답과 함께 닫히므로 별도 세션을 사용합니다.
+    db = SessionLocal()
+    try:
+        crud.purge_wordbook(db, wordbook_id=wordbook_id)
+    finally:
+        db.close()
 
 @app.delete("/api/wordbooks/{wordbook_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_wordbook_endpoint(
     wordbook_id: int,
+    background_tasks: BackgroundTasks,
+    mode: Literal["sync", "async"] = "sync",
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(security.get_current_teacher) # 선생님만 접근 가능
+    current_user: schemas.User = Depends(security.get_current_teacher) # 선생님만 접근 가능
 ):
     """
     선생님이 자신이 생성한 단어장을 삭제합니다.
+    mode=async이면 학생 할당만 바로 끊고 202를 반환한 뒤, 나머지는 백그라운드에서 나누어 삭제합니다.
     """
-    # 삭제하려는 단어장을 DB에서 가져옵니다.
-    db_wordbook = crud.get_wordbook(db, wordbook_id=wordbook_id)
+    # 단어/학생을 로드하지 않고 소유자만 확인합니다.
+    owner_id = crud.get_wordbook_owner_id(db, wordbook_id=wordbook_id)
     
     # 단어장이 없으면 404 오류를 반환합니다.
-    if db_wordbook is None:
+    if owner_id is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Wordbook not found")
     
     # 로그인한 선생님이 단어장의 주인이 아니면 403 오류를 반환합니다. (중요!)
-    if db_wordbook.owner_id != current_user.id:
+    if owner_id != current_user.id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to delete this wordbook")
+
+    if mode == "async":
+        crud.detach_wordbook(db=db, wordbook_id=wordbook_id)
+        background_tasks.add_task(purge_wordbook_in_background, wordbook_id)
+        return Response(status_code=status.HTTP_202_ACCEPTED)
         
     # crud 함수를 호출하여 단어장을 삭제합니다.
     crud.delete_wordbook(db=db, wordbook_id=wordbook_id)
@@ -204,69 +488,151 @@ def delete_wordbook_endpoint(
 # ===================================================================
 # 단어 테스트 API (오류 수정)
 # ===================================================================
-@app.get("/api/wordbooks/{wordbook_id}/quiz", response_model=List[schemas.QuizQuestion])
+@app.get("/api/wordbooks/{wordbook_id}/quiz", response_model=List[schemas.PracticeQuestion])
 def get_quiz_words(
     wordbook_id: int,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(security.get_current_user)
+    db: Session = Depends(security.get_user_read_db),
+    current_user: schemas.User = Depends(security.get_current_user)
 ):
-    # 1. 단어장에 접근 권한이 있는지 확인합니다.
-    db_wordbook = crud.get_wordbook(db, wordbook_id=wordbook_id)
-    if db_wordbook is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Wordbook not found")
+    # 1. 단어와 학생을 로드하지 않고 접근 권한과 단어장 버전만 확인합니다.
+    meta = crud.get_wordbook_quiz_meta(db, wordbook_id=wordbook_id, user_id=current_user.id)
+    security.ensure_wordbook_meta_access(meta, current_user, detail="Not enough permissions for this wordbook")
 
-    is_owner = db_wordbook.owner_id == current_user.id
-    is_assigned_student = current_user in db_wordbook.students
-    
-    if not (is_owner or is_assigned_student):
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions for this wordbook")
-
-    # 2. 단어장에서 단어 목록을 가져옵니다.
-    words = db_wordbook.words
-    
-    # 3. 단어가 없으면 프론트엔드가 처리하도록 빈 리스트를 반환합니다.
-    if not words:
+    # 2. 단어가 없으면 프론트엔드가 처리하도록 빈 리스트를 반환합니다.
+    if not meta.word_count:
         return []
 
-    # 4. 단어 목록으로 퀴즈를 생성합니다.
-    quiz_questions = crud.generate_quiz(words)
-    
-    return quiz_questions
+    # 3. 캐시된 퀴즈 스냅샷(없으면 새로 생성)에서 문제를 뽑습니다.
+    bank = crud.get_quiz_bank(db, wordbook_id=wordbook_id, version=(meta.word_count, meta.max_word_id))
+    return bank.generate_quiz()
 
-@app.post("/api/wordbooks/{wordbook_id}/tests", response_model=schemas.Test)
-def create_new_test_instance(
+def quiz_test_title(wordbook_title: str) -> str:
+    return f"{wordbook_title} - Quiz ({datetime.now().strftime('%Y-%m-%d %H:%M')})"
+
+@app.post("/api/wordbooks/{wordbook_id}/quiz-sessions", response_model=schemas.QuizSession, status_code=status.HTTP_201_CREATED)
+def start_quiz_session(
     wordbook_id: int,
+    review: bool = False,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(security.get_current_user)
+    current_user: schemas.User = Depends(security.get_current_user)
 ):
     """
-    학생이 퀴즈를 시작할 때, 어떤 단어장으로 시험을 보는지 기록을 생성합니다.
+    퀴즈 시작 시 시험 기록 생성과 문제 출제를 한 번의 요청으로 처리합니다.
+    단어장은 권한/버전 확인용 가벼운 조회 한 번만 하고, 문제는 캐시된 퀴즈 스냅샷에서 뽑습니다.
+    review=true이면 복습 시각이 된 단어를 먼저 출제합니다.
     """
-    db_wordbook = crud.get_wordbook(db, wordbook_id=wordbook_id)
-    if not db_wordbook:
-        raise HTTPException(status_code=404, detail="Wordbook not found")
+    meta = crud.get_wordbook_quiz_meta(db, wordbook_id=wordbook_id, user_id=current_user.id)
+    security.ensure_wordbook_meta_access(meta, current_user, detail="Not enough permissions for this wordbook")
+    if not meta.word_count:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Wordbook has no words to quiz on")
 
-    # TestCreate 스키마에 맞춰 데이터를 준비합니다.
-    test_data = schemas.TestCreate(
-        title=f"{db_wordbook.title} - Quiz ({datetime.now().strftime('%Y-%m-%d %H:%M')})",
-        wordbook_id=wordbook_id
+    prefer_word_ids: List[int] = []
+    if review and current_user.role == models.UserRole.student:
+        due_words = crud.get_due_words(
+            db, student_id=current_user.id, wordbook_id=wordbook_id, limit=max(1, meta.word_count // 2)
+        )
+        prefer_word_ids = [word.word_id for word in due_words]
+
+    return crud.create_quiz_session(
+        db,
+        wordbook_id=wordbook_id,
+        title=quiz_test_title(meta.title),
+        creator_id=current_user.id,
+        version=(meta.word_count, meta.max_word_id),
+        prefer_word_ids=prefer_word_ids,
     )
-    
-    # crud 함수를 호출하여 Test 객체를 생성합니다.
-    # creator_id는 시험을 본 학생의 id로 저장합니다.
-    return crud.create_test(db=db, test=test_data, creator_id=current_user.id)
 
-@app.post("/api/tests/results", response_model=schemas.TestResultForReport)
-def submit_test_result(
-    result_data: schemas.TestResultCreate,
+@app.post("/api/tests/{test_id}/submissions", response_model=schemas.GradedTestResult, status_code=status.HTTP_201_CREATED)
+def submit_test_answers(
+    test_id: int,
+    submission: schemas.TestSubmission,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(security.get_current_user)
+    current_user: schemas.User = Depends(security.get_current_user)
 ):
     """
-    학생이 제출한 퀴즈 점수를 데이터베이스에 기록합니다.
+    학생의 답안을 받아 출제 시 저장한 정답표로 한 번에 채점하고, 점수와 문제별 결과를 기록합니다.
     """
-    # crud 함수를 호출하여 결과를 저장합니다.
-    return crud.create_test_result(db=db, result=result_data, student_id=current_user.id)
+    test = crud.get_test_for_submission(db, test_id=test_id, user_id=current_user.id)
+    if test is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Test not found")
+    if not (test.creator_id == current_user.id or test.is_assigned):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions for this test")
+    if test.answer_key is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="This test has no answer key and cannot be graded",
+        )
+
+    answers = {answer.question_id: answer.answer for answer in submission.answers}
+    outcomes = grading.AnswerKey(test.answer_key).grade(answers)
+    return crud.create_graded_test_result(db, test_id=test_id, student_id=current_user.id, outcomes=outcomes)
+
+# ===================================================================
+# 시험 세션 API
+# ===================================================================
+@app.post("/api/exam-sessions", response_model=schemas.ExamSession, status_code=status.HTTP_201_CREATED)
+def create_exam_session(
+    session_data: schemas.ExamSessionCreate,
+    db: Session = Depends(get_db),
+    current_user: schemas.User = Depends(security.get_current_teacher)
+):
+    """
+    선생님이 반 전체 시험을 시작합니다. 시험지는 이때 한 번만 출제되어 저장됩니다.
+    """
+    meta = crud.get_wordbook_quiz_meta(db, wordbook_id=session_data.wordbook_id, user_id=current_user.id)
+    if meta is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Wordbook not found")
+    if meta.owner_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions for this wordbook")
+    if not meta.word_count:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Wordbook has no words to quiz on")
+
+    return crud.create_exam_session(
+        db,
+        wordbook_id=session_data.wordbook_id,
+        title=session_data.title or quiz_test_title(meta.title),
+        owner_id=current_user.id,
+        shuffle_questions=session_data.shuffle_questions,
+        version=(meta.word_count, meta.max_word_id),
+    )
+
+@app.get("/api/exam-sessions/{session_id}/paper", response_model=schemas.ExamPaper)
+def read_exam_paper(
+    session_id: int,
+    # 방금 만든 세션을 복제본 지연 없이 찾을 수 있도록 기본 DB에서 권한만 확인합니다.
+    db: Session = Depends(get_db),
+    current_user: schemas.User = Depends(security.get_current_user)
+):
+    """
+    학생이 시험에 참여해 시험지를 받습니다. 미리 직렬화된 시험지를 그대로 반환하므로
+    동시에 많은 학생이 참여해도 요청마다 권한 확인 쿼리 한 번만 실행됩니다.
+    시험지에는 정답이 없으며, 답안은 시험지의 test_id로 /api/tests/{test_id}/submissions에 제출해 서버에서 채점합니다.
+    """
+    access = crud.get_exam_session_access(db, session_id=session_id, user_id=current_user.id)
+    if access is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Exam session not found")
+    security.ensure_wordbook_meta_access(access, current_user, detail="Not enough permissions for this exam session")
+
+    paper = crud.get_exam_paper(db, session_id=session_id)
+    student_id = current_user.id if current_user.role == models.UserRole.student else None
+    return Response(content=paper.render(student_id), media_type="application/json")
+
+# ===================================================================
+# 복습(간격 반복) API
+# ===================================================================
+@app.get("/api/students/me/due-words", response_model=List[schemas.DueWord])
+def read_my_due_words(
+    wordbook_id: Optional[int] = None,
+    limit: int = Query(DUE_WORDS_PAGE_SIZE, ge=1, le=DUE_WORDS_PAGE_SIZE_MAX),
+    db: Session = Depends(security.get_user_read_db),
+    current_user: schemas.User = Depends(security.get_current_user)
+):
+    """
+    지금 복습할 단어를 복습 시각이 오래된 순서로 반환합니다. wordbook_id로 단어장을 한정할 수 있습니다.
+    """
+    if current_user.role != models.UserRole.student:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only students have review schedules.")
+    return crud.get_due_words(db, student_id=current_user.id, wordbook_id=wordbook_id, limit=limit)
 
 # ===================================================================
 # 학생 리포트 API
@@ -274,25 +640,171 @@ def submit_test_result(
 @app.get("/api/students/{student_id}/report", response_model=schemas.StudentReport)
 def get_student_report_endpoint(
     student_id: int,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(security.get_current_teacher)
+    request: Request,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=REPORT_RESULTS_MAX),
+    db: Session = Depends(security.get_user_read_db),
+    current_user: schemas.User = Depends(security.get_current_teacher)
 ):
-    report = crud.get_student_report(db, student_id=student_id)
+    version = crud.get_user_data_version(db, student_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Student not found or no report available.")
+    etag = http_cache.etag_for_version("report", student_id, version, limit)
+    not_modified = http_cache.check_not_modified(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+
+    report = crud.get_student_report(db, student_id=student_id, limit=limit)
     if not report:
         raise HTTPException(status_code=404, detail="Student not found or no report available.")
     return report
 
+@app.get("/api/teacher/reports", response_model=schemas.ClassReport)
+def get_class_report_endpoint(
+    request: Request,
+    after: Optional[str] = None,
+    limit: int = Query(CLASS_REPORT_PAGE_SIZE, ge=1, le=CLASS_REPORT_PAGE_SIZE_MAX),
+    db: Session = Depends(security.get_user_read_db),
+    current_user: schemas.User = Depends(security.get_current_teacher)
+):
+    """
+    선생님의 단어장에 할당된 학생 × 단어장별 평균, 응시 횟수, 마지막 점수/응시 시각을 열 단위 JSON으로 반환합니다.
+    학생은 이름순으로 limit명씩 나뉘며, 다음 페이지 커서는 X-Next-Cursor 헤더로 전달합니다.
+    """
+    cursor = pagination.decode_cursor(after, size=2)
+    report = crud.get_class_report(
+        db, teacher_id=current_user.id, after=tuple(cursor) if cursor else None, limit=limit
+    )
+    headers = {}
+    if len(report.students.id) == limit:
+        headers["X-Next-Cursor"] = pagination.encode_cursor(report.students.name[-1], report.students.id[-1])
+    return http_cache.json_response_with_etag(request, report.model_dump_json().encode(), headers=headers)
+
+# ===================================================================
+# 리더보드 API
+# -----------------------------------------------------------------
+# 결과를 저장하는 워커의 캐시와 어긋나지 않도록 읽기 복제본이 아니라 기본 DB에서 순위를 만듭니다.
+# limit이 LEADERBOARD_TOP_K 이하이면 캐시된 상위 K명에서 응답합니다.
+# ===================================================================
+def _leaderboard_response(db: Session, scope: str, scope_id: int, metric: str, limit: int) -> schemas.Leaderboard:
+    ranked = crud.get_cached_leaderboard(db, scope=scope, scope_id=scope_id, metric=metric, limit=limit)
+    return schemas.Leaderboard(
+        scope=scope,
+        scope_id=scope_id,
+        metric=metric,
+        entries=[
+            schemas.LeaderboardEntry(
+                rank=rank,
+                student_id=entry.student_id,
+                student_name=entry.student_name,
+                score=entry.score,
+                attempts=entry.attempts,
+            )
+            for rank, entry in ranked
+        ],
+    )
+
+@app.get("/api/wordbooks/{wordbook_id}/leaderboard", response_model=schemas.Leaderboard)
+def read_wordbook_leaderboard(
+    wordbook_id: int,
+    metric: Literal["best", "average"] = "best",
+    limit: int = Query(LEADERBOARD_SIZE, ge=1, le=LEADERBOARD_SIZE_MAX),
+    db: Session = Depends(get_db),
+    current_user: schemas.User = Depends(security.get_current_user)
+):
+    """단어장에 할당된 학생을 최고 점수(best) 또는 평균 점수(average)로 순위를 매깁니다."""
+    meta = crud.get_wordbook_version_meta(db, wordbook_id=wordbook_id, user_id=current_user.id)
+    security.ensure_wordbook_meta_access(meta, current_user, detail="Not enough permissions for this wordbook")
+    return _leaderboard_response(db, "wordbook", wordbook_id, metric, limit)
+
+@app.get("/api/teachers/{teacher_id}/leaderboard", response_model=schemas.Leaderboard)
+def read_class_leaderboard(
+    teacher_id: int,
+    metric: Literal["best", "average"] = "best",
+    limit: int = Query(LEADERBOARD_SIZE, ge=1, le=LEADERBOARD_SIZE_MAX),
+    db: Session = Depends(get_db),
+    current_user: schemas.User = Depends(security.get_current_user)
+):
+    """
+    선생님의 반(선생님 단어장에 할당된 학생 전체) 리더보드입니다. 선생님 본인과 반 학생만 볼 수 있으며,
+    best는 단어장별 최고 점수 중 최댓값, average는 모든 응시의 평균입니다.
+    """
+    if current_user.id != teacher_id and not crud.is_in_teacher_class(db, teacher_id=teacher_id, student_id=current_user.id):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions for this class")
+    return _leaderboard_response(db, "class", teacher_id, metric, limit)
+
+def stream_test_result_export(teacher_id: int, export_format: str, date_from, date_to, wordbook_id):
+    # 요청 세션은 응답 본문을 보내기 전에 닫히므로, 스트리밍하는 동안 쓸 세션을 따로 엽니다.
+    db = ReadSessionLocal()
+    try:
+        partitions = crud.iter_test_result_exports(
+            db, teacher_id=teacher_id, date_from=date_from, date_to=date_to, wordbook_id=wordbook_id
+        )
+        yield from export.iter_export_chunks(partitions, export_format)
+    finally:
+        db.close()
+
+@app.get("/api/teacher/exports/test-results")
+def export_test_results(
+    export_format: Literal["csv", "arrow", "parquet"] = Query("csv", alias="format"),
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to"),
+    wordbook_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+    current_user: schemas.User = Depends(security.get_current_teacher)
+):
+    """
+    선생님 단어장의 시험 결과를 학생/단어장 이름과 함께 CSV, Arrow(IPC 스트림), Parquet으로 내려받습니다.
+    결과는 서버 측 커서로 나누어 읽어 바로 스트리밍하므로 기록 양과 관계없이 메모리 사용량이 일정합니다.
+    """
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="'from' must not be after 'to'.")
+    if wordbook_id is not None:
+        owner_id = crud.get_wordbook_owner_id(db, wordbook_id)
+        if owner_id is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Wordbook not found")
+        if owner_id != current_user.id:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions")
+    try:
+        export.check_format(export_format)
+    except export.UnsupportedExport as e:
+        raise HTTPException(status_code=status.HTTP_406_NOT_ACCEPTABLE, detail=str(e))
+
+    media_type, extension = export.EXPORT_FORMATS[export_format]
+    return StreamingResponse(
+        stream_test_result_export(current_user.id, export_format, date_from, date_to, wordbook_id),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="test-results.{extension}"'},
+    )
+
 # ✨ [신규] 현재 로그인한 학생의 통계 조회 API
 @app.get("/api/students/me/stats", response_model=schemas.StudentStats)
 def get_my_stats(
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(security.get_current_user)
+    request: Request,
+    response: Response,
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to"),
+    bucket: Literal["day", "week", "month"] = "day",
+    max_points: int = Query(STATS_MAX_POINTS, ge=2, le=STATS_MAX_POINTS_MAX),
+    db: Session = Depends(security.get_user_read_db),
+    current_user: schemas.User = Depends(security.get_current_user)
 ):
     """
     현재 로그인한 학생의 학습 통계 데이터를 반환합니다.
+    from/to(포함) 기간의 결과를 bucket(day/week/month) 단위 평균으로 집계하고, 점이 max_points개를 넘으면 합쳐서 줄입니다.
     """
     if current_user.role != models.UserRole.student:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only students can access their stats.")
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="'from' must not be after 'to'.")
+
+    version = crud.get_user_data_version(db, current_user.id)
+    etag = http_cache.etag_for_version("stats", current_user.id, version, date_from, date_to, bucket, max_points)
+    not_modified = http_cache.check_not_modified(request, response, etag)
+    if not_modified is not None:
+        return not_modified
 
-    stats = crud.get_student_stats(db=db, student_id=current_user.id)
+    stats = crud.get_student_stats(
+        db=db, student_id=current_user.id, date_from=date_from, date_to=date_to, bucket=bucket, max_points=max_points
+    )
     return stats
\ No newline at end of file
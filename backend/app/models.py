@@ -1,14 +1,21 @@
 # backend/app/models.py
 
 from sqlalchemy import (
+    BigInteger,
+    Boolean,
     Column,
     Integer,
+    JSON,
+    SmallInteger,
     String,
     Float,
+    Date,
     DateTime,
     ForeignKey,
+    Index,
     Table,
-    Enum as SQLAlchemyEnum
+    Enum as SQLAlchemyEnum,
+    func
 )
 from sqlalchemy.orm import relationship
 import enum
@@ -22,16 +29,29 @@ student_wordbook_association = Table(
     "student_wordbook_association",
     Base.metadata,
     Column("student_id", Integer, ForeignKey("users.id"), primary_key=True),
-    Column("wordbook_id", Integer, ForeignKey("wordbooks.id"), primary_key=True),
+    Column("wordbook_id", Integer, ForeignKey("wordbooks.id", ondelete="CASCADE"), primary_key=True),
+    # PK(student_id, wordbook_id)로는 단어장 기준 조회를 할 수 없어 별도 인덱스를 둡니다.
+    Index("ix_student_wordbook_association_wordbook_id", "wordbook_id"),
 )
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # 학생 디렉터리의 (name, id) 키셋 페이지네이션용
+        Index("ix_users_role_name_id", "role", "name", "id"),
+        # 이름/아이디 부분 일치 검색용 트라이그램 인덱스 (pg_trgm 확장 필요)
+        Index("ix_users_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("ix_users_username_trgm", "username", postgresql_using="gin", postgresql_ops={"username": "gin_trgm_ops"}),
+    )
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
     username = Column(String, unique=True, index=True, nullable=False)
     hashed_password = Column(String, nullable=False)
     role = Column(SQLAlchemyEnum(UserRole), nullable=False, default=UserRole.student)
+    # 이 사용자에게 보이는 단어장 목록/리포트/통계가 바뀔 때마다 올라가는 버전 (ETag용)
+    data_version = Column(Integer, nullable=False, default=1, server_default="1")
+    # 비밀번호 변경 등으로 기존 토큰을 폐기할 때 올라가는 버전 (토큰의 tv 클레임과 비교)
+    token_version = Column(Integer, nullable=False, default=1, server_default="1")
     created_wordbooks = relationship("Wordbook", back_populates="owner")
     assigned_wordbooks = relationship(
         "Wordbook",
@@ -46,15 +66,18 @@ class Wordbook(Base):
     title = Column(String, index=True, nullable=False)
     description = Column(String, nullable=True)
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    # 단어장 내용이나 할당이 바뀔 때마다 올라가는 버전 (ETag용)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
     owner = relationship("User", back_populates="created_wordbooks")
-    words = relationship("Word", back_populates="wordbook", cascade="all, delete-orphan")
+    # 단어장 삭제 시 단어/시험/할당은 DB의 ON DELETE CASCADE로 한 번에 지워집니다.
+    words = relationship("Word", back_populates="wordbook", cascade="all, delete-orphan", passive_deletes=True)
     students = relationship(
         "User",
         secondary=student_wordbook_association,
         back_populates="assigned_wordbooks"
     )
     # ✨ Wordbook이 여러 Test를 가질 수 있도록 관계를 정의합니다.
-    tests = relationship("Test", back_populates="wordbook")
+    tests = relationship("Test", back_populates="wordbook", passive_deletes=True)
 
 class Word(Base):
     __tablename__ = "words"
@@ -63,25 +86,118 @@ class Word(Base):
     meaning = Column(String, nullable=False)
     part_of_speech = Column(String, nullable=True)
     example_sentence = Column(String, nullable=True)
-    wordbook_id = Column(Integer, ForeignKey("wordbooks.id"), nullable=False)
+    wordbook_id = Column(Integer, ForeignKey("wordbooks.id", ondelete="CASCADE"), index=True, nullable=False)
     wordbook = relationship("Wordbook", back_populates="words")
 
 class Test(Base):
     __tablename__ = "tests"
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
-    wordbook_id = Column(Integer, ForeignKey("wordbooks.id"), nullable=False)
+    wordbook_id = Column(Integer, ForeignKey("wordbooks.id", ondelete="CASCADE"), index=True, nullable=False)
     creator_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    results = relationship("TestResult", back_populates="test")
+    # 출제 시 만든 정답표 (quiz.QuizBank.generate_paper). 있으면 답안을 받아 서버에서 채점합니다.
+    answer_key = Column(JSON(none_as_null=True), nullable=True)
+    results = relationship("TestResult", back_populates="test", passive_deletes=True)
     # ✨ Test가 하나의 Wordbook에 속하도록 관계를 정의합니다. (이 부분이 중요)
     wordbook = relationship("Wordbook", back_populates="tests")
 
 class TestResult(Base):
     __tablename__ = "test_results"
+    # student_id, test_id 단독 조회는 아래 복합 인덱스의 앞 컬럼으로 처리됩니다.
+    __table_args__ = (
+        Index("ix_test_results_student_id_submitted_at", "student_id", "submitted_at"),
+        Index("ix_test_results_test_id_student_id", "test_id", "student_id"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     score = Column(Float, nullable=False)
-    test_id = Column(Integer, ForeignKey("tests.id"), nullable=False)
+    test_id = Column(Integer, ForeignKey("tests.id", ondelete="CASCADE"), nullable=False)
     student_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     submitted_at = Column(DateTime(timezone=True))
     test = relationship("Test", back_populates="results")
     student = relationship("User", back_populates="test_results")
+    outcomes = relationship("QuestionOutcome", back_populates="test_result", passive_deletes=True)
+
+class StudentWordbookScore(Base):
+    """
+    학생 × 단어장별 시험 점수 누계입니다. 결과를 저장할 때 같은 트랜잭션에서 갱신하므로
+    리포트/통계는 test_results를 다시 집계하지 않고 이 행을 읽습니다.
+    """
+    __tablename__ = "student_wordbook_scores"
+    # 단어장 삭제 시 CASCADE가 단어장 기준으로 행을 찾을 수 있도록 합니다.
+    __table_args__ = (
+        Index("ix_student_wordbook_scores_wordbook_id", "wordbook_id"),
+    )
+    student_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    wordbook_id = Column(Integer, ForeignKey("wordbooks.id", ondelete="CASCADE"), primary_key=True)
+    result_count = Column(Integer, nullable=False)
+    score_sum = Column(Float, nullable=False)
+    score_min = Column(Float, nullable=False)
+    score_max = Column(Float, nullable=False)
+    last_score = Column(Float, nullable=False)
+    last_submitted_at = Column(DateTime(timezone=True), nullable=True)
+
+class StudentDailyScore(Base):
+    """
+    학생 × 날짜(× 단어장)별 시험 점수 누계입니다. day는 DB 세션 시간대 기준 제출 날짜입니다.
+    단어장을 키에 포함해 단어장이 삭제되면 해당 점수도 CASCADE로 함께 빠집니다.
+    """
+    __tablename__ = "student_daily_scores"
+    # 단어장 삭제 시 CASCADE가 단어장 기준으로 행을 찾을 수 있도록 합니다.
+    __table_args__ = (
+        Index("ix_student_daily_scores_wordbook_id", "wordbook_id"),
+    )
+    student_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    wordbook_id = Column(Integer, ForeignKey("wordbooks.id", ondelete="CASCADE"), primary_key=True)
+    result_count = Column(Integer, nullable=False)
+    score_sum = Column(Float, nullable=False)
+    score_min = Column(Float, nullable=False)
+    score_max = Column(Float, nullable=False)
+    last_score = Column(Float, nullable=False)
+    last_submitted_at = Column(DateTime(timezone=True), nullable=True)
+
+class QuestionOutcome(Base):
+    """서버 채점 결과의 문제별 정답 여부입니다."""
+    __tablename__ = "question_outcomes"
+    id = Column(Integer, primary_key=True, index=True)
+    test_result_id = Column(Integer, ForeignKey("test_results.id", ondelete="CASCADE"), index=True, nullable=False)
+    question_id = Column(Integer, nullable=False)
+    word_id = Column(Integer, ForeignKey("words.id", ondelete="CASCADE"), index=True, nullable=True)
+    is_correct = Column(Boolean, nullable=False)
+    given_answer = Column(String, nullable=True)
+    test_result = relationship("TestResult", back_populates="outcomes")
+
+class ExamSession(Base):
+    """
+    선생님이 시작한 반 전체 시험입니다. 시험지(paper)는 생성 시 한 번만 만들어 저장하고,
+    학생들은 같은 시험지와 같은 Test 기록(test_id)을 공유합니다.
+    """
+    __tablename__ = "exam_sessions"
+    id = Column(Integer, primary_key=True, index=True)
+    title = Column(String, nullable=False)
+    wordbook_id = Column(Integer, ForeignKey("wordbooks.id", ondelete="CASCADE"), index=True, nullable=False)
+    test_id = Column(Integer, ForeignKey("tests.id", ondelete="CASCADE"), nullable=False)
+    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    # 문제 목록 (schemas.QuizQuestion을 dict로 저장, 정답은 tests.answer_key에만 있음)
+    paper = Column(JSON, nullable=False)
+    # 학생별 문항 순서는 seed와 학생 ID로 결정되므로 다시 출제할 필요가 없습니다.
+    shuffle_questions = Column(Boolean, nullable=False, default=False)
+    seed = Column(BigInteger, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    test = relationship("Test")
+
+class WordMemory(Base):
+    """학생별·단어별 간격 반복 기억 상태입니다 (srs.py 참고)."""
+    __tablename__ = "word_memories"
+    # 오늘 복습할 단어는 (student_id, due_at) 범위 검색으로 찾습니다.
+    __table_args__ = (
+        Index("ix_word_memories_student_id_due_at", "student_id", "due_at"),
+    )
+    student_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    word_id = Column(Integer, ForeignKey("words.id", ondelete="CASCADE"), primary_key=True)
+    ease = Column(Float, nullable=False)
+    interval_days = Column(Float, nullable=False)
+    repetitions = Column(SmallInteger, nullable=False, default=0)
+    lapses = Column(SmallInteger, nullable=False, default=0)
+    last_reviewed_at = Column(DateTime(timezone=True), nullable=False)
+    due_at = Column(DateTime(timezone=True), nullable=False)
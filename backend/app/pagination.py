@@ -0,0 +1,31 @@
+# backend/app/pagination.py
+
+import base64
+import json
+from typing import Any, List, Optional
+
+from fastapi import HTTPException, status
+
+# =================================================================
+# 키셋 페이지네이션 커서
+# -----------------------------------------------------------------
+# 정렬 키 값 목록을 URL에 안전한 불투명 문자열로 인코딩합니다.
+# =================================================================
+
+def encode_cursor(*values: Any) -> str:
+    raw = json.dumps(list(values), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], size: int) -> Optional[List[Any]]:
+    """커서를 정렬 키 값 목록으로 되돌립니다. 형식이 맞지 않으면 400을 반환합니다."""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except ValueError:
+        values = None
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return values
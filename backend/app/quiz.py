@@ -0,0 +1,332 @@
+# backend/app/quiz.py
+
+import json
+import random
+import sys
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from . import models, schemas
+from .grading import normalize
+
+# =================================================================
+# 퀴즈 생성
+# =================================================================
+
+MULTIPLE_CHOICE_DISTRACTORS = 3
+
+
+class DistractorIndex:
+    """
+    단어장의 뜻(meaning)을 중복 없이 한 번만 모아 두고, 객관식 오답을 뽑는 인덱스입니다.
+
+    문제마다 오답 후보 리스트를 새로 만들지 않고, 인덱스를 무작위로 뽑아
+    정답이거나 이미 뽑힌 값이면 다시 뽑는(rejection sampling) 방식으로
+    문제당 O(k)에 서로 다른 오답 k개를 고릅니다.
+    """
+
+    def __init__(self, meanings: Iterable[str]):
+        # dict.fromkeys로 처음 등장한 순서를 유지하면서 중복된 뜻을 제거합니다.
+        self.meanings: List[str] = list(dict.fromkeys(meanings))
+        self._positions = {meaning: i for i, meaning in enumerate(self.meanings)}
+
+    def __len__(self) -> int:
+        return len(self.meanings)
+
+    def sample(
+        self,
+        correct: str,
+        k: int = MULTIPLE_CHOICE_DISTRACTORS,
+        rng: Optional[random.Random] = None,
+        exclude: Iterable[str] = (),
+    ) -> List[str]:
+        """정답(correct)과 exclude에 없는, 서로 다른 뜻을 최대 k개 반환합니다."""
+        rng = rng or random
+        excluded = {self._positions[m] for m in (correct, *exclude) if m in self._positions}
+        available = len(self.meanings) - len(excluded)
+        k = min(k, available)
+        if k <= 0:
+            return []
+
+        # 후보가 적으면 거절 확률이 높아지므로 남은 후보에서 바로 뽑습니다.
+        if available <= 2 * k:
+            pool = [m for i, m in enumerate(self.meanings) if i not in excluded]
+            return rng.sample(pool, k)
+
+        chosen: List[int] = []
+        size = len(self.meanings)
+        while len(chosen) < k:
+            i = rng.randrange(size)
+            if i in excluded:
+                continue
+            excluded.add(i)
+            chosen.append(i)
+        return [self.meanings[i] for i in chosen]
+
+
+# 품사 표기를 하나로 맞추기 위한 별칭 (소문자, 마침표 제거 후 비교)
+PART_OF_SPEECH_ALIASES = {
+    "n": "noun", "명사": "noun", "명": "noun",
+    "v": "verb", "vt": "verb", "vi": "verb", "동사": "verb", "동": "verb",
+    "a": "adjective", "adj": "adjective", "형용사": "adjective", "형": "adjective",
+    "ad": "adverb", "adv": "adverb", "부사": "adverb", "부": "adverb",
+    "prep": "preposition", "전치사": "preposition", "전": "preposition",
+    "conj": "conjunction", "접속사": "conjunction", "접": "conjunction",
+    "pron": "pronoun", "대명사": "pronoun", "대": "pronoun",
+}
+
+
+def normalize_part_of_speech(part_of_speech: Optional[str]) -> Optional[str]:
+    if not part_of_speech:
+        return None
+    key = part_of_speech.strip().lower().rstrip(".")
+    return PART_OF_SPEECH_ALIASES.get(key, key) or None
+
+
+class PartOfSpeechDistractorIndex:
+    """
+    품사별로 나눈 DistractorIndex 묶음입니다. 정답과 같은 품사의 뜻에서 오답을 먼저 뽑고,
+    부족한 만큼은 전체 뜻(global pool)에서 채웁니다. 품사가 없는 단어는 전체에서 뽑습니다.
+    """
+
+    def __init__(self, meanings: Sequence[str], parts_of_speech: Sequence[Optional[str]]):
+        self.all = DistractorIndex(meanings)
+        grouped: dict = {}
+        for meaning, part_of_speech in zip(meanings, parts_of_speech):
+            key = normalize_part_of_speech(part_of_speech)
+            if key is not None:
+                grouped.setdefault(key, []).append(meaning)
+        self.buckets = {key: DistractorIndex(bucket) for key, bucket in grouped.items()}
+
+    def __len__(self) -> int:
+        return len(self.all)
+
+    def sample(
+        self,
+        correct: str,
+        part_of_speech: Optional[str] = None,
+        k: int = MULTIPLE_CHOICE_DISTRACTORS,
+        rng: Optional[random.Random] = None,
+        exclude: Iterable[str] = (),
+    ) -> List[str]:
+        """exclude(예: 같은 단어의 다른 뜻)는 품사별 후보와 전체 후보 모두에서 제외합니다."""
+        exclude = tuple(exclude)
+        bucket = self.buckets.get(normalize_part_of_speech(part_of_speech))
+        if bucket is None:
+            return self.all.sample(correct, k, rng, exclude=exclude)
+        chosen = bucket.sample(correct, k, rng, exclude=exclude)
+        if len(chosen) < k:
+            chosen += self.all.sample(correct, k - len(chosen), rng, exclude=(*exclude, *chosen))
+        return chosen
+
+
+def _group_shared(keys: Sequence[str], values: Sequence[str]) -> dict:
+    """정규화한 key가 같은 항목이 둘 이상일 때만 key → 서로 다른 value 튜플로 모읍니다."""
+    grouped: dict = {}
+    for key, value in zip(keys, values):
+        grouped.setdefault(normalize(key), []).append(value)
+    return {key: tuple(dict.fromkeys(group)) for key, group in grouped.items() if len(group) > 1}
+
+
+class QuizBank:
+    """
+    단어장 하나의 퀴즈 출제용 불변 스냅샷입니다.
+
+    단어/뜻 튜플과 미리 만든 DistractorIndex를 함께 보관하므로, 같은 단어장의
+    퀴즈 요청은 DB를 다시 읽지 않고 이 스냅샷에서 문제만 뽑으면 됩니다.
+    version은 단어장 내용이 바뀌었는지 확인하는 값입니다 (crud.get_wordbook_quiz_meta 참고).
+    synonyms/homonyms는 뜻이 같은 단어, 철자가 같은 단어의 정답을 모두 인정하기 위한 표입니다.
+    """
+
+    __slots__ = (
+        "wordbook_id", "version", "word_ids", "texts", "meanings", "parts_of_speech",
+        "distractors", "synonyms", "homonyms", "nbytes",
+    )
+
+    def __init__(
+        self,
+        texts: Iterable[str],
+        meanings: Iterable[str],
+        word_ids: Optional[Iterable[Optional[int]]] = None,
+        parts_of_speech: Optional[Iterable[Optional[str]]] = None,
+        wordbook_id: Optional[int] = None,
+        version=None,
+    ):
+        self.wordbook_id = wordbook_id
+        self.version = version
+        self.texts: Tuple[str, ...] = tuple(texts)
+        self.meanings: Tuple[str, ...] = tuple(meanings)
+        self.word_ids: Tuple[Optional[int], ...] = (
+            tuple(word_ids) if word_ids is not None else (None,) * len(self.texts)
+        )
+        self.parts_of_speech: Tuple[Optional[str], ...] = (
+            tuple(parts_of_speech) if parts_of_speech is not None else (None,) * len(self.texts)
+        )
+        self.distractors = PartOfSpeechDistractorIndex(self.meanings, self.parts_of_speech)
+        # 뜻 → 그 뜻을 가진 단어들, 단어 → 그 단어의 뜻들 (둘 이상인 경우만 보관)
+        self.synonyms = _group_shared(self.meanings, self.texts)
+        self.homonyms = _group_shared(self.texts, self.meanings)
+        self.nbytes = self._estimate_nbytes()
+
+    @classmethod
+    def from_words(cls, words: Iterable[models.Word], wordbook_id: Optional[int] = None, version=None) -> "QuizBank":
+        words = list(words)
+        return cls(
+            (w.text for w in words),
+            (w.meaning for w in words),
+            word_ids=(getattr(w, "id", None) for w in words),
+            parts_of_speech=(getattr(w, "part_of_speech", None) for w in words),
+            wordbook_id=wordbook_id,
+            version=version,
+        )
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def _estimate_nbytes(self) -> int:
+        # 캐시의 메모리 기준 LRU 제거에 쓰는 대략적인 크기입니다. 문자열은 튜플과 인덱스가 공유합니다.
+        strings = sum(sys.getsizeof(s) for s in self.texts) + sum(sys.getsizeof(s) for s in self.meanings)
+        containers = (
+            sys.getsizeof(self.texts)
+            + sys.getsizeof(self.meanings)
+            + sys.getsizeof(self.word_ids)
+            + sys.getsizeof(self.parts_of_speech)
+            + sum(
+                sys.getsizeof(index.meanings) + sys.getsizeof(index._positions)
+                for index in (self.distractors.all, *self.distractors.buckets.values())
+            )
+            + sum(
+                sys.getsizeof(table) + sum(sys.getsizeof(group) for group in table.values())
+                for table in (self.synonyms, self.homonyms)
+            )
+        )
+        return strings + containers
+
+    def generate_quiz(self, rng: Optional[random.Random] = None) -> List[schemas.PracticeQuestion]:
+        """
+        스냅샷에서 채점하지 않는 연습용 객관식/주관식 퀴즈 질문 목록을 정답과 함께 생성합니다.
+        """
+        practice = []
+        for question, answers, _word_id in self._generate(rng):
+            if question.type == 'multiple_choice':
+                practice.append(schemas.PracticeMultipleChoiceQuestion(**question.model_dump(), answer=answers[0]))
+            else:
+                practice.append(schemas.PracticeWrittenQuestion(**question.model_dump(), answer=answers[0]))
+        return practice
+
+    def generate_paper(
+        self, rng: Optional[random.Random] = None, prefer_word_ids: Sequence[int] = ()
+    ) -> Tuple[List[schemas.QuizQuestion], List[dict]]:
+        """
+        정답이 빠진 문제 목록과 서버 채점용 정답표(answer key)를 함께 생성합니다.
+        정답표의 i번째 항목이 id가 i인 문제의 정답입니다 (grading.AnswerKey 참고).
+        answer는 오답일 때 보여 줄 대표 정답이고, answers는 인정하는 정답 전체(동의어 포함)입니다.
+        prefer_word_ids의 단어(예: 복습할 단어)를 먼저 출제하고, 남은 문제는 무작위로 채웁니다.
+        """
+        questions, answer_key = [], []
+        for question, answers, word_id in self._generate(rng, prefer_word_ids):
+            questions.append(question)
+            answer_key.append({"type": question.type, "answer": answers[0], "answers": list(answers), "word_id": word_id})
+        return questions, answer_key
+
+    def _accepted(self, table: dict, key: str, answer: str) -> Tuple[str, ...]:
+        # 대표 정답을 맨 앞에 두고, 같은 뜻(또는 철자)을 가진 다른 정답을 뒤에 붙입니다.
+        return tuple(dict.fromkeys((answer, *table.get(normalize(key), ()))))
+
+    def _generate(
+        self, rng: Optional[random.Random], prefer_word_ids: Sequence[int] = ()
+    ) -> List[Tuple[schemas.QuizQuestion, Tuple[str, ...], Optional[int]]]:
+        size = len(self.texts)
+        if size == 0:
+            return []
+        rng = rng or random
+
+        num_questions = max(1, size // 2)
+        selected = self._select(rng, num_questions, prefer_word_ids)
+
+        generated: List[Tuple[schemas.QuizQuestion, Tuple[str, ...], Optional[int]]] = []
+        for i in selected:
+            text, meaning = self.texts[i], self.meanings[i]
+            # 단어가 4개 미만이면 주관식만, 그 이상이면 50% 확률로 문제 유형 결정
+            question_type = 'written'
+            if size >= 4 and rng.random() > 0.5:
+                question_type = 'multiple_choice'
+
+            if question_type == 'multiple_choice':
+                answers = self._accepted(self.homonyms, text, meaning)
+                # 정답과 같은 품사의 다른 뜻에서 서로 다른 오답 3개 선택 (부족하면 전체에서)
+                # 같은 철자의 다른 뜻도 정답으로 인정하므로 오답 후보에서 뺍니다.
+                choices = self.distractors.sample(meaning, self.parts_of_speech[i], rng=rng, exclude=answers) + [meaning]
+                rng.shuffle(choices)
+
+                question = schemas.MultipleChoiceQuestion(
+                    question=f"다음 영단어의 뜻은? '{text}'",
+                    choices=choices
+                )
+            else: # 'written'
+                question = schemas.WrittenQuestion(
+                    question=f"다음 뜻을 가진 영단어는? '{meaning}'"
+                )
+                answers = self._accepted(self.synonyms, meaning, text)
+            generated.append((question, answers, self.word_ids[i]))
+
+        rng.shuffle(generated) # 최종 문제 순서 섞기
+        # 섞은 뒤의 위치를 문제 ID로 사용합니다. 답안 제출 시 이 ID로 정답표와 맞춰 봅니다.
+        for question_id, (question, _answers, _word_id) in enumerate(generated):
+            question.id = question_id
+        return generated
+
+    def _select(self, rng, num_questions: int, prefer_word_ids: Sequence[int]) -> List[int]:
+        if not prefer_word_ids:
+            return rng.sample(range(len(self.texts)), num_questions)
+        positions = {word_id: i for i, word_id in enumerate(self.word_ids)}
+        preferred = list(dict.fromkeys(positions[w] for w in prefer_word_ids if w in positions))[:num_questions]
+        selected, seen = list(preferred), set(preferred)
+        # 남은 자리는 거절 샘플링으로 중복 없이 채웁니다 (출제 수는 단어 수의 절반 이하).
+        while len(selected) < num_questions:
+            i = rng.randrange(len(self.texts))
+            if i not in seen:
+                seen.add(i)
+                selected.append(i)
+        return selected
+
+
+def generate_quiz(words: List[models.Word], rng: Optional[random.Random] = None) -> List[schemas.PracticeQuestion]:
+    """
+    단어 목록을 받아 객관식/주관식 퀴즈 질문 목록을 생성합니다.
+    """
+    return QuizBank.from_words(words).generate_quiz(rng)
+
+
+class ExamPaper:
+    """
+    시험 세션의 미리 직렬화된 시험지입니다.
+
+    문제마다 JSON 조각을 한 번만 만들어 두고, 학생별 응답은 조각의 순서만 바꿔 이어 붙입니다.
+    문항 순서는 seed와 학생 ID로 정해지므로 같은 학생은 항상 같은 순서를 받습니다.
+    """
+
+    __slots__ = ("session_id", "test_id", "shuffle_questions", "seed", "_prefix", "_fragments")
+
+    def __init__(self, session_id: int, test_id: int, title: str, questions: Sequence[dict], shuffle_questions: bool, seed: int):
+        self.session_id = session_id
+        self.test_id = test_id
+        self.shuffle_questions = shuffle_questions
+        self.seed = seed
+        header = json.dumps({"session_id": session_id, "test_id": test_id, "title": title}, ensure_ascii=False)
+        self._prefix = (header[:-1] + ',"questions":[').encode("utf-8")
+        self._fragments = tuple(json.dumps(q, ensure_ascii=False).encode("utf-8") for q in questions)
+
+    def __len__(self) -> int:
+        return len(self._fragments)
+
+    def order_for(self, student_id: Optional[int]) -> List[int]:
+        order = list(range(len(self._fragments)))
+        if self.shuffle_questions and student_id is not None:
+            # 문자열 시드는 프로세스와 관계없이 같은 난수열을 만듭니다.
+            random.Random(f"{self.seed}:{student_id}").shuffle(order)
+        return order
+
+    def render(self, student_id: Optional[int] = None) -> bytes:
+        """schemas.ExamPaper 형식의 JSON 본문을 반환합니다."""
+        body = b",".join(self._fragments[i] for i in self.order_for(student_id))
+        return self._prefix + body + b"]}"
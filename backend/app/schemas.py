@@ -1,6 +1,6 @@
 # backend/app/schemas.py
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional, Union
 from datetime import datetime, date
 # ✨ models.py의 UserRole Enum을 스키마에서도 사용하기 위해 import
@@ -47,6 +47,28 @@ class Wordbook(WordbookBase):
     class Config:
         from_attributes = True
 
+# ✨ 단어장 목록용 요약 스키마 (단어 목록은 상세 조회에서만 내려줍니다)
+class WordbookSummary(WordbookBase):
+    id: int
+    owner_id: int
+    word_count: int = 0
+    last_quiz_score: Optional[float] = None
+    last_quiz_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+# ✨ 파일 업로드(CSV/TSV/XLSX) 결과 스키마
+class UploadRowError(BaseModel):
+    row: int
+    detail: str
+
+class WordbookUploadResult(BaseModel):
+    wordbook: WordbookSummary
+    inserted: int
+    error_count: int
+    errors: List[UploadRowError] = []  # 앞쪽 일부 행의 오류만 담습니다.
+
 # =================================================================
 # 사용자 관련 스키마
 # =================================================================
@@ -88,6 +110,28 @@ class TokenData(BaseModel):
 class UserPasswordUpdate(BaseModel):
     new_password: str
 
+# ✨ 학생 일괄 등록 관련 스키마
+class BulkStudentCreate(BaseModel):
+    username: str = Field(min_length=1)
+    name: str = Field(min_length=1)
+    password: Optional[str] = None
+
+    class Config:
+        str_strip_whitespace = True
+
+class BulkUserResult(BaseModel):
+    row: int
+    username: Optional[str] = None
+    status: str  # 'created' | 'conflict' | 'invalid'
+    id: Optional[int] = None
+    detail: Optional[str] = None
+
+class BulkUserCreateResult(BaseModel):
+    created: int
+    conflicts: int
+    invalid: int
+    results: List[BulkUserResult]
+
 # =================================================================
 # 시험 관련 스키마
 # =================================================================
@@ -95,9 +139,6 @@ class UserPasswordUpdate(BaseModel):
 class TestBase(BaseModel):
     title: str
 
-class TestCreate(TestBase):
-    wordbook_id: int
-
 class Test(TestBase):
     id: int
     wordbook_id: int
@@ -107,9 +148,10 @@ class Test(TestBase):
         from_attributes = True
 
 class BaseQuestion(BaseModel):
+    # 시험지 안에서의 문제 번호 (서버 채점 시 답안과 정답표를 맞추는 데 사용)
+    id: Optional[int] = None
     type: str
     question: str
-    answer: str
 
 class MultipleChoiceQuestion(BaseQuestion):
     type: str = 'multiple_choice'
@@ -119,12 +161,85 @@ class WrittenQuestion(BaseQuestion):
     type: str = 'written'
 
 # API가 여러 종류의 질문을 반환할 수 있도록 Union을 사용합니다.
+# 서버에서 채점하는 퀴즈 세션/시험지용이므로 정답은 포함하지 않습니다 (정답은 Test.answer_key에만 저장).
 QuizQuestion = Union[MultipleChoiceQuestion, WrittenQuestion]
 
-class TestResultCreate(BaseModel):
-    score: float
+# 채점하지 않는 연습 퀴즈(GET /api/wordbooks/{id}/quiz)용 질문은 정답을 함께 보냅니다.
+class PracticeMultipleChoiceQuestion(MultipleChoiceQuestion):
+    answer: str
+
+class PracticeWrittenQuestion(WrittenQuestion):
+    answer: str
+
+PracticeQuestion = Union[PracticeMultipleChoiceQuestion, PracticeWrittenQuestion]
+
+class QuizSession(BaseModel):
+    """퀴즈 시작 시 생성된 시험 기록과 문제를 함께 반환합니다."""
+    test: Test
+    questions: List[QuizQuestion]
+
+class ExamSessionCreate(BaseModel):
+    wordbook_id: int
+    title: Optional[str] = None
+    shuffle_questions: bool = False
+
+class ExamSession(BaseModel):
+    id: int
+    title: str
+    wordbook_id: int
     test_id: int
+    owner_id: int
+    shuffle_questions: bool
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class ExamPaper(BaseModel):
+    """학생에게 전달되는 시험지입니다 (정답 제외). 답안은 /api/tests/{test_id}/submissions에 제출합니다."""
+    session_id: int
+    test_id: int
+    title: str
+    questions: List[QuizQuestion]
+
+class SubmittedAnswer(BaseModel):
+    question_id: int
+    answer: Optional[str] = None
+
+class TestSubmission(BaseModel):
+    """서버 채점용 답안 제출. 답하지 않은 문제는 오답으로 처리됩니다."""
+    answers: List[SubmittedAnswer]
+
+class QuestionOutcome(BaseModel):
+    question_id: int
+    is_correct: bool
+    given_answer: Optional[str] = None
+    correct_answer: str
+
+class GradedTestResult(BaseModel):
+    id: int
+    test_id: int
+    score: float
+    submitted_at: datetime
+    correct_count: int
+    question_count: int
+    outcomes: List[QuestionOutcome]
     
+class DueWord(BaseModel):
+    """복습 시각이 된 단어 (간격 반복 스케줄러)"""
+    word_id: int
+    wordbook_id: int
+    text: str
+    meaning: str
+    part_of_speech: Optional[str] = None
+    example_sentence: Optional[str] = None
+    due_at: datetime
+    repetitions: int
+    lapses: int
+
+    class Config:
+        from_attributes = True
+
 # =================================================================
 # ✨ 학습 리포트 관련 스키마 추가
 # =================================================================
@@ -139,6 +254,8 @@ class WordbookReport(BaseModel):
     id: int
     title: str
     average_score: Optional[float] = None
+    # 이 단어장의 전체 결과 수 (test_results는 limit만큼만 담길 수 있습니다)
+    result_count: int = 0
     test_results: List[TestResultForReport] = []
 
     class Config:
@@ -149,6 +266,46 @@ class StudentReport(BaseModel):
     student_name: str
     assigned_wordbooks_report: List[WordbookReport] = []
 
+# 반 전체 성적표 (GET /api/teacher/reports)
+# 행 단위 객체 대신 같은 필드를 배열로 묶어 응답 크기를 줄입니다.
+class ClassReportStudents(BaseModel):
+    id: List[int] = []
+    name: List[str] = []
+    username: List[str] = []
+
+class ClassReportWordbooks(BaseModel):
+    id: List[int] = []
+    title: List[str] = []
+
+class ClassReportCells(BaseModel):
+    """할당된 (학생, 단어장) 쌍마다 한 칸입니다. 인덱스는 students/wordbooks 배열의 위치입니다."""
+    student_index: List[int] = []
+    wordbook_index: List[int] = []
+    average_score: List[Optional[float]] = []
+    attempts: List[int] = []
+    last_score: List[Optional[float]] = []
+    last_attempt_at: List[Optional[datetime]] = []
+
+class ClassReport(BaseModel):
+    students: ClassReportStudents = Field(default_factory=ClassReportStudents)
+    wordbooks: ClassReportWordbooks = Field(default_factory=ClassReportWordbooks)
+    cells: ClassReportCells = Field(default_factory=ClassReportCells)
+
+# 리더보드 (GET /api/wordbooks/{id}/leaderboard, /api/teachers/{id}/leaderboard)
+class LeaderboardEntry(BaseModel):
+    """rank는 RANK() 기준이라 동점이면 같은 순위이고 다음 순위는 건너뜁니다."""
+    rank: int
+    student_id: int
+    student_name: str
+    score: float
+    attempts: int
+
+class Leaderboard(BaseModel):
+    scope: str
+    scope_id: int
+    metric: str
+    entries: List[LeaderboardEntry] = []
+
 # =================================================================
 # ✨ 학습 통계 관련 스키마 (신규 추가)
 # =================================================================
@@ -159,9 +316,11 @@ class WordbookStat(BaseModel):
     average_score: float
 
 class DailyScore(BaseModel):
-    """날짜별 시험 점수 기록"""
+    """날짜별 시험 점수 기록 (기간 단위 평균이면 date는 기간의 시작일입니다)"""
     date: date # 날짜만 사용
     score: float
+    # 이 점에 합쳐진 시험 결과 수
+    result_count: int = 1
 
 class StudentStats(BaseModel):
     """학생의 전체 학습 통계 데이터"""
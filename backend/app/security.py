@@ -1,66 +1,215 @@
 # backend/app/security.py
 
+import os
+import time
 from datetime import datetime, timedelta, timezone
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from passlib.context import CryptContext
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 # ✨ config.py에서 settings 객체를 직접 임포트합니다.
 from .config import settings
-from . import crud, models, schemas
-from .database import get_db
+from . import crud, crud_async, models, schemas
+from .database import async_read_session, get_async_db, get_db, read_session, recent_writers
+from .cache import principal_cache, token_digest
+from .hashing import HashingPool
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt는 CPU를 많이 쓰므로 공용 스레드풀 대신 전용 프로세스 풀에서 실행합니다.
+hashing_pool = HashingPool(
+    workers=settings.HASH_POOL_WORKERS if settings.HASH_POOL_WORKERS is not None else (os.cpu_count() or 1),
+    queue_limit=settings.HASH_QUEUE_LIMIT,
+    rounds=settings.BCRYPT_ROUNDS,
+    retry_after=settings.HASH_RETRY_AFTER_SECONDS,
+)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    verified, _new_hash = hashing_pool.verify_and_update(plain_password, hashed_password)
+    return verified
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return hashing_pool.hash(password)
 
 def authenticate_user(db: Session, username: str, password: str) -> models.User | None:
     user = crud.get_user_by_username(db, username=username)
     if not user:
         return None
-    if not verify_password(password, user.hashed_password):
+    verified, new_hash = hashing_pool.verify_and_update(password, user.hashed_password)
+    if not verified:
         return None
+    # bcrypt 비용 설정이 바뀌었다면 로그인 시점에 새 비용으로 다시 해싱해 둡니다.
+    if new_hash:
+        crud.rehash_user_password(db, db_user=user, new_hashed_password=new_hash)
     return user
 
 def create_access_token(data: dict):
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
+    # iat는 토큰 폐기(비밀번호 변경/사용자 삭제) 판단을 위해 소수점까지 기록합니다.
+    to_encode.update({"exp": expire, "iat": time.time()})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
+def create_access_token_for_user(user: models.User) -> str:
+    """
+    id/role/name 클레임을 포함한 토큰을 발급합니다.
+    이 클레임 덕분에 get_current_user는 DB 조회 없이 사용자 스냅샷을 만들 수 있습니다.
+    """
+    return create_access_token(data={
+        "sub": user.username,
+        "uid": user.id,
+        "role": user.role.value,
+        "name": user.name,
+        "tv": user.token_version,
+    })
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/token")
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+def _principal_from_token(token: str) -> tuple[schemas.User | None, dict]:
+    """
+    캐시에 있으면 사용자 스냅샷을 반환합니다.
+    없으면 토큰을 검증한 뒤 (None, payload)를 반환하며, 호출한 쪽이 DB로 폐기 여부를 확인합니다.
+    """
+    # 캐시에 있으면 JWT 디코딩과 DB 조회를 모두 건너뜁니다.
+    digest = token_digest(token)
+    cached_user = principal_cache.get(digest)
+    if cached_user is not None:
+        return cached_user, {}
+
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         username: str = payload.get("sub")
         if username is None:
-            raise credentials_exception
-        token_data = schemas.TokenData(username=username)
+            raise _credentials_exception()
     except JWTError:
-        raise credentials_exception
+        raise _credentials_exception()
 
-    user = crud.get_user_by_username(db, username=token_data.username)
-    if user is None:
-        raise credentials_exception
+    user_id = payload.get("uid")
+    if principal_cache.is_revoked(user_id, payload.get("iat")):
+        raise _credentials_exception()
+
+    return None, payload
+
+def _has_principal_claims(payload: dict) -> bool:
+    return all(payload.get(key) is not None for key in ("uid", "role", "name"))
+
+def _token_version_matches(payload: dict, token_version: int | None) -> bool:
+    # tv 클레임이 없는 이전 토큰은 첫 버전(1)으로 발급된 것으로 봅니다.
+    return token_version is not None and payload.get("tv", 1) == token_version
+
+def _principal_from_claims(token: str, payload: dict, token_version: int | None) -> schemas.User:
+    """
+    토큰의 id/role/name 클레임으로 사용자 스냅샷을 만듭니다.
+    token_version은 DB의 users.token_version으로, 다른 워커에서 폐기(비밀번호 변경/삭제)된 토큰을 거부하는 데 씁니다.
+    """
+    if not _token_version_matches(payload, token_version):
+        raise _credentials_exception()
+    user = schemas.User(id=payload["uid"], username=payload["sub"], name=payload["name"], role=payload["role"])
+    principal_cache.put(token_digest(token), payload, user)
+    return user
+
+def _principal_from_db_user(token: str, payload: dict, db_user: models.User | None) -> schemas.User:
+    if (
+        db_user is None
+        or not _token_version_matches(payload, db_user.token_version)
+        or principal_cache.is_revoked(db_user.id, payload.get("iat"))
+    ):
+        raise _credentials_exception()
+    user = schemas.User.model_validate(db_user)
+    principal_cache.put(token_digest(token), payload, user)
     return user
 
-def get_current_teacher(current_user: models.User = Depends(get_current_user)):
+def _require_teacher(current_user: schemas.User) -> schemas.User:
     if current_user.role != models.UserRole.teacher:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, 
             detail="Not enough permissions. Teacher role required."
         )
     return current_user
+
+def ensure_wordbook_access(
+    db_wordbook: models.Wordbook | None,
+    current_user: schemas.User,
+    detail: str = "Not enough permissions",
+) -> models.Wordbook:
+    """단어장 소유 선생님 또는 할당된 학생만 접근할 수 있도록 확인합니다."""
+    if db_wordbook is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Wordbook not found")
+    is_owner = db_wordbook.owner_id == current_user.id
+    is_assigned_student = any(s.id == current_user.id for s in db_wordbook.students)
+    if not (is_owner or is_assigned_student):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
+    return db_wordbook
+
+def ensure_wordbook_meta_access(meta, current_user: schemas.User, detail: str = "Not enough permissions"):
+    """
+    crud.get_wordbook_quiz_meta 결과(owner_id, is_assigned)로 접근 권한을 확인합니다.
+    단어장 전체를 로드하지 않아도 되는 조회용입니다.
+    """
+    if meta is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Wordbook not found")
+    if not (meta.owner_id == current_user.id or meta.is_assigned):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
+    return meta
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+def get_current_user(
+    request: Request, token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
+) -> schemas.User:
+    user, payload = _principal_from_token(token)
+    if user is None:
+        # 캐시에 없으면 token_version을 DB에서 확인해, 다른 워커에서 폐기된 토큰도 거부합니다.
+        if _has_principal_claims(payload):
+            user = _principal_from_claims(token, payload, crud.get_user_token_version(db, payload["uid"]))
+        else:
+            # 이전 형식의 토큰은 DB에서 사용자를 조회합니다.
+            db_user = crud.get_user_by_username(db, username=payload["sub"])
+            user = _principal_from_db_user(token, payload, db_user)
+    # 쓰기 요청을 보낸 사용자는 잠시 동안 복제본 대신 기본 DB에서 읽도록 기록합니다.
+    if request.method not in SAFE_METHODS:
+        recent_writers.mark(user.id)
+    return user
+
+def get_current_teacher(current_user: schemas.User = Depends(get_current_user)) -> schemas.User:
+    return _require_teacher(current_user)
+
+def get_user_read_db(current_user: schemas.User = Depends(get_current_user)):
+    """
+    읽기 전용 엔드포인트용 세션 의존성입니다.
+    복제본을 사용하되, 방금 쓰기를 한 사용자에게는 기본 DB 세션을 제공합니다.
+    """
+    yield from read_session(current_user.id)
+
+# ✨ async 엔드포인트(DB_ASYNC_MODE)용 인증 의존성
+async def get_current_user_async(
+    request: Request, token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)
+) -> schemas.User:
+    user, payload = _principal_from_token(token)
+    if user is None:
+        if _has_principal_claims(payload):
+            user = _principal_from_claims(token, payload, await crud_async.get_user_token_version(db, payload["uid"]))
+        else:
+            db_user = await crud_async.get_user_by_username(db, username=payload["sub"])
+            user = _principal_from_db_user(token, payload, db_user)
+    if request.method not in SAFE_METHODS:
+        recent_writers.mark(user.id)
+    return user
+
+async def get_current_teacher_async(
+    current_user: schemas.User = Depends(get_current_user_async)
+) -> schemas.User:
+    return _require_teacher(current_user)
+
+async def get_user_async_read_db(current_user: schemas.User = Depends(get_current_user_async)):
+    """get_user_read_db의 async 버전입니다. 복제본을 사용하되, 방금 쓰기를 한 사용자에게는 기본 DB 세션을 제공합니다."""
+    async for db in async_read_session(current_user.id):
+        yield db
@@ -0,0 +1,83 @@
+# backend/app/srs.py
+
+from datetime import datetime, timedelta
+from typing import NamedTuple, Optional
+
+from .config import settings
+
+# =================================================================
+# 간격 반복(SM-2) 스케줄러
+# -----------------------------------------------------------------
+# 학생별·단어별 기억 상태(WordMemory)를 퀴즈 채점 결과로 갱신하고,
+# 다음 복습 시각(due_at)을 계산합니다. interval_days에는 SM-2 원래 간격을 저장하고,
+# 설정값(SRS_INTERVAL_MODIFIER, SRS_MAX_INTERVAL_DAYS)은 due_at을 계산할 때만 적용합니다.
+# 그래서 설정을 바꾼 뒤에는 recompute_due_at으로 모든 due_at을 다시 계산할 수 있습니다.
+# =================================================================
+
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+# 정답/오답을 SM-2의 응답 품질(0~5)로 변환한 값
+CORRECT_QUALITY = 4
+INCORRECT_QUALITY = 1
+SECONDS_PER_DAY = 86400.0
+
+
+class MemoryState(NamedTuple):
+    ease: float
+    interval_days: float
+    repetitions: int
+    lapses: int
+
+
+NEW_MEMORY = MemoryState(ease=DEFAULT_EASE, interval_days=0.0, repetitions=0, lapses=0)
+
+
+def review(state: Optional[MemoryState], is_correct: bool) -> MemoryState:
+    """한 번의 채점 결과로 기억 상태를 갱신합니다. state가 None이면 처음 본 단어입니다."""
+    state = state or NEW_MEMORY
+    quality = CORRECT_QUALITY if is_correct else INCORRECT_QUALITY
+    ease = max(MIN_EASE, state.ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+
+    if not is_correct:
+        return MemoryState(ease=ease, interval_days=1.0, repetitions=0, lapses=state.lapses + 1)
+
+    repetitions = state.repetitions + 1
+    if repetitions == 1:
+        interval = 1.0
+    elif repetitions == 2:
+        interval = 6.0
+    else:
+        interval = state.interval_days * state.ease
+    return MemoryState(ease=ease, interval_days=interval, repetitions=repetitions, lapses=state.lapses)
+
+
+def scheduled_days(
+    interval_days: float,
+    modifier: Optional[float] = None,
+    max_days: Optional[float] = None,
+) -> float:
+    modifier = settings.SRS_INTERVAL_MODIFIER if modifier is None else modifier
+    max_days = settings.SRS_MAX_INTERVAL_DAYS if max_days is None else max_days
+    return min(interval_days * modifier, max_days)
+
+
+def due_at(reviewed_at: datetime, interval_days: float) -> datetime:
+    return reviewed_at + timedelta(days=scheduled_days(interval_days))
+
+
+def recompute_due_at(
+    reviewed_at_epoch,
+    interval_days,
+    modifier: Optional[float] = None,
+    max_days: Optional[float] = None,
+):
+    """
+    여러 학생·단어의 due_at을 numpy 배열 연산으로 한 번에 다시 계산합니다.
+    reviewed_at_epoch, interval_days는 같은 길이의 배열이며, 결과는 epoch 초 배열입니다.
+    """
+    import numpy as np
+
+    modifier = settings.SRS_INTERVAL_MODIFIER if modifier is None else modifier
+    max_days = settings.SRS_MAX_INTERVAL_DAYS if max_days is None else max_days
+    days = np.minimum(np.asarray(interval_days, dtype=np.float64) * modifier, max_days)
+    return np.asarray(reviewed_at_epoch, dtype=np.float64) + days * SECONDS_PER_DAY
@@ -0,0 +1,161 @@
+# backend/tests/conftest.py
+"""
+테스트는 실제 PostgreSQL에서 실행합니다.
+
+TEST_DATABASE_URL에는 비워도 되는 테스트 전용 DB를 지정합니다 (시작할 때 모든 테이블을 지우고 다시 만듭니다).
+지정하지 않으면 DB가 필요한 테스트는 건너뜁니다. TEST_DATABASE_REPLICA_URL을 지정하면
+읽기 복제본 라우팅 테스트도 실행합니다 (복제본이 아닌 별도 DB이면 같은 스키마만 만들어 둡니다).
+
+    TEST_DATABASE_URL=postgresql://postgres@localhost/voca_test \
+    TEST_DATABASE_REPLICA_URL=postgresql://postgres@localhost/voca_test_replica python -m pytest
+"""
+import os
+
+import pytest
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+TEST_DATABASE_REPLICA_URL = os.environ.get("TEST_DATABASE_REPLICA_URL")
+
+# app 모듈은 import 시점에 설정을 읽어 엔진을 만들므로 먼저 환경 변수를 맞춰 둡니다.
+os.environ["DATABASE_URL"] = TEST_DATABASE_URL or "postgresql://localhost/voca_test_unset"
+os.environ["DATABASE_REPLICA_URL"] = ""
+os.environ["DB_ASYNC_MODE"] = "false"
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+# 해싱 프로세스 풀 없이 낮은 비용으로 해시해 테스트를 빠르게 합니다.
+os.environ["BCRYPT_ROUNDS"] = "4"
+os.environ["HASH_POOL_WORKERS"] = "0"
+
+from typing import NamedTuple  # noqa: E402
+
+from sqlalchemy import create_engine, text  # noqa: E402
+from sqlalchemy.engine import Engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app import cache, crud, database, grading, models, schemas, security  # noqa: E402
+
+PASSWORD = "pw"
+
+
+def create_schema(engine) -> None:
+    """모든 테이블을 지우고 models 기준으로 다시 만듭니다. pg_trgm이 없으면 trigram 인덱스만 건너뜁니다."""
+    with engine.begin() as conn:
+        has_trgm = conn.scalar(text("SELECT count(*) FROM pg_available_extensions WHERE name = 'pg_trgm'")) > 0
+        if has_trgm:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    for table in models.Base.metadata.tables.values():
+        for index in table.indexes:
+            if index.name.endswith("_trgm"):
+                index.ddl_if(callable_=lambda *args, **kwargs: has_trgm)
+    models.Base.metadata.drop_all(engine)
+    models.Base.metadata.create_all(engine)
+
+
+def truncate_all(engine) -> None:
+    tables = ", ".join(table.name for table in models.Base.metadata.sorted_tables)
+    with engine.begin() as conn:
+        conn.execute(text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))
+
+
+def clear_caches() -> None:
+    cache.principal_cache.clear()
+    cache.quiz_bank_cache.clear()
+    cache.exam_paper_cache.clear()
+    cache.leaderboard_cache.clear()
+    database.recent_writers._until.clear()
+
+
+@pytest.fixture(scope="session")
+def engine():
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    create_schema(database.engine)
+    yield database.engine
+    database.engine.dispose()
+
+
+@pytest.fixture
+def clean_db(engine):
+    """테스트마다 모든 테이블을 비우고 프로세스 안 캐시를 지웁니다."""
+    truncate_all(engine)
+    clear_caches()
+    yield engine
+
+
+@pytest.fixture(scope="session")
+def replica_engine(engine):
+    if not TEST_DATABASE_REPLICA_URL:
+        pytest.skip("TEST_DATABASE_REPLICA_URL is not set")
+    replica = create_engine(TEST_DATABASE_REPLICA_URL)
+    with replica.connect() as conn:
+        in_recovery = conn.scalar(text("SELECT pg_is_in_recovery()"))
+    if not in_recovery:
+        create_schema(replica)
+    yield replica
+    replica.dispose()
+
+
+class DatabasePair(NamedTuple):
+    primary: Engine
+    # 복제본을 설정하지 않았으면 primary와 같은 엔진입니다.
+    replica: Engine
+
+
+@pytest.fixture(params=["DATABASE_URL", "DATABASE_URL+DATABASE_REPLICA_URL"])
+def database_pair(request, clean_db, monkeypatch):
+    """
+    DATABASE_URL만 설정한 경우와 DATABASE_REPLICA_URL까지 설정한 경우를 번갈아 만듭니다.
+    database 모듈은 import 시점에 복제본 엔진을 만들므로, 두 번째 경우에는 그 결과를 같은 방식으로 바꿔 끼웁니다.
+    """
+    if request.param == "DATABASE_URL":
+        yield DatabasePair(database.engine, database.engine)
+        return
+    replica = request.getfixturevalue("replica_engine")
+    monkeypatch.setattr(database, "read_engine", replica)
+    monkeypatch.setattr(database, "ReadSessionLocal", sessionmaker(autocommit=False, autoflush=False, bind=replica))
+    yield DatabasePair(database.engine, replica)
+
+
+@pytest.fixture
+def db(clean_db):
+    session = database.SessionLocal()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def client(clean_db):
+    from fastapi.testclient import TestClient
+    from app import main
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+
+def create_user(db, username: str, role: str = "student", name=None) -> models.User:
+    return crud.create_user(
+        db,
+        schemas.UserCreate(username=username, name=name or username, password=PASSWORD, role=role),
+        security.get_password_hash(PASSWORD),
+    )
+
+
+def auth_headers(client, username: str) -> dict:
+    response = client.post("/api/token", data={"username": username, "password": PASSWORD})
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def submit_quiz(db, wordbook_id: int, student_id: int, correct: bool = True) -> schemas.GradedTestResult:
+    """퀴즈를 출제하고, 정답표의 정답(correct=False이면 빈 답안)으로 채점한 결과를 저장합니다."""
+    meta = crud.get_wordbook_quiz_meta(db, wordbook_id=wordbook_id, user_id=student_id)
+    session = crud.create_quiz_session(
+        db, wordbook_id=wordbook_id, title="quiz", creator_id=student_id, version=(meta.word_count, meta.max_word_id)
+    )
+    answer_key = crud.get_test_for_submission(db, test_id=session.test.id, user_id=student_id).answer_key
+    answers = {
+        question.id: answer_key[question.id]["answer"] if correct else None
+        for question in session.questions
+    }
+    outcomes = grading.AnswerKey(answer_key).grade(answers)
+    return crud.create_graded_test_result(db, test_id=session.test.id, student_id=student_id, outcomes=outcomes)
@@ -0,0 +1,83 @@
+# backend/tests/test_bulk_users.py
+"""
+학생 일괄 등록(/api/users/bulk)이 선생님 인증을 본문보다 먼저 확인하고,
+본문 크기와 행 수 제한을 본문을 받는 동안 적용하는지 확인합니다.
+"""
+from sqlalchemy import func, select
+
+from app import main, models
+from conftest import auth_headers, create_user
+
+BULK_URL = "/api/users/bulk"
+
+
+def student_csv(count: int, header: bool = True) -> bytes:
+    lines = ["username,name"] if header else []
+    lines += [f"student{i},Student {i}" for i in range(count)]
+    return ("\r\n".join(lines) + "\r\n").encode()
+
+
+def student_count(db) -> int:
+    return db.scalar(select(func.count()).select_from(models.User).where(models.User.role == models.UserRole.student))
+
+
+def test_bulk_csv_creates_students(db, client):
+    create_user(db, "teacher", role="teacher")
+    headers = {**auth_headers(client, "teacher"), "Content-Type": "text/csv"}
+
+    response = client.post(BULK_URL, headers=headers, content=student_csv(3))
+
+    assert response.status_code == 200, response.text
+    assert response.json()["created"] == 3
+
+
+def test_bulk_multipart_keeps_quoted_newlines(db, client):
+    create_user(db, "teacher", role="teacher")
+    body = b'\xef\xbb\xbfusername,name\nkim,"Kim\nMin"\nlee,Lee\n'
+
+    response = client.post(BULK_URL, headers=auth_headers(client, "teacher"), files={"file": ("s.csv", body, "text/csv")})
+
+    assert response.status_code == 200, response.text
+    assert [r["username"] for r in response.json()["results"]] == ["kim", "lee"]
+
+
+def test_bulk_checks_teacher_before_reading_body(db, client, monkeypatch):
+    create_user(db, "student")
+    monkeypatch.setattr(main, "BULK_USER_MAX_BYTES", 10)
+    oversized = student_csv(10)
+
+    anonymous = client.post(BULK_URL, headers={"Content-Type": "text/csv"}, content=oversized)
+    student = client.post(BULK_URL, headers={**auth_headers(client, "student"), "Content-Type": "text/csv"}, content=oversized)
+
+    assert anonymous.status_code == 401
+    assert student.status_code == 403
+
+
+def test_bulk_rejects_oversized_body_while_streaming(db, client, monkeypatch):
+    create_user(db, "teacher", role="teacher")
+    monkeypatch.setattr(main, "BULK_USER_MAX_BYTES", 64)
+    headers = {**auth_headers(client, "teacher"), "Content-Type": "text/csv"}
+
+    def chunks():
+        # Content-Length 없이 조각으로 보내도 받은 크기로 거부해야 합니다.
+        for i in range(100):
+            yield f"student{i},Student {i}\n".encode()
+
+    assert client.post(BULK_URL, headers=headers, content=chunks()).status_code == 413
+    assert client.post(BULK_URL, headers=headers, content=student_csv(10)).status_code == 413
+    assert student_count(db) == 0
+
+
+def test_bulk_rejects_too_many_rows(db, client, monkeypatch):
+    create_user(db, "teacher", role="teacher")
+    monkeypatch.setattr(main, "BULK_USER_MAX_ROWS", 2)
+    headers = auth_headers(client, "teacher")
+    students = [{"username": f"student{i}", "name": f"Student {i}"} for i in range(3)]
+
+    csv_response = client.post(BULK_URL, headers={**headers, "Content-Type": "text/csv"}, content=student_csv(3))
+    file_response = client.post(BULK_URL, headers=headers, files={"file": ("s.csv", student_csv(3), "text/csv")})
+    json_response = client.post(BULK_URL, headers=headers, json={"students": students})
+
+    assert [r.status_code for r in (csv_response, file_response, json_response)] == [413, 413, 413]
+    assert student_count(db) == 0
+    assert client.post(BULK_URL, headers=headers, json=students[:2]).status_code == 200
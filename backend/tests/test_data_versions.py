@@ -0,0 +1,164 @@
+# backend/tests/test_data_versions.py
+"""
+데이터를 바꾸는 crud 경로마다 users.data_version / wordbooks.version이 올라가고,
+그 버전으로 만드는 ETag(단어장 목록/상세, 학생 리포트, 통계)가 바뀌어 304가 나오지 않는지 확인합니다.
+"""
+import pytest
+
+from app import crud, schemas
+from conftest import auth_headers, create_user, submit_quiz
+
+WORDS = [schemas.WordCreate(text=f"word{i}", meaning=f"meaning{i}") for i in range(5)]
+
+
+@pytest.fixture
+def classroom(db):
+    teacher = create_user(db, "teacher", role="teacher")
+    student = create_user(db, "student")
+    other = create_user(db, "other")
+    return teacher, student, other
+
+
+def create_wordbook(db, teacher, students):
+    return crud.create_wordbook_for_students(
+        db,
+        schemas.WordbookUpload(title="wordbook", words=WORDS, student_ids=[s.id for s in students]),
+        teacher_id=teacher.id,
+    )
+
+
+def user_versions(db, *users):
+    return [crud.get_user_data_version(db, user.id) for user in users]
+
+
+def wordbook_version(db, wordbook_id):
+    meta = crud.get_wordbook_version_meta(db, wordbook_id=wordbook_id, user_id=0)
+    return meta.version if meta else None
+
+
+def fetch_etag(client, url, headers):
+    response = client.get(url, headers=headers)
+    assert response.status_code == 200, response.text
+    etag = response.headers["ETag"]
+    # 바뀐 것이 없으면 같은 ETag로 304가 나와야 합니다.
+    assert client.get(url, headers={**headers, "If-None-Match": etag}).status_code == 304
+    return etag
+
+
+def assert_etag_changed(client, url, headers, old_etag):
+    response = client.get(url, headers={**headers, "If-None-Match": old_etag})
+    assert response.status_code == 200, response.text
+    assert response.headers["ETag"] != old_etag
+
+
+def test_create_wordbook_for_students_bumps_audience(db, client, classroom):
+    teacher, student, other = classroom
+    headers = auth_headers(client, "student")
+    list_etag = fetch_etag(client, "/api/wordbooks/", headers)
+    before = user_versions(db, teacher, student, other)
+
+    create_wordbook(db, teacher, [student])
+
+    after = user_versions(db, teacher, student, other)
+    assert after[0] > before[0]
+    assert after[1] > before[1]
+    assert after[2] == before[2]
+    assert_etag_changed(client, "/api/wordbooks/", headers, list_etag)
+
+
+def test_create_wordbook_from_rows_bumps_audience(db, client, classroom):
+    teacher, student, other = classroom
+    headers = auth_headers(client, "student")
+    list_etag = fetch_etag(client, "/api/wordbooks/", headers)
+    before = user_versions(db, teacher, student, other)
+
+    rows = [(i + 1, word.model_dump(), None) for i, word in enumerate(WORDS)]
+    result = crud.create_wordbook_from_rows(db, "rows", None, teacher.id, [student.id], rows)
+
+    assert result.inserted == len(WORDS)
+    after = user_versions(db, teacher, student, other)
+    assert after[0] > before[0]
+    assert after[1] > before[1]
+    assert after[2] == before[2]
+    assert_etag_changed(client, "/api/wordbooks/", headers, list_etag)
+
+
+def test_create_wordbook_from_rows_without_words_keeps_versions(db, classroom):
+    teacher, student, _ = classroom
+    before = user_versions(db, teacher, student)
+
+    result = crud.create_wordbook_from_rows(db, "empty", None, teacher.id, [student.id], [(1, None, "missing meaning")])
+
+    assert result is None
+    assert user_versions(db, teacher, student) == before
+
+
+@pytest.mark.parametrize("remove", [
+    crud.detach_wordbook,
+    crud.delete_wordbook,
+    crud.purge_wordbook,
+])
+def test_wordbook_removal_bumps_audience(db, client, classroom, remove):
+    teacher, student, other = classroom
+    wordbook_id = create_wordbook(db, teacher, [student]).id
+    submit_quiz(db, wordbook_id, student.id)
+    student_headers = auth_headers(client, "student")
+    teacher_headers = auth_headers(client, "teacher")
+    list_etag = fetch_etag(client, "/api/wordbooks/", student_headers)
+    detail_etag = fetch_etag(client, f"/api/wordbooks/{wordbook_id}", teacher_headers)
+    report_url = f"/api/students/{student.id}/report"
+    report_etag = fetch_etag(client, report_url, teacher_headers)
+    before = user_versions(db, teacher, student, other)
+    before_wordbook = wordbook_version(db, wordbook_id)
+
+    remove(db, wordbook_id)
+
+    after = user_versions(db, teacher, student, other)
+    assert after[0] > before[0]
+    assert after[1] > before[1]
+    assert after[2] == before[2]
+    assert_etag_changed(client, "/api/wordbooks/", student_headers, list_etag)
+    assert_etag_changed(client, report_url, teacher_headers, report_etag)
+    if remove is crud.detach_wordbook:
+        # 할당만 끊고 단어장은 남아 있으므로 상세 ETag도 바뀌어야 합니다.
+        assert wordbook_version(db, wordbook_id) > before_wordbook
+        assert_etag_changed(client, f"/api/wordbooks/{wordbook_id}", teacher_headers, detail_etag)
+    else:
+        assert wordbook_version(db, wordbook_id) is None
+
+
+def test_create_graded_test_result_bumps_student(db, client, classroom):
+    teacher, student, other = classroom
+    wordbook = create_wordbook(db, teacher, [student, other])
+    student_headers = auth_headers(client, "student")
+    teacher_headers = auth_headers(client, "teacher")
+    list_etag = fetch_etag(client, "/api/wordbooks/", student_headers)
+    stats_etag = fetch_etag(client, "/api/students/me/stats", student_headers)
+    report_url = f"/api/students/{student.id}/report"
+    report_etag = fetch_etag(client, report_url, teacher_headers)
+    before = user_versions(db, student, other)
+
+    submit_quiz(db, wordbook.id, student.id, correct=False)
+
+    after = user_versions(db, student, other)
+    assert after[0] > before[0]
+    assert after[1] == before[1]
+    # 목록의 마지막 퀴즈 결과, 통계, 리포트가 모두 바뀝니다.
+    assert_etag_changed(client, "/api/wordbooks/", student_headers, list_etag)
+    assert_etag_changed(client, "/api/students/me/stats", student_headers, stats_etag)
+    assert_etag_changed(client, report_url, teacher_headers, report_etag)
+
+
+def test_rebuild_score_rollups_bumps_every_user(db, client, classroom):
+    teacher, student, other = classroom
+    wordbook = create_wordbook(db, teacher, [student])
+    submit_quiz(db, wordbook.id, student.id)
+    student_headers = auth_headers(client, "student")
+    stats_etag = fetch_etag(client, "/api/students/me/stats", student_headers)
+    before = user_versions(db, teacher, student, other)
+
+    crud.rebuild_score_rollups(db, batch_size=2)
+
+    after = user_versions(db, teacher, student, other)
+    assert all(a > b for a, b in zip(after, before))
+    assert_etag_changed(client, "/api/students/me/stats", student_headers, stats_etag)
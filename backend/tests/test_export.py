@@ -0,0 +1,73 @@
+# backend/tests/test_export.py
+"""시험 결과 내보내기 스트림을 다시 읽어 행과 스키마가 그대로인지 확인합니다 (DB 불필요)."""
+import csv
+import io
+from datetime import datetime, timezone
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from app import export
+
+SUBMITTED_AT = datetime(2026, 10, 1, 9, 30, tzinfo=timezone.utc)
+PARTITIONS = [
+    [
+        (1, SUBMITTED_AT, 80.0, 10, "kim", "김철수", 3, "토익 1일차", 7, "quiz"),
+        (2, SUBMITTED_AT, 95.5, 11, "lee", "이영희", 3, "토익 1일차", 8, "quiz"),
+    ],
+    [
+        (3, SUBMITTED_AT, 60.0, 10, "kim", "김철수", 4, "수능", 9, "exam"),
+    ],
+]
+ROWS = [row for rows in PARTITIONS for row in rows]
+
+
+def exported_bytes(export_format: str) -> bytes:
+    export.check_format(export_format)
+    return b"".join(export.iter_export_chunks(iter(PARTITIONS), export_format))
+
+
+def test_arrow_export_round_trips():
+    reader = pa.ipc.open_stream(exported_bytes("arrow"))
+    table = reader.read_all()
+
+    assert table.column_names == list(export.EXPORT_COLUMNS)
+    assert [tuple(row.values()) for row in table.to_pylist()] == ROWS
+    # 행 묶음마다 레코드 배치 하나씩 씁니다.
+    assert len(table.to_batches()) == len(PARTITIONS)
+
+
+def test_parquet_export_round_trips():
+    parquet_file = pq.ParquetFile(io.BytesIO(exported_bytes("parquet")))
+    table = parquet_file.read()
+
+    assert table.schema.field("submitted_at").type == pa.timestamp("us", tz="UTC")
+    assert [tuple(row.values()) for row in table.to_pylist()] == ROWS
+    assert parquet_file.num_row_groups == len(PARTITIONS)
+
+
+@pytest.mark.parametrize("export_format", ["arrow", "parquet"])
+def test_empty_export_keeps_schema(export_format):
+    data = b"".join(export.iter_export_chunks(iter([]), export_format))
+    if export_format == "arrow":
+        table = pa.ipc.open_stream(data).read_all()
+    else:
+        table = pq.read_table(io.BytesIO(data))
+
+    assert table.num_rows == 0
+    assert table.column_names == list(export.EXPORT_COLUMNS)
+
+
+def test_csv_export_has_bom_and_header():
+    text = exported_bytes("csv").decode("utf-8")
+
+    assert text.startswith("\ufeff")
+    rows = list(csv.reader(io.StringIO(text.lstrip("\ufeff"))))
+    assert rows[0] == list(export.EXPORT_COLUMNS)
+    assert [row[4] for row in rows[1:]] == ["kim", "lee", "kim"]
+
+
+def test_unknown_format_is_rejected():
+    with pytest.raises(export.UnsupportedExport):
+        export.check_format("xlsx")
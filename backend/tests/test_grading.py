@@ -0,0 +1,103 @@
+# backend/tests/test_grading.py
+"""
+서버 채점(grading)의 정규화, 편집 거리, 정답표 채점을 확인합니다.
+조사는 정답에 조사를 붙인 답만 인정하고, 비슷한 다른 단어는 거부해야 합니다.
+"""
+import unicodedata
+
+import pytest
+
+from app.grading import AnswerKey, allowed_distance, normalize, variants, within_distance
+
+
+def is_correct(answer: str, given: str, question_type: str = "written") -> bool:
+    key = AnswerKey([{"type": question_type, "answer": answer}])
+    return key.grade({0: given})[0].is_correct
+
+
+@pytest.mark.parametrize("answer, given", [
+    ("고양이", "고양이가"),
+    ("고양이", "고양이다"),
+    ("사과", "사과를"),
+    ("학교", "학교에서"),
+    ("사과 먹다", "사과를 먹다"),
+    ("사과, 사과나무", "사과나무의"),
+])
+def test_particle_after_accepted_answer_is_correct(answer, given):
+    assert is_correct(answer, given)
+
+
+@pytest.mark.parametrize("answer, given", [
+    # 정답 끝 글자가 조사와 같아도 그 글자를 뺀 답은 다른 단어입니다.
+    ("고양이", "고양"),
+    ("나이", "나"),
+    ("바다", "바"),
+    # 한 글자 정답에 조사처럼 보이는 글자를 붙이면 다른 단어가 됩니다.
+    ("나", "나이"),
+    ("고양이", "고양을"),
+])
+def test_near_miss_is_wrong(answer, given):
+    assert not is_correct(answer, given)
+
+
+def test_fuzzy_match_does_not_accept_truncated_answer():
+    # 세 글자 정답은 오타를 허용하지 않으므로 "고양"이 편집 거리로 통과하지 않아야 합니다.
+    assert allowed_distance(normalize("고양이")) == 0
+    assert variants("고양이") == frozenset({"고양이"})
+    assert not within_distance("고양", "고양이", allowed_distance(normalize("고양이")))
+
+
+def test_typo_with_particle_is_wrong():
+    # 오타 허용과 조사 허용을 겹쳐 적용하지 않습니다.
+    assert is_correct("컴퓨터과학", "컴퓨터과핵")
+    assert not is_correct("컴퓨터과학", "컴퓨터과핵을")
+
+
+@pytest.mark.parametrize("text, expected", [
+    (None, ""),
+    ("", ""),
+    ("  Apple  ", "apple"),
+    ("사과 (과일)", "사과"),
+    ("“사과!”", "사과"),
+    ("big   red\tapple", "big red apple"),
+    # 조합형(NFD) 한글도 완성형과 같게 봅니다.
+    ("사과", "사과"),
+])
+def test_normalize(text, expected):
+    assert normalize(text) == expected
+
+
+def test_variants_split_alternatives():
+    assert variants("사과, 사과나무 / Apple") == frozenset({"사과, 사과나무 / apple", "사과", "사과나무", "apple"})
+
+
+@pytest.mark.parametrize("a, b, max_distance, expected", [
+    ("apple", "apple", 0, True),
+    ("apple", "appel", 1, False),
+    ("apple", "appel", 2, True),
+    ("apple", "aple", 1, True),
+    ("apple", "apples", 1, True),
+    ("apple", "applesauce", 2, False),
+    ("kitten", "sitting", 3, True),
+    ("kitten", "sitting", 2, False),
+    ("", "ab", 2, True),
+    ("ab", "", 1, False),
+])
+def test_within_distance(a, b, max_distance, expected):
+    assert within_distance(a, b, max_distance) is expected
+    assert within_distance(b, a, max_distance) is expected
+
+
+@pytest.mark.parametrize("answer, expected", [("cat", 0), ("apple", 1), ("elephant", 2)])
+def test_allowed_distance_grows_with_length(answer, expected):
+    assert allowed_distance(answer) == expected
+
+
+def test_multiple_choice_requires_exact_choice():
+    key = AnswerKey([{"type": "multiple_choice", "answer": "사과", "answers": ["사과", "능금"]}])
+
+    outcomes = key.grade({0: "능금"})
+
+    assert outcomes[0].is_correct
+    assert not key.grade({0: "사과를"})[0].is_correct
+    assert not key.grade({})[0].is_correct
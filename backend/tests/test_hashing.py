@@ -0,0 +1,71 @@
+# backend/tests/test_hashing.py
+"""HashingPool의 입장 제어가 일괄 해싱(hash_many)에는 시작할 때 한 번만 적용되는지 확인합니다."""
+import pytest
+
+from app.hashing import HashingOverloaded, HashingPool, _verify_and_update
+
+ROUNDS = 4
+
+
+@pytest.fixture
+def pool():
+    hashing_pool = HashingPool(workers=2, queue_limit=1, rounds=ROUNDS)
+    yield hashing_pool
+    hashing_pool.shutdown()
+
+
+def test_hash_many_hashes_every_password(pool):
+    passwords = [f"password{i}" for i in range(5)]
+
+    hashed = pool.hash_many(passwords)
+
+    assert all(_verify_and_update(p, h, ROUNDS)[0] for p, h in zip(passwords, hashed))
+    stats = pool.stats()
+    assert stats["completed"] == len(passwords)
+    assert stats["in_flight"] == 0
+
+
+def test_hash_many_holds_worker_slots_for_the_whole_batch(pool, monkeypatch):
+    seen_in_flight = []
+    record_completed = pool._record_completed
+
+    def record_and_watch(started, count=1):
+        seen_in_flight.append(pool.stats()["in_flight"])
+        record_completed(started, count)
+
+    monkeypatch.setattr(pool, "_record_completed", record_and_watch)
+
+    pool.hash_many([f"password{i}" for i in range(5)])
+
+    # 작업 프로세스 2개만큼의 자리를 세 묶음(2, 2, 1) 내내 유지하고, 끝나면 모두 돌려줍니다.
+    assert seen_in_flight == [2, 2, 2]
+    assert pool.stats()["in_flight"] == 0
+
+
+def test_hash_many_overload_fails_before_any_work(pool):
+    # 자리 3개 중 2개를 다른 요청이 쓰고 있으면, 자리 2개가 필요한 일괄 해싱은 시작하지 않고 거부됩니다.
+    pool._admit(2)
+
+    with pytest.raises(HashingOverloaded):
+        pool.hash_many([f"password{i}" for i in range(5)])
+
+    stats = pool.stats()
+    assert stats["rejected"] == 1
+    assert stats["completed"] == 0
+    assert stats["in_flight"] == 2
+    # 거부되면서 잡았던 자리는 돌려주므로 단건 요청은 남은 한 자리로 처리됩니다.
+    assert pool.hash("c")
+
+
+def test_hash_many_without_workers_uses_one_slot():
+    inline_pool = HashingPool(workers=0, queue_limit=0, rounds=ROUNDS)
+
+    inline_pool.hash_many(["a", "b", "c"])
+
+    assert inline_pool.stats()["completed"] == 3
+    # 자리가 하나뿐이어도 일괄 해싱이 끝나면 돌려주므로 단건 요청을 받을 수 있습니다.
+    assert inline_pool.hash("d")
+    inline_pool._admit()
+    with pytest.raises(HashingOverloaded):
+        inline_pool.hash_many(["e"])
+    assert inline_pool.stats()["completed"] == 4
@@ -0,0 +1,93 @@
+# backend/tests/test_ingest.py
+"""업로드 파일 파싱(ingest): 단어장 CSV/TSV/XLSX 행 읽기와 학생 일괄 등록 CSV 조각 읽기를 확인합니다."""
+import io
+
+import pytest
+from openpyxl import Workbook
+
+from app import ingest
+
+
+def word_rows(data: bytes, filename: str, content_type=None):
+    return list(ingest.iter_word_rows(io.BytesIO(data), filename, content_type))
+
+
+def xlsx_bytes(rows) -> bytes:
+    workbook = Workbook()
+    for row in rows:
+        workbook.active.append(row)
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def test_csv_skips_header_and_blank_rows():
+    data = "\ufeff단어,뜻,품사,예문\napple,사과,n,An apple a day\n\n, ,\nrun,달리다\n".encode("utf-8")
+
+    rows = word_rows(data, "words.csv")
+
+    assert rows == [
+        (2, {"text": "apple", "meaning": "사과", "part_of_speech": "n", "example_sentence": "An apple a day"}, None),
+        (5, {"text": "run", "meaning": "달리다", "part_of_speech": None, "example_sentence": None}, None),
+    ]
+
+
+def test_missing_meaning_is_reported_with_row_number():
+    rows = word_rows(b"apple,\nrun,run fast\n", "words.csv")
+
+    assert rows[0] == (1, None, "Both word and meaning are required")
+    assert rows[1][1]["meaning"] == "run fast"
+
+
+@pytest.mark.parametrize("filename, content_type", [("words.tsv", None), ("upload", "text/tab-separated-values")])
+def test_tsv_is_detected_by_extension_or_content_type(filename, content_type):
+    rows = word_rows("apple\t사과, 능금\tn\n".encode("utf-8"), filename, content_type)
+
+    assert rows == [(1, {"text": "apple", "meaning": "사과, 능금", "part_of_speech": "n", "example_sentence": None}, None)]
+
+
+def test_xlsx_rows_are_read_as_strings():
+    data = xlsx_bytes([["text", "meaning"], ["apple", "사과"], [None, None], [2026, "연도"]])
+
+    rows = word_rows(data, "words.xlsx")
+
+    assert [(number, word["text"], word["meaning"]) for number, word, _ in rows] == [(2, "apple", "사과"), (4, "2026", "연도")]
+
+
+def test_invalid_encoding_and_files_are_rejected():
+    with pytest.raises(ingest.InvalidUpload):
+        word_rows("apple,사과\n".encode("cp949"), "words.csv")
+    with pytest.raises(ingest.InvalidUpload):
+        word_rows(b"not a zip file", "words.xlsx")
+    with pytest.raises(ingest.UnsupportedUpload):
+        word_rows(b"", "words.xls")
+
+
+def read_students(data: bytes, chunk_size: int):
+    reader = ingest.StudentCsvReader()
+    students = []
+    for i in range(0, len(data), chunk_size):
+        students += reader.feed(data[i:i + chunk_size])
+    return students + reader.feed(b"", final=True)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 1024])
+def test_student_csv_reader_handles_any_chunking(chunk_size):
+    data = '\ufeffPassword,Username,name\r\n,kim,"Kim\r\nMin"\r\n\r\npw,lee,"Lee ""J"""\r\n'.encode("utf-8")
+
+    assert read_students(data, chunk_size) == [
+        {"username": "kim", "name": "Kim\r\nMin"},
+        {"password": "pw", "username": "lee", "name": 'Lee "J"'},
+    ]
+
+
+def test_student_csv_without_header_uses_default_columns():
+    assert read_students("kim,김민,secret\nlee,이준".encode("utf-8"), 4) == [
+        {"username": "kim", "name": "김민", "password": "secret"},
+        {"username": "lee", "name": "이준"},
+    ]
+
+
+def test_student_csv_reader_rejects_invalid_utf8():
+    with pytest.raises(UnicodeDecodeError):
+        read_students("kim,김민\n".encode("cp949"), 64)
@@ -0,0 +1,57 @@
+# backend/tests/test_leaderboard.py
+"""리더보드 상위 K명 스냅샷(TopK)이 점수 변경을 정확히 반영하거나, 반영할 수 없을 때 False를 돌려주는지 확인합니다."""
+from app.leaderboard import LeaderboardEntry, TopK
+
+
+def entry(student_id: int, score: float, name=None) -> LeaderboardEntry:
+    return LeaderboardEntry(student_id=student_id, student_name=name or f"student{student_id}", score=score, attempts=1)
+
+
+def ids(top: TopK):
+    return [e.student_id for e in top.entries]
+
+
+def test_entries_are_sorted_by_score_then_name_and_trimmed():
+    top = TopK(3, [entry(1, 50), entry(2, 90, "b"), entry(3, 90, "a"), entry(4, 70)], complete=False)
+
+    assert ids(top) == [3, 2, 4]
+
+
+def test_update_inserts_and_moves_students():
+    top = TopK(3, [entry(1, 90), entry(2, 80), entry(3, 70)], complete=True)
+
+    assert top.update(entry(3, 95))
+    assert ids(top) == [3, 1, 2]
+    # 목록이 가득 찬 상태에서 새 학생이 들어오면 마지막 학생이 밀려나고, 이제 밖의 점수는 모릅니다.
+    assert top.update(entry(4, 85))
+    assert ids(top) == [3, 1, 4]
+    assert top.complete is False
+
+
+def test_score_below_floor_outside_list_is_a_no_op():
+    top = TopK(2, [entry(1, 90), entry(2, 80)], complete=False)
+
+    assert top.update(entry(5, 10))
+    assert ids(top) == [1, 2]
+
+
+def test_student_in_list_dropping_below_floor_cannot_be_kept():
+    top = TopK(2, [entry(1, 90), entry(2, 80)], complete=False)
+
+    # 빈자리를 채울 다음 학생을 모르므로 스냅샷을 버려야 합니다.
+    assert top.update(entry(1, 10)) is False
+
+
+def test_complete_list_can_take_any_score():
+    top = TopK(3, [entry(1, 90), entry(2, 80)], complete=True)
+
+    assert top.update(entry(1, 10))
+    assert ids(top) == [2, 1]
+    assert top.complete is True
+
+
+def test_ranked_shares_rank_for_ties_and_skips_next():
+    top = TopK(5, [entry(1, 90), entry(2, 80), entry(3, 80), entry(4, 70)], complete=True)
+
+    assert [(rank, e.student_id) for rank, e in top.ranked(4)] == [(1, 1), (2, 2), (2, 3), (4, 4)]
+    assert [rank for rank, _ in top.ranked(2)] == [1, 2]
@@ -0,0 +1,218 @@
+# backend/tests/test_query_plans.py
+"""
+crud.py의 주요 조회/쓰기 경로가 실행하는 SQL을 그대로 모아 EXPLAIN하고,
+외래 키 인덱스가 있어야 하는 테이블을 순차 스캔(Seq Scan)하지 않는지 확인합니다.
+데이터는 반 20개 × 학생 100명 규모로 넣고 ANALYZE한 뒤 실행 계획을 봅니다.
+"""
+import json
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import event, text
+
+from app import crud, database, grading, schemas
+from conftest import clear_caches, truncate_all
+
+# 행 수가 늘어나면 순차 스캔이 곧 장애가 되는 테이블
+GUARDED_TABLES = {"words", "tests", "test_results", "student_wordbook_association"}
+
+TEACHERS = 20
+STUDENTS_PER_TEACHER = 100
+WORDBOOKS_PER_TEACHER = 10
+WORDS_PER_WORDBOOK = 100
+ATTEMPTS_PER_ASSIGNMENT = 3
+
+SEED_SQL = [
+    # 선생님 1..TEACHERS, 학생은 그 뒤 ID로 반마다 STUDENTS_PER_TEACHER명
+    """
+    INSERT INTO users (id, name, username, hashed_password, role)
+    SELECT i, 'teacher ' || i, 'teacher' || i, 'x', 'teacher' FROM generate_series(1, :teachers) AS i
+    """,
+    """
+    INSERT INTO users (id, name, username, hashed_password, role)
+    SELECT :teachers + i, 'student ' || i, 'student' || i, 'x', 'student'
+    FROM generate_series(1, :teachers * :students_per_teacher) AS i
+    """,
+    """
+    INSERT INTO wordbooks (id, title, owner_id)
+    SELECT i, 'wordbook ' || i, (i - 1) % :teachers + 1
+    FROM generate_series(1, :teachers * :wordbooks_per_teacher) AS i
+    """,
+    """
+    INSERT INTO words (id, text, meaning, part_of_speech, wordbook_id)
+    SELECT (wb - 1) * :words_per_wordbook + n, 'word' || n, 'meaning ' || wb || '-' || n,
+           (ARRAY['noun', 'verb', 'adjective'])[n % 3 + 1], wb
+    FROM generate_series(1, :teachers * :wordbooks_per_teacher) AS wb,
+         generate_series(1, :words_per_wordbook) AS n
+    """,
+    # 학생은 자기 반 선생님의 단어장 절반에 할당됩니다.
+    """
+    INSERT INTO student_wordbook_association (student_id, wordbook_id)
+    SELECT u.id, wb.id
+    FROM users u
+    JOIN wordbooks wb ON wb.owner_id = (u.id - :teachers - 1) % :teachers + 1
+                     AND (u.id + (wb.id - 1) / :teachers) % 2 = 0
+    WHERE u.role = 'student'
+    """,
+    """
+    INSERT INTO tests (id, title, wordbook_id, creator_id)
+    SELECT row_number() OVER (), 'quiz', a.wordbook_id, a.student_id
+    FROM student_wordbook_association a, generate_series(1, :attempts) AS attempt
+    """,
+    """
+    INSERT INTO test_results (id, score, test_id, student_id, submitted_at)
+    SELECT t.id, (t.id * 37) % 101, t.id, t.creator_id, now() - ((t.id % 90) || ' days')::interval
+    FROM tests t
+    """,
+    """
+    INSERT INTO word_memories (student_id, word_id, ease, interval_days, repetitions, lapses, last_reviewed_at, due_at)
+    SELECT a.student_id, w.id, 2.5, 1, 1, 0, now() - interval '2 days', now() - ((w.id % 5) || ' days')::interval
+    FROM student_wordbook_association a
+    JOIN words w ON w.wordbook_id = a.wordbook_id AND w.id % 10 = 0
+    """,
+]
+
+
+@contextmanager
+def captured_statements(engine):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if executemany:
+            parameters = parameters[0] if parameters else {}
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def seq_scans(plan: dict):
+    """실행 계획 트리에서 Seq Scan 노드의 테이블 이름을 모두 찾습니다."""
+    if plan.get("Node Type") == "Seq Scan":
+        yield plan["Relation Name"]
+    for child in plan.get("Plans", ()):
+        yield from seq_scans(child)
+
+
+def explain(engine, statement: str, parameters) -> dict:
+    """
+    시험 데이터는 운영보다 훨씬 작아서 플래너가 인덱스가 있어도 순차 스캔을 고를 수 있습니다.
+    enable_seqscan을 끄면 쓸 수 있는 인덱스가 없을 때만 Seq Scan이 남으므로,
+    인덱스 누락이나 인덱스를 못 타는 조건만 걸러냅니다.
+    """
+    with engine.connect() as conn:
+        conn.exec_driver_sql("SET enable_seqscan = off")
+        row = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters or {}).scalar()
+        conn.exec_driver_sql("RESET enable_seqscan")
+    plan = row if isinstance(row, list) else json.loads(row)
+    return plan[0]["Plan"]
+
+
+@pytest.fixture(scope="module")
+def seeded(engine):
+    params = {
+        "teachers": TEACHERS,
+        "students_per_teacher": STUDENTS_PER_TEACHER,
+        "wordbooks_per_teacher": WORDBOOKS_PER_TEACHER,
+        "words_per_wordbook": WORDS_PER_WORDBOOK,
+        "attempts": ATTEMPTS_PER_ASSIGNMENT,
+    }
+    truncate_all(engine)
+    clear_caches()
+    with engine.begin() as conn:
+        for statement in SEED_SQL:
+            conn.execute(text(statement), params)
+        for table in ("users", "wordbooks", "words", "tests", "test_results"):
+            conn.execute(text(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), (SELECT max(id) FROM {table}))"))
+
+    db = database.SessionLocal()
+    crud.rebuild_score_rollups(db, batch_size=1000)
+    teacher_id = 1
+    student_id = TEACHERS + TEACHERS + 1  # 1번 반의 두 번째 학생
+    wordbook_id = db.scalar(
+        text("SELECT wordbook_id FROM student_wordbook_association WHERE student_id = :id ORDER BY wordbook_id LIMIT 1"),
+        {"id": student_id},
+    )
+    quiz_meta = crud.get_wordbook_quiz_meta(db, wordbook_id=wordbook_id, user_id=student_id)
+    exam = crud.create_exam_session(
+        db, wordbook_id=wordbook_id, title="exam", owner_id=teacher_id, shuffle_questions=True,
+        version=(quiz_meta.word_count, quiz_meta.max_word_id),
+    )
+    db.close()
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+    clear_caches()
+    return {
+        "teacher_id": teacher_id,
+        "student_id": student_id,
+        "wordbook_id": wordbook_id,
+        "test_id": exam.test_id,
+        "session_id": exam.id,
+        "version": (quiz_meta.word_count, quiz_meta.max_word_id),
+        # 다른 검사에 쓰지 않는 마지막 단어장은 삭제 경로 검사에 씁니다.
+        "spare_wordbook_id": TEACHERS * WORDBOOKS_PER_TEACHER,
+    }
+
+
+def _graded_submission(db, data):
+    words = crud.get_words_for_quiz(db, data["wordbook_id"])[:5]
+    outcomes = [
+        grading.Outcome(question_id=i, word_id=word.id, is_correct=i % 2 == 0, given_answer="x", correct_answer=word.text)
+        for i, word in enumerate(words)
+    ]
+    crud.create_graded_test_result(db, test_id=data["test_id"], student_id=data["student_id"], outcomes=outcomes)
+
+
+def _bump_wordbook_versions(db, data):
+    crud.bump_wordbook_versions(db, data["wordbook_id"])
+    db.rollback()
+
+
+HOT_PATHS = {
+    "wordbook_summaries": lambda db, d: crud.get_wordbook_summaries_for_student(db, student_id=d["student_id"]),
+    "wordbook_quiz_meta": lambda db, d: crud.get_wordbook_quiz_meta(db, wordbook_id=d["wordbook_id"], user_id=d["student_id"]),
+    "quiz_bank": lambda db, d: crud.get_quiz_bank(db, wordbook_id=d["wordbook_id"], version=d["version"]),
+    "wordbook_version_meta": lambda db, d: crud.get_wordbook_version_meta(db, wordbook_id=d["wordbook_id"], user_id=d["student_id"]),
+    "test_for_submission": lambda db, d: crud.get_test_for_submission(db, test_id=d["test_id"], user_id=d["student_id"]),
+    "create_graded_test_result": _graded_submission,
+    "student_report": lambda db, d: crud.get_student_report(db, student_id=d["student_id"], limit=20),
+    "student_stats": lambda db, d: crud.get_student_stats(db, student_id=d["student_id"]),
+    "student_stats_range": lambda db, d: crud.get_student_stats(
+        db, student_id=d["student_id"], date_from=date.today() - timedelta(days=30), date_to=date.today(), bucket="week"
+    ),
+    "class_report": lambda db, d: crud.get_class_report(db, teacher_id=d["teacher_id"]),
+    "due_words": lambda db, d: crud.get_due_words(db, student_id=d["student_id"]),
+    "exam_session_access": lambda db, d: crud.get_exam_session_access(db, session_id=d["session_id"], user_id=d["student_id"]),
+    "wordbook_leaderboard": lambda db, d: crud.get_leaderboard(db, "wordbook", d["wordbook_id"], "average", 10),
+    "class_leaderboard": lambda db, d: crud.get_leaderboard(db, "class", d["teacher_id"], "best", 10),
+    "class_membership": lambda db, d: crud.is_in_teacher_class(db, teacher_id=d["teacher_id"], student_id=d["student_id"]),
+    "test_result_export": lambda db, d: list(
+        crud.iter_test_result_exports(db, teacher_id=d["teacher_id"], wordbook_id=d["wordbook_id"])
+    ),
+    "bump_wordbook_versions": _bump_wordbook_versions,
+    "purge_wordbook": lambda db, d: crud.purge_wordbook(db, d["spare_wordbook_id"]),
+}
+
+
+@pytest.mark.parametrize("name", list(HOT_PATHS))
+def test_hot_path_uses_indexes(seeded, engine, name):
+    db = database.SessionLocal()
+    try:
+        with captured_statements(engine) as statements:
+            HOT_PATHS[name](db, seeded)
+    finally:
+        db.close()
+
+    explained = 0
+    for statement, parameters in statements:
+        if not statement.lstrip().upper().startswith(("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")):
+            continue
+        plan = explain(engine, statement, parameters)
+        explained += 1
+        scanned = sorted(set(seq_scans(plan)) & GUARDED_TABLES)
+        assert not scanned, f"{name}: Seq Scan on {scanned}\n{statement}"
+    assert explained, f"{name}: no statements were captured"
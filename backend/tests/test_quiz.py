@@ -0,0 +1,36 @@
+# backend/tests/test_quiz.py
+"""객관식 오답 후보에서 정답과, 정답으로 인정하는 같은 철자의 다른 뜻(homonym)이 빠지는지 확인합니다."""
+import random
+
+from app.quiz import PartOfSpeechDistractorIndex, QuizBank
+
+TEXTS = ["bank", "bank", "river", "money", "tree", "stone", "cloud", "bird"]
+MEANINGS = ["은행", "둑", "강", "돈", "나무", "돌", "구름", "새"]
+PARTS_OF_SPEECH = ["n", "n", "n", "n", "n", "n", "n", "n"]
+
+
+def test_part_of_speech_sample_honors_exclude_in_bucket_and_fallback():
+    index = PartOfSpeechDistractorIndex(["은행", "둑", "강", "달리다", "먹다"], ["n", "n", "n", "v", "v"])
+
+    for seed in range(50):
+        # 명사 후보(강)가 모자라 전체 후보에서 채울 때도 "둑"은 나오지 않아야 합니다.
+        chosen = index.sample("은행", "noun", k=3, rng=random.Random(seed), exclude=("은행", "둑"))
+        assert "둑" not in chosen and "은행" not in chosen
+        assert len(chosen) == len(set(chosen)) == 3
+
+
+def test_multiple_choice_never_offers_another_accepted_meaning():
+    bank = QuizBank(TEXTS, MEANINGS, parts_of_speech=PARTS_OF_SPEECH)
+    asked = 0
+
+    for seed in range(200):
+        questions, answer_key = bank.generate_paper(rng=random.Random(seed))
+        for question, key in zip(questions, answer_key):
+            if question.type != "multiple_choice":
+                continue
+            # 보기 중 정답으로 인정되는 것은 대표 정답 하나뿐이어야 합니다.
+            assert [choice for choice in question.choices if choice in key["answers"]] == [key["answer"]]
+            if "'bank'" in question.question:
+                asked += 1
+                assert sorted(key["answers"]) == ["둑", "은행"]
+    assert asked
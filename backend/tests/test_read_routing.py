@@ -0,0 +1,165 @@
+# backend/tests/test_read_routing.py
+"""
+읽기 전용 엔드포인트가 복제본으로 가고, 방금 쓰기를 한 사용자만 잠시 기본 DB에서 읽는지(read-your-writes) 확인합니다.
+복제본을 설정하지 않은 경우에는 모든 읽기가 기본 DB로 가야 합니다.
+"""
+from contextlib import contextmanager
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app import api_async, crud, database, schemas
+from conftest import DatabasePair, auth_headers, create_user
+
+# 단어장 목록 요약 쿼리에만 나오는 테이블 이름으로 어느 엔진에서 실행됐는지 구분합니다.
+LIST_QUERY_MARKER = "student_wordbook_association"
+
+
+@contextmanager
+def routed_queries(pair, marker: str = LIST_QUERY_MARKER):
+    """marker가 들어간 SQL을 실행한 엔진 이름("primary"/"replica")을 순서대로 모읍니다."""
+    seen = []
+    engines = {"primary": pair.primary}
+    if pair.replica is not pair.primary:
+        engines["replica"] = pair.replica
+    listeners = []
+    for name, engine in engines.items():
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany, name=name):
+            if marker in statement:
+                seen.append(name)
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        listeners.append((engine, before_cursor_execute))
+    try:
+        yield seen
+    finally:
+        for engine, listener in listeners:
+            event.remove(engine, "before_cursor_execute", listener)
+
+
+def expected_read_engine(pair) -> str:
+    return "primary" if pair.replica is pair.primary else "replica"
+
+
+@pytest.fixture
+def classroom(db):
+    teacher = create_user(db, "teacher", role="teacher")
+    student = create_user(db, "student")
+    other = create_user(db, "other")
+    wordbook = crud.create_wordbook_for_students(
+        db,
+        schemas.WordbookUpload(
+            title="wordbook",
+            words=[schemas.WordCreate(text="apple", meaning="사과")],
+            student_ids=[student.id, other.id],
+        ),
+        teacher_id=teacher.id,
+    )
+    database.recent_writers._until.clear()
+    return student, other, wordbook
+
+
+def start_quiz(client, headers, wordbook_id):
+    """퀴즈 시작(시험 기록 생성)은 쓰기 요청이므로 보낸 사용자를 최근 쓰기 사용자로 기록합니다."""
+    response = client.post(f"/api/wordbooks/{wordbook_id}/quiz-sessions", headers=headers)
+    assert response.status_code == 201, response.text
+
+
+def read_wordbook_list(client, headers):
+    response = client.get("/api/wordbooks/", headers=headers)
+    assert response.status_code == 200, response.text
+
+
+def test_reads_go_to_replica(database_pair, client, classroom):
+    headers = auth_headers(client, "student")
+
+    with routed_queries(database_pair) as seen:
+        read_wordbook_list(client, headers)
+
+    assert seen == [expected_read_engine(database_pair)]
+
+
+def test_recent_writer_reads_from_primary(database_pair, client, classroom):
+    _, _, wordbook = classroom
+    headers = auth_headers(client, "student")
+    start_quiz(client, headers, wordbook.id)
+
+    with routed_queries(database_pair) as seen:
+        read_wordbook_list(client, headers)
+
+    assert seen == ["primary"]
+
+
+def test_read_your_writes_is_per_user(database_pair, client, classroom):
+    _, _, wordbook = classroom
+    start_quiz(client, auth_headers(client, "student"), wordbook.id)
+
+    with routed_queries(database_pair) as seen:
+        read_wordbook_list(client, auth_headers(client, "other"))
+
+    assert seen == [expected_read_engine(database_pair)]
+
+
+def test_read_your_writes_window_expires(database_pair, client, classroom, monkeypatch):
+    _, _, wordbook = classroom
+    monkeypatch.setattr(database.recent_writers, "window_seconds", 0)
+    headers = auth_headers(client, "student")
+    start_quiz(client, headers, wordbook.id)
+
+    with routed_queries(database_pair) as seen:
+        read_wordbook_list(client, headers)
+
+    assert seen == [expected_read_engine(database_pair)]
+
+
+def create_async_engine_like(engine):
+    # 테스트마다 이벤트 루프가 달라지므로 연결을 재사용하지 않습니다.
+    url = database.to_async_database_url(engine.url.render_as_string(hide_password=False))
+    return create_async_engine(url, poolclass=NullPool)
+
+
+@pytest.fixture
+def async_database_pair(database_pair, monkeypatch):
+    """
+    DB_ASYNC_MODE에서 database 모듈이 만드는 async 엔진/세션을 database_pair와 같은 구성으로 바꿔 끼우고,
+    async 엔드포인트만 등록한 앱을 만듭니다. 반환하는 DatabasePair는 쿼리를 엿볼 동기 엔진입니다.
+    """
+    primary = create_async_engine_like(database_pair.primary)
+    if database_pair.replica is database_pair.primary:
+        replica = primary
+    else:
+        replica = create_async_engine_like(database_pair.replica)
+    options = {"class_": AsyncSession, "autoflush": False, "expire_on_commit": False}
+    monkeypatch.setattr(database, "async_engine", primary)
+    monkeypatch.setattr(database, "AsyncSessionLocal", async_sessionmaker(primary, **options))
+    monkeypatch.setattr(database, "async_read_engine", replica)
+    monkeypatch.setattr(database, "AsyncReadSessionLocal", async_sessionmaker(replica, **options))
+    app = FastAPI()
+    app.include_router(api_async.router)
+    with TestClient(app) as async_client:
+        yield async_client, DatabasePair(primary.sync_engine, replica.sync_engine)
+
+
+def test_async_reads_go_to_replica(async_database_pair, client, classroom):
+    async_client, pair = async_database_pair
+    headers = auth_headers(client, "student")
+
+    with routed_queries(pair) as seen:
+        read_wordbook_list(async_client, headers)
+
+    assert seen == [expected_read_engine(pair)]
+
+
+def test_async_recent_writer_reads_from_primary(async_database_pair, client, classroom):
+    async_client, pair = async_database_pair
+    _, _, wordbook = classroom
+    headers = auth_headers(client, "student")
+    start_quiz(client, headers, wordbook.id)
+
+    with routed_queries(pair) as seen:
+        read_wordbook_list(async_client, headers)
+
+    assert seen == ["primary"]
@@ -0,0 +1,77 @@
+# backend/tests/test_srs.py
+"""간격 반복(SM-2) 스케줄러가 정답/오답마다 ease와 간격을 SM-2 규칙대로 바꾸는지 확인합니다."""
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from app import srs
+
+
+def test_first_correct_review_starts_at_one_day():
+    state = srs.review(None, is_correct=True)
+
+    assert state.interval_days == 1.0
+    assert state.repetitions == 1
+    assert state.lapses == 0
+    # 품질 4는 ease를 바꾸지 않습니다 (0.1 - 1 × (0.08 + 0.02) = 0).
+    assert state.ease == pytest.approx(srs.DEFAULT_EASE)
+
+
+def test_correct_reviews_follow_sm2_intervals():
+    state = None
+    intervals = []
+    for _ in range(4):
+        state = srs.review(state, is_correct=True)
+        intervals.append(state.interval_days)
+
+    # 1일, 6일, 그다음부터는 직전 간격 × ease
+    assert intervals == pytest.approx([1.0, 6.0, 15.0, 37.5])
+    assert state.repetitions == 4
+
+
+def test_incorrect_review_resets_and_lowers_ease():
+    state = srs.MemoryState(ease=2.5, interval_days=15.0, repetitions=3, lapses=0)
+
+    state = srs.review(state, is_correct=False)
+
+    assert state.interval_days == 1.0
+    assert state.repetitions == 0
+    assert state.lapses == 1
+    # 품질 1: 0.1 - 4 × (0.08 + 4 × 0.02) = -0.54
+    assert state.ease == pytest.approx(1.96)
+    # 다시 맞히면 처음부터 1일, 6일로 시작합니다.
+    assert srs.review(state, is_correct=True).interval_days == 1.0
+
+
+def test_ease_never_drops_below_minimum():
+    state = None
+    for _ in range(10):
+        state = srs.review(state, is_correct=False)
+
+    assert state.ease == srs.MIN_EASE
+    assert state.lapses == 10
+
+
+def test_scheduled_days_applies_modifier_and_cap():
+    assert srs.scheduled_days(10.0, modifier=1.5, max_days=365.0) == 15.0
+    assert srs.scheduled_days(400.0, modifier=1.0, max_days=365.0) == 365.0
+
+
+def test_due_at_adds_scheduled_days():
+    reviewed_at = datetime(2026, 10, 1, 9, 0, tzinfo=timezone.utc)
+
+    assert srs.due_at(reviewed_at, 6.0) == reviewed_at + timedelta(days=srs.scheduled_days(6.0))
+
+
+def test_recompute_due_at_matches_scalar_schedule():
+    reviewed_at = datetime(2026, 10, 1, 9, 0, tzinfo=timezone.utc)
+    intervals = [1.0, 6.0, 500.0]
+
+    due = srs.recompute_due_at([reviewed_at.timestamp()] * 3, intervals, modifier=2.0, max_days=365.0)
+
+    expected = [
+        reviewed_at.timestamp() + srs.scheduled_days(days, modifier=2.0, max_days=365.0) * srs.SECONDS_PER_DAY
+        for days in intervals
+    ]
+    np.testing.assert_allclose(due, expected)
@@ -0,0 +1,51 @@
+# backend/tests/test_stats.py
+"""학습 통계 그래프의 구간 합치기(downsample_scores)가 점 개수를 줄이면서 결과 수 가중 평균을 지키는지 확인합니다."""
+from datetime import date, timedelta
+
+import pytest
+
+from app import schemas
+from app.crud import downsample_scores
+
+START = date(2026, 10, 1)
+
+
+def daily(scores_and_counts):
+    return [
+        schemas.DailyScore(date=START + timedelta(days=i), score=score, result_count=count)
+        for i, (score, count) in enumerate(scores_and_counts)
+    ]
+
+
+def weighted_average(points):
+    return sum(p.score * p.result_count for p in points) / sum(p.result_count for p in points)
+
+
+@pytest.mark.parametrize("max_points", [0, 5, 10])
+def test_short_series_is_returned_unchanged(max_points):
+    scores = daily([(50, 1)] * 5)
+
+    assert downsample_scores(scores, max_points) is scores
+
+
+def test_groups_use_first_date_and_weighted_score():
+    scores = daily([(100, 1), (40, 3), (70, 2), (90, 2)])
+
+    points = downsample_scores(scores, 2)
+
+    assert [(p.date, p.score, p.result_count) for p in points] == [
+        (START, 55.0, 4),
+        (START + timedelta(days=2), 80.0, 4),
+    ]
+
+
+@pytest.mark.parametrize("length, max_points", [(7, 3), (100, 7), (365, 120), (121, 120)])
+def test_never_exceeds_max_points_and_keeps_totals(length, max_points):
+    scores = daily([((i * 37) % 101, i % 4 + 1) for i in range(length)])
+
+    points = downsample_scores(scores, max_points)
+
+    assert len(points) <= max_points
+    assert [p.date for p in points] == sorted(p.date for p in points)
+    assert sum(p.result_count for p in points) == sum(p.result_count for p in scores)
+    assert weighted_average(points) == pytest.approx(weighted_average(scores))
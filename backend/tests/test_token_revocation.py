@@ -0,0 +1,67 @@
+# backend/tests/test_token_revocation.py
+"""
+비밀번호 변경/사용자 삭제로 폐기된 토큰이 다른 워커에서도 거부되는지 확인합니다.
+다른 워커는 이 프로세스의 principal_cache 폐기 기록을 모르므로, 폐기는 DB만 바꾸고 캐시는 비운 상태로 흉내 냅니다.
+"""
+from sqlalchemy import text
+
+from app import cache, crud, security
+from conftest import auth_headers, create_user
+
+ME_URL = "/api/users/me/"
+
+
+def revoke_in_other_worker(db, user_id: int) -> None:
+    """다른 워커가 비밀번호를 바꾼 것처럼 DB의 token_version만 올립니다."""
+    db.execute(text("UPDATE users SET token_version = token_version + 1 WHERE id = :id"), {"id": user_id})
+    db.commit()
+
+
+def test_token_from_other_worker_revocation_is_rejected_on_cache_miss(db, client):
+    student = create_user(db, "student")
+    headers = auth_headers(client, "student")
+    assert client.get(ME_URL, headers=headers).status_code == 200
+
+    revoke_in_other_worker(db, student.id)
+    # 이 워커가 처음 보는 토큰(캐시 미스)이면 DB의 token_version과 비교해 거부합니다.
+    cache.principal_cache.clear()
+
+    assert client.get(ME_URL, headers=headers).status_code == 401
+
+
+def test_cached_principal_expires_after_ttl(db, client, monkeypatch):
+    student = create_user(db, "student")
+    headers = auth_headers(client, "student")
+    assert client.get(ME_URL, headers=headers).status_code == 200
+
+    revoke_in_other_worker(db, student.id)
+    # 캐시 적중은 DB를 보지 않으므로 TTL 동안은 통과합니다 (PrincipalCache 문서의 트레이드오프).
+    assert client.get(ME_URL, headers=headers).status_code == 200
+    monkeypatch.setattr(cache.principal_cache, "ttl_seconds", 0)
+    cache.principal_cache.clear()
+
+    assert client.get(ME_URL, headers=headers).status_code == 401
+
+
+def test_password_change_bumps_token_version(db, client):
+    student = create_user(db, "student")
+    old_headers = auth_headers(client, "student")
+    assert crud.get_user_token_version(db, student.id) == 1
+
+    crud.update_user_password(db, student.id, security.get_password_hash("new-password"))
+
+    assert crud.get_user_token_version(db, student.id) == 2
+    assert client.get(ME_URL, headers=old_headers).status_code == 401
+    response = client.post("/api/token", data={"username": "student", "password": "new-password"})
+    new_headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    assert client.get(ME_URL, headers=new_headers).status_code == 200
+
+
+def test_deleted_user_token_is_rejected_on_cache_miss(db, client):
+    student = create_user(db, "student")
+    headers = auth_headers(client, "student")
+    db.execute(text("DELETE FROM users WHERE id = :id"), {"id": student.id})
+    db.commit()
+    cache.principal_cache.clear()
+
+    assert client.get(ME_URL, headers=headers).status_code == 401
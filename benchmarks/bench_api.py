@@ -0,0 +1,113 @@
+"""
+동기 모드와 비동기(DB_ASYNC_MODE) 모드의 API 처리량/지연 시간을 비교하는 벤치마크입니다.
+
+각 모드로 uvicorn 서버를 띄운 뒤 같은 부하를 걸고 requests/sec, p50, p99를 출력합니다.
+backend/.env의 DATABASE_URL을 사용하며, 학생 계정이 미리 있어야 합니다.
+
+    python benchmarks/bench_api.py --username student1 --password 1234 \
+        --concurrency 50 --duration 15
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend")
+ENDPOINTS = ["/api/wordbooks/", "/api/students/me/stats"]
+
+
+def start_server(async_mode: bool, port: int) -> subprocess.Popen:
+    env = dict(os.environ, DB_ASYNC_MODE="true" if async_mode else "false")
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+        env=env,
+    )
+
+
+async def wait_until_ready(client: httpx.AsyncClient, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if (await client.get("/health")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("서버가 시작되지 않았습니다.")
+
+
+async def run_load(client: httpx.AsyncClient, path: str, headers: dict, concurrency: int, duration: float) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    deadline = time.monotonic() + duration
+
+    async def worker():
+        nonlocal errors
+        while time.monotonic() < deadline:
+            started = time.perf_counter()
+            response = await client.get(path, headers=headers)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code != 200:
+                errors += 1
+
+    started = time.monotonic()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.monotonic() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+    }
+
+
+async def bench_mode(async_mode: bool, args) -> dict:
+    server = start_server(async_mode, args.port)
+    try:
+        limits = httpx.Limits(max_connections=args.concurrency)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{args.port}", limits=limits, timeout=30) as client:
+            await wait_until_ready(client)
+            token_response = await client.post(
+                "/api/token", data={"username": args.username, "password": args.password}
+            )
+            token_response.raise_for_status()
+            headers = {"Authorization": f"Bearer {token_response.json()['access_token']}"}
+
+            results = {}
+            for path in ENDPOINTS:
+                # 워밍업 후 측정합니다.
+                await run_load(client, path, headers, args.concurrency, min(2.0, args.duration))
+                results[path] = await run_load(client, path, headers, args.concurrency, args.duration)
+            return results
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--username", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=15.0)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    print(f"{'mode':<6} {'endpoint':<26} {'req/s':>9} {'p50(ms)':>9} {'p99(ms)':>9} {'errors':>7}")
+    for async_mode in (False, True):
+        mode = "async" if async_mode else "sync"
+        for path, r in asyncio.run(bench_mode(async_mode, args)).items():
+            print(f"{mode:<6} {path:<26} {r['rps']:>9.1f} {r['p50_ms']:>9.1f} {r['p99_ms']:>9.1f} {r['errors']:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+퀴즈 생성(generate_quiz)의 단어장 크기별 소요 시간을 측정하는 마이크로 벤치마크입니다.
+
+문제마다 오답 후보 리스트를 새로 만들던 이전 방식(naive), 전체 뜻에서 뽑는 DistractorIndex,
+품사별로 나눈 PartOfSpeechDistractorIndex를 같은 단어 목록으로 비교합니다.
+인덱스 열은 인덱스 생성 시간을 포함합니다. DB 없이 메모리 안에서만 실행됩니다.
+
+    python benchmarks/bench_quiz.py --sizes 10 100 1000 5000 10000 50000 --repeat 5
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend"))
+
+from app.quiz import DistractorIndex, PartOfSpeechDistractorIndex, generate_quiz  # noqa: E402
+
+DEFAULT_SIZES = [10, 100, 1000, 5000, 10000, 50000]
+# 품사가 없는 단어도 섞어 전체 풀로 대체하는 경로까지 측정합니다.
+PARTS_OF_SPEECH = ["noun", "verb", "adjective", "adverb", "noun", "verb", None]
+
+
+def make_words(size: int, duplicate_ratio: float) -> list:
+    # duplicate_ratio 비율만큼 뜻이 겹치도록 만들어 중복 처리 비용도 함께 측정합니다.
+    distinct = max(1, int(size * (1 - duplicate_ratio)))
+    return [
+        SimpleNamespace(
+            text=f"word{i}",
+            meaning=f"meaning{i % distinct}",
+            part_of_speech=PARTS_OF_SPEECH[i % len(PARTS_OF_SPEECH)],
+        )
+        for i in range(size)
+    ]
+
+
+def naive_distractors(words: list, rng: random.Random) -> None:
+    all_meanings = [w.meaning for w in words]
+    for word in rng.sample(words, max(1, len(words) // 2)):
+        if len(words) >= 4 and rng.random() > 0.5:
+            pool = [m for m in all_meanings if m != word.meaning]
+            rng.sample(pool, min(3, len(pool)))
+
+
+def indexed_distractors(words: list, rng: random.Random) -> None:
+    index = DistractorIndex(w.meaning for w in words)
+    for word in rng.sample(words, max(1, len(words) // 2)):
+        if len(words) >= 4 and rng.random() > 0.5:
+            index.sample(word.meaning, rng=rng)
+
+
+def pos_indexed_distractors(words: list, rng: random.Random) -> None:
+    index = PartOfSpeechDistractorIndex([w.meaning for w in words], [w.part_of_speech for w in words])
+    for word in rng.sample(words, max(1, len(words) // 2)):
+        if len(words) >= 4 and rng.random() > 0.5:
+            index.sample(word.meaning, word.part_of_speech, rng=rng)
+
+
+def best_of(fn, words: list, repeat: int) -> float:
+    timings = []
+    for seed in range(repeat):
+        rng = random.Random(seed)
+        started = time.perf_counter()
+        fn(words, rng)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--duplicate-ratio", type=float, default=0.1)
+    parser.add_argument("--naive-max", type=int, default=10000,
+                        help="이 크기보다 큰 단어장은 이전 방식 측정을 건너뜁니다 (O(n²)).")
+    args = parser.parse_args()
+
+    print(f"{'words':>7} {'naive(ms)':>11} {'index(ms)':>11} {'pos-index(ms)':>14} {'speedup':>9} {'generate_quiz(ms)':>18}")
+    for size in args.sizes:
+        words = make_words(size, args.duplicate_ratio)
+        indexed = best_of(indexed_distractors, words, args.repeat)
+        pos_indexed = best_of(pos_indexed_distractors, words, args.repeat)
+        full = best_of(lambda w, rng: generate_quiz(w, rng=rng), words, args.repeat)
+        if size <= args.naive_max:
+            naive = best_of(naive_distractors, words, args.repeat)
+            naive_col, speedup_col = f"{naive * 1000:>11.2f}", f"{naive / indexed:>8.1f}x"
+        else:
+            naive_col, speedup_col = f"{'-':>11}", f"{'-':>9}"
+        print(f"{size:>7} {naive_col} {indexed * 1000:>11.2f} {pos_indexed * 1000:>14.2f} {speedup_col} {full * 1000:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
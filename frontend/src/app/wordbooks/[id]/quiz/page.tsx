@@ -4,16 +4,17 @@
 import React, { useState, useMemo, useEffect } from 'react';
 import { useParams, useRouter } from 'next/navigation';
 import { useAuth } from '@/contexts/AuthContext';
-import { CheckCircle, XCircle, RefreshCw, ArrowRight, Loader2, BrainCircuit, BookText, LogOut } from 'lucide-react';
+import { CheckCircle, XCircle, RefreshCw, Loader2, BrainCircuit, BookText, LogOut } from 'lucide-react';
 import { cva } from 'class-variance-authority';
 import Link from 'next/link';
 
 
 // --- 타입 정의 ---
+// 정답은 서버에만 있으므로 문제에는 포함되지 않습니다. 채점은 답안 제출 후 서버에서 합니다.
 interface BaseQuestion {
+  id?: number;
   type: string;
   question: string;
-  answer: string;
 }
 interface MultipleChoiceQuestion extends BaseQuestion {
   type: 'multiple_choice';
@@ -31,6 +32,31 @@ interface Test {
     wordbook_id: number;
 }
 
+// 퀴즈 세션 응답: 생성된 시험 기록과 문제 목록
+interface QuizSession {
+    test: Test;
+    questions: QuizQuestion[];
+}
+
+// 서버 채점용 답안과 채점 결과
+interface SubmittedAnswer {
+    question_id: number;
+    answer: string;
+}
+interface QuestionOutcome {
+    question_id: number;
+    is_correct: boolean;
+    given_answer: string | null;
+    correct_answer: string;
+}
+interface GradedTestResult {
+    id: number;
+    score: number;
+    correct_count: number;
+    question_count: number;
+    outcomes: QuestionOutcome[];
+}
+
 
 // --- 각 퀴즈 유형별 컴포넌트 ---
 
@@ -41,8 +67,6 @@ const choiceButtonVariants = cva(
       state: {
         default: "bg-slate-700/50 hover:bg-slate-600/80 border-slate-600 text-slate-100",
         selected: "bg-sky-500/40 border-sky-400 text-white ring-2 ring-sky-400",
-        correct: "bg-green-500/30 border-green-400 text-white",
-        incorrect: "bg-red-500/30 border-red-400 text-white",
         disabled: "bg-slate-700/50 border-slate-600 text-slate-300"
       }
     },
@@ -52,7 +76,7 @@ const choiceButtonVariants = cva(
   }
 );
 
-const MultipleChoiceComponent = ({ question, onSubmit, isParentSubmitted }: { question: MultipleChoiceQuestion; onSubmit: (isCorrect: boolean) => void; isParentSubmitted: boolean; }) => {
+const MultipleChoiceComponent = ({ question, onSubmit }: { question: MultipleChoiceQuestion; onSubmit: (answer: string) => void; }) => {
   const [selectedAnswer, setSelectedAnswer] = useState<string | null>(null);
 
   useEffect(() => {
@@ -61,15 +85,10 @@ const MultipleChoiceComponent = ({ question, onSubmit, isParentSubmitted }: { qu
 
   const handleSubmit = () => {
     if (!selectedAnswer) return;
-    onSubmit(selectedAnswer === question.answer);
+    onSubmit(selectedAnswer);
   };
 
   const getButtonState = (choice: string) => {
-    if (isParentSubmitted) {
-      if (choice === question.answer) return 'correct';
-      if (choice === selectedAnswer) return 'incorrect';
-      return 'disabled';
-    }
     if (choice === selectedAnswer) return 'selected';
     return 'default';
   };
@@ -81,26 +100,23 @@ const MultipleChoiceComponent = ({ question, onSubmit, isParentSubmitted }: { qu
         {question.choices.map((choice, index) => (
           <button
             key={index}
-            onClick={() => !isParentSubmitted && setSelectedAnswer(choice)}
-            disabled={isParentSubmitted}
+            onClick={() => setSelectedAnswer(choice)}
             className={choiceButtonVariants({ state: getButtonState(choice) })}
           >
             {choice}
           </button>
         ))}
       </div>
-      {!isParentSubmitted && (
-        <div className="mt-8 flex justify-center">
-          <button onClick={handleSubmit} disabled={!selectedAnswer} className="w-full max-w-xs bg-sky-600 text-white font-bold py-3 px-4 rounded-lg hover:bg-sky-500 transition-colors duration-300 disabled:bg-slate-700 disabled:text-slate-400 disabled:cursor-not-allowed">
-            확인
-          </button>
-        </div>
-      )}
+      <div className="mt-8 flex justify-center">
+        <button onClick={handleSubmit} disabled={!selectedAnswer} className="w-full max-w-xs bg-sky-600 text-white font-bold py-3 px-4 rounded-lg hover:bg-sky-500 transition-colors duration-300 disabled:bg-slate-700 disabled:text-slate-400 disabled:cursor-not-allowed">
+          확인
+        </button>
+      </div>
     </div>
   );
 };
 
-const WrittenComponent = ({ question, onSubmit, isParentSubmitted }: { question: WrittenQuestion; onSubmit: (isCorrect: boolean) => void; isParentSubmitted: boolean; }) => {
+const WrittenComponent = ({ question, onSubmit }: { question: WrittenQuestion; onSubmit: (answer: string) => void; }) => {
   const [userAnswer, setUserAnswer] = useState('');
 
   useEffect(() => {
@@ -115,7 +131,7 @@ const WrittenComponent = ({ question, onSubmit, isParentSubmitted }: { question:
   const handleSubmit = (e: React.FormEvent<HTMLFormElement>) => {
     e.preventDefault();
     if (!userAnswer.trim()) return;
-    onSubmit(userAnswer.trim().toLowerCase() === question.answer.toLowerCase());
+    onSubmit(userAnswer.trim());
   };
 
   return (
@@ -132,53 +148,44 @@ const WrittenComponent = ({ question, onSubmit, isParentSubmitted }: { question:
           value={userAnswer}
           onChange={(e) => setUserAnswer(e.target.value)}
           placeholder="정답을 입력하세요"
-          disabled={isParentSubmitted}
-          className="w-full text-center text-2xl p-4 bg-slate-700/50 border-2 border-slate-600 rounded-lg text-white placeholder:text-slate-400 focus:outline-none focus:ring-2 focus:ring-sky-500 transition disabled:bg-slate-800"
+          className="w-full text-center text-2xl p-4 bg-slate-700/50 border-2 border-slate-600 rounded-lg text-white placeholder:text-slate-400 focus:outline-none focus:ring-2 focus:ring-sky-500 transition"
           autoFocus
         />
-        {!isParentSubmitted && (
-          <button type="submit" disabled={!userAnswer.trim()} className="mt-6 w-full bg-sky-600 text-white font-bold py-3 px-4 rounded-lg hover:bg-sky-500 transition-colors duration-300 disabled:bg-slate-700 disabled:text-slate-400 disabled:cursor-not-allowed">
-            확인
-          </button>
-        )}
+        <button type="submit" disabled={!userAnswer.trim()} className="mt-6 w-full bg-sky-600 text-white font-bold py-3 px-4 rounded-lg hover:bg-sky-500 transition-colors duration-300 disabled:bg-slate-700 disabled:text-slate-400 disabled:cursor-not-allowed">
+          확인
+        </button>
       </form>
     </div>
   );
 };
 
-const QuizFeedback = ({
-  isCorrect,
-  correctAnswer,
-  onNext,
-  isLastQuestion
-}: {
-  isCorrect: boolean | null;
-  correctAnswer: string;
-  onNext: () => void;
-  isLastQuestion: boolean;
-}) => {
-  if (isCorrect === null) return null;
-
-  const isAnswerCorrect = isCorrect === true;
+// 서버 채점 결과의 문제별 정오표
+const QuizOutcomes = ({ questions, outcomes }: { questions: QuizQuestion[]; outcomes: QuestionOutcome[]; }) => {
+  const questionById = useMemo(
+    () => new Map(questions.map((question, index) => [question.id ?? index, question])),
+    [questions]
+  );
 
   return (
-    <div className="mt-8 w-full flex flex-col items-center gap-4">
-      <div className={`w-full max-w-md p-3 rounded-lg flex items-center justify-center gap-3 text-lg font-bold
-        ${isAnswerCorrect ? 'bg-green-500/20 text-green-300' : 'bg-red-500/20 text-red-300'}`}>
-        {isAnswerCorrect ? <CheckCircle size={24} /> : <XCircle size={24} />}
-        <div>
-          {isAnswerCorrect ? '정답입니다!' : '오답입니다. 정답: '}
-          {!isAnswerCorrect && <span className="font-bold text-white">{correctAnswer}</span>}
-        </div>
-      </div>
-      <button
-        onClick={onNext}
-        className="inline-flex items-center gap-2 bg-slate-700 text-white font-bold py-3 px-8 rounded-lg hover:bg-slate-600 transition-colors duration-300 transform hover:scale-105"
-      >
-        {isLastQuestion ? '결과 보기' : '다음 문제'}
-        <ArrowRight size={20} />
-      </button>
-    </div>
+    <ul className="mb-8 max-h-72 overflow-y-auto text-left space-y-2">
+      {outcomes.map((outcome) => (
+        <li key={outcome.question_id}
+          className={`p-3 rounded-lg flex items-start gap-3 ${outcome.is_correct ? 'bg-green-500/10' : 'bg-red-500/10'}`}>
+          {outcome.is_correct
+            ? <CheckCircle size={20} className="mt-0.5 shrink-0 text-green-400" />
+            : <XCircle size={20} className="mt-0.5 shrink-0 text-red-400" />}
+          <div className="text-sm">
+            <p className="text-slate-200">{questionById.get(outcome.question_id)?.question}</p>
+            <p className="text-slate-400">
+              내 답: <span className="text-slate-200">{outcome.given_answer || '-'}</span>
+              {!outcome.is_correct && (
+                <> · 정답: <span className="font-bold text-white">{outcome.correct_answer}</span></>
+              )}
+            </p>
+          </div>
+        </li>
+      ))}
+    </ul>
   );
 };
 
@@ -195,9 +202,6 @@ export default function QuizPage() {
   const [error, setError] = useState<string | null>(null);
 
   const [currentQuestionIndex, setCurrentQuestionIndex] = useState(0);
-  const [isSubmitted, setIsSubmitted] = useState(false);
-  const [lastAnswerCorrect, setLastAnswerCorrect] = useState<boolean | null>(null);
-  const [score, setScore] = useState(0);
   const [quizFinished, setQuizFinished] = useState(false);
   const [isExitModalOpen, setIsExitModalOpen] = useState(false);
 
@@ -205,6 +209,9 @@ export default function QuizPage() {
   const [testId, setTestId] = useState<number | null>(null);
   const [isSubmittingScore, setIsSubmittingScore] = useState(false);
   const [submissionError, setSubmissionError] = useState<string | null>(null);
+  // 서버 채점을 위해 문제별 답안을 모아 둡니다.
+  const [answers, setAnswers] = useState<SubmittedAnswer[]>([]);
+  const [gradedResult, setGradedResult] = useState<GradedTestResult | null>(null);
 
 
   // 퀴즈 시작 시 문제 로딩 및 Test 기록 생성
@@ -217,24 +224,17 @@ export default function QuizPage() {
       try {
         const API_BASE_URL = process.env.NEXT_PUBLIC_API_URL || 'http://127.0.0.1:8000';
         
-        // 1. 퀴즈를 시작하며 'Test' 기록 생성
-        const testResponse = await fetch(`${API_BASE_URL}/api/wordbooks/${wordbookId}/tests`, {
+        // 퀴즈 세션 시작: 'Test' 기록 생성과 문제 출제를 한 번의 요청으로 처리
+        const sessionResponse = await fetch(`${API_BASE_URL}/api/wordbooks/${wordbookId}/quiz-sessions`, {
             method: 'POST',
             headers: { 'Authorization': `Bearer ${token}` }
         });
-        if (!testResponse.ok) throw new Error('시험 기록 생성에 실패했습니다.');
-        const testData: Test = await testResponse.json();
-        setTestId(testData.id); // 생성된 시험 ID 저장
-
-        // 2. 퀴즈 문제 가져오기
-        const quizResponse = await fetch(`${API_BASE_URL}/api/wordbooks/${wordbookId}/quiz`, {
-          headers: { 'Authorization': `Bearer ${token}` }
-        });
-        if (!quizResponse.ok) throw new Error('퀴즈를 불러오는 데 실패했습니다.');
-        const quizData: QuizQuestion[] = await quizResponse.json();
-        if (quizData.length === 0) throw new Error('생성된 퀴즈가 없습니다. 단어장에 단어를 추가해주세요.');
+        if (sessionResponse.status === 400) throw new Error('생성된 퀴즈가 없습니다. 단어장에 단어를 추가해주세요.');
+        if (!sessionResponse.ok) throw new Error('퀴즈를 불러오는 데 실패했습니다.');
+        const sessionData: QuizSession = await sessionResponse.json();
+        setTestId(sessionData.test.id); // 생성된 시험 ID 저장
 
-        setQuestions(quizData);
+        setQuestions(sessionData.questions);
       } catch (err: any) {
         setError(err.message);
       } finally {
@@ -245,31 +245,28 @@ export default function QuizPage() {
     startQuiz();
   }, [wordbookId, token, isAuthLoading]);
 
-  // 퀴즈 종료 시 점수 자동 제출
+  // 퀴즈 종료 시 답안 자동 제출 (점수는 서버에서 채점)
   useEffect(() => {
     if (!quizFinished || !testId) return;
 
     const submitScore = async () => {
         setIsSubmittingScore(true);
         setSubmissionError(null);
-        const finalScore = questions.length > 0 ? (score / questions.length) * 100 : 0;
 
         try {
             const API_BASE_URL = process.env.NEXT_PUBLIC_API_URL || 'http://127.0.0.1:8000';
-            const response = await fetch(`${API_BASE_URL}/api/tests/results`, {
+            const response = await fetch(`${API_BASE_URL}/api/tests/${testId}/submissions`, {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
                     'Authorization': `Bearer ${token}`
                 },
-                body: JSON.stringify({
-                    score: finalScore,
-                    test_id: testId
-                })
+                body: JSON.stringify({ answers })
             });
             if (!response.ok) {
                 throw new Error('점수 기록에 실패했습니다.');
             }
+            setGradedResult(await response.json());
         } catch (err: any) {
             setSubmissionError(err.message);
         } finally {
@@ -278,22 +275,15 @@ export default function QuizPage() {
     };
 
     submitScore();
-  }, [quizFinished, testId, score, questions.length, token]);
-
+  }, [quizFinished, testId, answers, token]);
 
-  const handleSubmitAnswer = (isCorrect: boolean) => {
-    setIsSubmitted(true);
-    setLastAnswerCorrect(isCorrect);
-    if (isCorrect) {
-      setScore(prev => prev + 1);
-    }
-  };
 
-  const handleNextQuestion = () => {
+  // 정답 여부는 화면에서 판단하지 않고, 모든 답안을 모아 마지막에 서버 채점 결과로 보여줍니다.
+  const handleSubmitAnswer = (answer: string) => {
+    const question = questions[currentQuestionIndex];
+    setAnswers(prev => [...prev, { question_id: question.id ?? currentQuestionIndex, answer }]);
     if (currentQuestionIndex < questions.length - 1) {
       setCurrentQuestionIndex(prev => prev + 1);
-      setIsSubmitted(false);
-      setLastAnswerCorrect(null);
     } else {
       setQuizFinished(true);
     }
@@ -320,7 +310,8 @@ export default function QuizPage() {
   );
 
   const renderQuizFinished = () => {
-    const finalScore = questions.length > 0 ? (score / questions.length) * 100 : 0;
+    const correctCount = gradedResult?.correct_count ?? 0;
+    const finalScore = gradedResult?.score ?? 0;
     return (
       <div className="flex flex-col items-center justify-center min-h-screen p-4">
         <div className="w-full max-w-md p-8 text-center bg-slate-800/60 backdrop-blur-sm border border-slate-700 rounded-2xl shadow-2xl shadow-sky-900/20">
@@ -336,8 +327,9 @@ export default function QuizPage() {
             <div className="my-4 text-red-400 bg-red-900/30 p-3 rounded-lg">
                 <p>점수 기록 실패: {submissionError}</p>
             </div>
-          ) : (
-            <div className="mb-8">
+          ) : gradedResult && (
+            <>
+            <div className="mb-6">
                 <p className="text-xl font-medium text-slate-200">최종 점수</p>
                 <div className="flex items-baseline justify-center mt-2">
                 <p className={`text-7xl font-bold ${finalScore >= 80 ? 'text-sky-400' : 'text-amber-400'}`}>
@@ -346,9 +338,11 @@ export default function QuizPage() {
                 <span className="text-4xl text-slate-400 font-bold">점</span>
                 </div>
                 <p className="text-slate-400 mt-2">
-                {questions.length}문제 중 {score}개를 맞혔습니다.
+                {gradedResult.question_count}문제 중 {correctCount}개를 맞혔습니다.
                 </p>
             </div>
+            <QuizOutcomes questions={questions} outcomes={gradedResult.outcomes} />
+            </>
           )}
 
           <div className="flex flex-col gap-3">
@@ -392,9 +386,9 @@ export default function QuizPage() {
     if (!currentQuestion) return null; // 데이터가 아직 없을 때를 대비
     switch (currentQuestion.type) {
       case 'multiple_choice':
-        return <MultipleChoiceComponent question={currentQuestion} onSubmit={handleSubmitAnswer} isParentSubmitted={isSubmitted} />;
+        return <MultipleChoiceComponent question={currentQuestion} onSubmit={handleSubmitAnswer} />;
       case 'written':
-        return <WrittenComponent question={currentQuestion} onSubmit={handleSubmitAnswer} isParentSubmitted={isSubmitted} />;
+        return <WrittenComponent question={currentQuestion} onSubmit={handleSubmitAnswer} />;
       default:
         return <p className="text-red-400">알 수 없는 퀴즈 유형입니다.</p>;
     }
@@ -404,8 +398,6 @@ export default function QuizPage() {
   if (error) return renderError();
   if (questions.length === 0 && !loading) return <div className="text-center p-10 text-slate-400">퀴즈를 위한 단어가 부족합니다.</div>;
   if (quizFinished) return renderQuizFinished();
-  
-  const currentQuestion = questions[currentQuestionIndex];
 
   return (
     <div className="flex flex-col items-center justify-center min-h-screen bg-slate-900 p-4 selection:bg-sky-300/30">
@@ -433,15 +425,6 @@ export default function QuizPage() {
             <div className="w-full p-6 md:p-10 bg-slate-800/60 backdrop-blur-sm border border-slate-700 rounded-2xl shadow-2xl shadow-sky-900/20 min-h-[400px] flex items-center justify-center">
                 {renderQuestionComponent()}
             </div>
-
-            {isSubmitted && (
-                <QuizFeedback
-                    isCorrect={lastAnswerCorrect}
-                    correctAnswer={currentQuestion.answer}
-                    onNext={handleNextQuestion}
-                    isLastQuestion={currentQuestionIndex === questions.length - 1}
-                />
-            )}
         </div>
       </div>
     </div>